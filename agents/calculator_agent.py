@@ -1,9 +1,13 @@
+import os
+
 from langchain.agents import create_agent
 from langchain.tools import tool
 from langchain_openai import ChatOpenAI
 
+from agents.sub_agent import with_async_agent, with_response_cache
 from tools.calculator_tool import (
     calculate_math_expression,
+    calculate_math_expressions,
     get_current_datetime,
     sort_values_based_on_key,
     get_length_of_object,
@@ -14,16 +18,20 @@ from tools.calculator_tool import (
 SYSTEM_PROMPT = """
 당신은 수학적 계산이나 날짜와 시간을 등을 제공할 수 있는 계산 에이전트입니다.
 사용자가 요청한 수학 표현식을 정확하게 계산하거나 현재 날짜와 시간을 제공하세요.
+계산할 식이 여러 개이거나 같은 식을 여러 값에 적용해야 하면 calculate_math_expressions로 한 번에 계산하세요.
 유용하고 정확한 답변을 제공하세요.
 """.strip()
 ## tools
 TOOLS = [
     calculate_math_expression,
+    calculate_math_expressions,
     get_current_datetime,
     sort_values_based_on_key,
     get_length_of_object,
 ]
 TOOLS_DESCRIPTION = "\n".join([f"- {tool.name}: {tool.description}" for tool in TOOLS])
+## cache: 같은 질문의 응답을 재사용하는 시간(초). '오늘', '현재' 같은 시점 질의에 답하므로 기본값은 저장하지 않고 동시 중복 호출만 합친다.
+CACHE_TTL = float(os.getenv("CALCULATOR_AGENT_CACHE_TTL", "0"))
 ## agent
 AGENT_DESCRIPTION = f"""
 날짜와 수학(덧셈, 뺄셈, 나눗셈, 곱셈 등의 사칙연산) 등을 계산하는 에이전트를 호출하여 응답을 반환.
@@ -47,6 +55,8 @@ agent = create_agent(
 )
 
 
+@with_response_cache(ttl=CACHE_TTL)
+@with_async_agent(lambda: agent)
 @tool(description=AGENT_DESCRIPTION)
 def call_calculator_agent(input_text: str) -> dict:
     """
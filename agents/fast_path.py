@@ -0,0 +1,241 @@
+from datetime import datetime
+from typing import Annotated, Any, Dict, NotRequired, Optional, Tuple
+import logging
+import os
+import re
+import threading
+import time
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, hook_config
+from langchain.agents.middleware.types import PrivateStateAttr
+from langchain_core.messages import AIMessage, HumanMessage
+
+from tools.calculator_tool import calculate_math_expression, get_current_datetime
+
+logger = logging.getLogger(__name__)
+
+# 0이면 모든 질문을 마스터 에이전트(LLM)로 보낸다.
+MASTER_FAST_PATH = os.getenv("MASTER_FAST_PATH", "1") == "1"
+
+WEEKDAYS_KO = "월화수목금토일"
+
+# 산술식 앞뒤의 질문 표현. 이것을 떼어낸 나머지가 순수한 식이어야 빠른 경로로 처리한다.
+_ARITHMETIC_PREFIX = re.compile(r"^\s*(what\s+is|what's|whats|calculate|compute|계산(해\s*줘|해\s*주세요)?\s*:?)\s*", re.I)
+_ARITHMETIC_SUFFIX = re.compile(
+    r"\s*(=|\?|？|!|\.|은|는|이|가|의\s*값은?|결과는?|얼마(야|예요|에요|인가요|입니까|지|니|일까)?|"
+    r"뭐(야|예요)?|계산(해\s*줘|해\s*주세요|하면|해)?)\s*$",
+    re.I,
+)
+_KOREAN_OPERATORS = [("더하기", "+"), ("플러스", "+"), ("빼기", "-"), ("마이너스", "-"), ("곱하기", "*"), ("나누기", "/")]
+_PURE_EXPRESSION = re.compile(r"^[\d\s+\-*/().]+$")
+_HAS_OPERATION = re.compile(r"[\d)]\s*(\*\*|//|[+\-*/])\s*[\d(]")
+_DATE_LIKE = re.compile(r"^\s*\d{4}\s*[-/.]\s*\d{1,2}\s*[-/.]\s*\d{1,2}\s*$")
+
+# 한국어 날짜/시간 질문: 문장 전체(문장부호 제외)가 아래 형태 중 하나여야 한다.
+# 단어 단위로 어간을 맞추면 "일요일 무슨 일이야", "몇 시간이야"까지 걸리므로 문장 단위로 고정한다.
+_KO_END = r"(?:야|이야|예요|에요|이에요|인가요|입니까|이지|지|니|냐|이냐|죠|일까)"
+_KO_TELL = r"(?:좀\s*)?(?:알려|말해)\s*(?:줘|주세요|줄래)"
+_KO_TODAY = r"(?:(?:오늘|지금)\s*(?:은|이)?\s*)"
+_KO_NOW = r"(?:(?:지금|현재)\s*(?:은)?\s*)"
+_KO_WEEKDAY = re.compile(
+    rf"^(?:{_KO_TODAY}?(?:무슨|몇)\s*요일\s*{_KO_END}?|{_KO_TODAY}?요일\s*{_KO_TELL})$"
+)
+_KO_TIME = re.compile(
+    rf"^(?:{_KO_NOW}?몇\s*시(?:\s*몇\s*분)?\s*{_KO_END}?"
+    rf"|{_KO_NOW}(?:시간|시각)\s*(?:은|이)?\s*(?:{_KO_TELL}|몇\s*시\s*{_KO_END}?)?"
+    rf"|(?:시간|시각)\s*{_KO_TELL})$"
+)
+_KO_DATE = re.compile(
+    rf"^(?:{_KO_TODAY}?(?:몇\s*월\s*)?(?:며칠|몇\s*일)\s*{_KO_END}?"
+    rf"|(?:오늘|현재)\s*(?:의\s*)?날짜\s*(?:는|가)?\s*(?:{_KO_TELL}|뭐{_KO_END}?|어떻게\s*돼)?"
+    rf"|날짜\s*{_KO_TELL})$"
+)
+# 영어 날짜/시간 질문: 문장 전체가 아래 형태 중 하나여야 한다. 뒤에 다른 말이 붙으면("... of the next election") 전체 그래프로 보낸다.
+_EN_DATE = re.compile(
+    r"^(?:(?:what\s+is|what's|whats)\s+(?:the\s+)?(?:date|day)(?:\s+today)?"
+    r"|(?:what\s+is|what's|whats)\s+today'?s\s+date"
+    r"|what\s+(?:day|date)\s+is\s+(?:it|today)(?:\s+today)?)\s*\??$",
+    re.I,
+)
+_EN_TIME = re.compile(
+    r"^(?:what\s+time\s+is\s+it(?:\s+now)?|(?:what\s+is|what's|whats)\s+the\s+(?:current\s+)?time(?:\s+now)?)\s*\??$",
+    re.I,
+)
+
+
+def _arithmetic_expression(text: str) -> Optional[str]:
+    """text가 순수한 산술식(사칙연산, 거듭제곱) 질문이면 계산할 식을, 아니면 None을 반환."""
+    expression = _ARITHMETIC_PREFIX.sub("", text)
+    while True:
+        stripped = _ARITHMETIC_SUFFIX.sub("", expression)
+        if stripped == expression:
+            break
+        expression = stripped
+    for word, operator in _KOREAN_OPERATORS:
+        expression = expression.replace(word, f" {operator} ")
+    expression = re.sub(r"(?<=[\d)])\s*[x×]\s*(?=[\d(])", " * ", expression, flags=re.I)
+    expression = expression.replace("÷", "/")
+    expression = re.sub(r"(?<=\d),(?=\d{3}\b)", "", expression)
+    expression = " ".join(expression.split())
+    if (
+        not _PURE_EXPRESSION.match(expression)
+        or not _HAS_OPERATION.search(expression)
+        or _DATE_LIKE.match(expression)
+        or len(expression) > 200
+    ):
+        return None
+    return expression
+
+
+def _datetime_kind(text: str) -> Optional[str]:
+    """text가 현재 날짜/시간만 묻는 질문이면 "date", "time", "weekday" 중 하나를, 아니면 None을 반환."""
+    phrase = " ".join(re.sub(r"[?？!.,~]", " ", text).split())
+    for kind, pattern in (("weekday", _KO_WEEKDAY), ("time", _KO_TIME), ("date", _KO_DATE)):
+        if pattern.match(phrase):
+            return kind
+    sentence = " ".join(re.sub(r"[?!.]", " ", text).split())
+    if _EN_TIME.match(sentence):
+        return "time"
+    if _EN_DATE.match(sentence):
+        return "weekday" if re.match(r"what\s+day\b", sentence, re.I) else "date"
+    return None
+
+
+def classify(text: str) -> Tuple[str, Optional[str]]:
+    """
+    빠른 경로로 답할 수 있는 질문인지 규칙으로 판별.
+    ("arithmetic", 식), ("date" | "time" | "weekday", None), 확실하지 않으면 ("full", None)을 반환한다.
+    """
+    expression = _arithmetic_expression(text)
+    if expression is not None:
+        return "arithmetic", expression
+    kind = _datetime_kind(text)
+    if kind is not None:
+        return kind, None
+    return "full", None
+
+
+def answer(route: str, argument: Optional[str], text: str) -> Optional[str]:
+    """계산기 툴로 답을 만든다. 툴이 에러를 반환하면 None (전체 그래프로 넘긴다)."""
+    korean = re.search(r"[가-힣]", text) is not None
+    if route == "arithmetic":
+        result = calculate_math_expression.invoke({"expression": argument})
+        if isinstance(result, str):
+            return None
+        return f"{argument} = {result}"
+    now = datetime.strptime(get_current_datetime.invoke({}), "%Y-%m-%d %H:%M:%S")
+    if route == "time":
+        return f"현재 시각은 {now:%H:%M:%S}입니다." if korean else f"The current time is {now:%H:%M:%S}."
+    if route == "weekday":
+        if korean:
+            return f"오늘은 {now.year}년 {now.month}월 {now.day}일 {WEEKDAYS_KO[now.weekday()]}요일입니다."
+        return f"Today is {now:%A, %Y-%m-%d}."
+    return f"오늘은 {now.year}년 {now.month}월 {now.day}일입니다." if korean else f"Today is {now:%Y-%m-%d}."
+
+
+class _RouterStats:
+    """라우팅 결정 횟수, 빠른 경로 처리 시간, 전체 그래프 평균 처리 시간 대비 절감 시간(추정)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes: Dict[str, int] = {}
+            self.fast_path_ms = 0.0
+            self.full_graph_ms = 0.0
+            self.full_graph_runs = 0
+            self.saved_ms = 0.0
+
+    def full_graph_avg_ms(self) -> Optional[float]:
+        return self.full_graph_ms / self.full_graph_runs if self.full_graph_runs else None
+
+    def record_route(self, route: str, elapsed_ms: float = 0.0) -> Optional[float]:
+        """route 결정을 기록하고, 빠른 경로면 추정 절감 시간(ms)을 반환 (전체 그래프 실행 기록이 없으면 None)."""
+        with self._lock:
+            self.routes[route] = self.routes.get(route, 0) + 1
+            if route == "full":
+                return None
+            self.fast_path_ms += elapsed_ms
+            average = self.full_graph_avg_ms()
+            if average is None:
+                return None
+            self.saved_ms += average - elapsed_ms
+            return average - elapsed_ms
+
+    def record_full_graph(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.full_graph_ms += elapsed_ms
+            self.full_graph_runs += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "routes": dict(self.routes),
+                "fast_path_ms": self.fast_path_ms,
+                "full_graph_avg_ms": self.full_graph_avg_ms(),
+                "estimated_saved_ms": self.saved_ms,
+            }
+
+
+_ROUTER_STATS = _RouterStats()
+
+
+def get_router_stats() -> Dict[str, Any]:
+    """경로별 라우팅 횟수, 빠른 경로 누적 처리 시간, 전체 그래프 평균 처리 시간, 누적 절감 시간(추정)을 반환."""
+    return _ROUTER_STATS.stats()
+
+
+class FastPathState(AgentState):
+    # 전체 그래프로 보낸 요청의 시작 시각 (perf_counter). 출력/입력 스키마에는 나타나지 않는다.
+    fast_path_started_at: Annotated[NotRequired[Optional[float]], PrivateStateAttr]
+
+
+class FastPathRouter(AgentMiddleware):
+    """
+    마스터 에이전트 앞단의 라우터. 대화의 첫 사용자 메시지가 순수한 사칙연산이나 현재 날짜/시간 질문이면
+    LLM을 거치지 않고 계산기 툴로 바로 답한 뒤 종료하고, 확실하지 않으면 전체 그래프로 넘긴다.
+    라우팅 결정과 절감 시간(추정)은 로그(logging, INFO)와 get_router_stats()로 확인할 수 있다.
+    """
+
+    state_schema = FastPathState
+
+    @hook_config(can_jump_to=["end"])
+    def before_agent(self, state: FastPathState, runtime) -> Optional[Dict[str, Any]]:
+        start = time.perf_counter()
+        message = state["messages"][-1] if state["messages"] else None
+        # 이어지는 대화의 질문("그럼 지금 몇 시야?")은 앞의 맥락에 따라 뜻이 달라질 수 있으므로,
+        # 사용자 메시지가 하나뿐인 첫 질문만 빠른 경로로 답한다.
+        human_messages = sum(isinstance(m, HumanMessage) for m in state["messages"])
+        if not isinstance(message, HumanMessage) or human_messages != 1:
+            return {"fast_path_started_at": start}
+        text = message.text
+        route, argument = classify(text)
+        response = answer(route, argument, text) if route != "full" else None
+        if response is None:
+            _ROUTER_STATS.record_route("full")
+            logger.info("fast path: route=full query=%r", text)
+            return {"fast_path_started_at": start}
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        saved_ms = _ROUTER_STATS.record_route(route, elapsed_ms)
+        logger.info(
+            "fast path: route=%s latency=%.2fms saved=%s query=%r",
+            route,
+            elapsed_ms,
+            f"{saved_ms:.0f}ms" if saved_ms is not None else "n/a",
+            text,
+        )
+        return {
+            "messages": [AIMessage(content=response, name="fast_path")],
+            "fast_path_started_at": None,
+            "jump_to": "end",
+        }
+
+    def after_agent(self, state: FastPathState, runtime) -> Dict[str, Any]:
+        started_at = state.get("fast_path_started_at")
+        if started_at is not None:
+            _ROUTER_STATS.record_full_graph((time.perf_counter() - started_at) * 1000)
+        # None을 반환하면 stream()의 업데이트 값이 None이 되어 update.get("messages")를 쓰는 호출부가 깨진다.
+        return {"fast_path_started_at": None}
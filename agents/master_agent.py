@@ -1,6 +1,7 @@
 from langchain.agents import create_agent
 from langchain_openai import ChatOpenAI
 
+from agents.fast_path import MASTER_FAST_PATH, FastPathRouter
 from agents.sql_agent import call_sql_agent
 from agents.web_agent import call_web_agent
 from agents.calculator_agent import call_calculator_agent
@@ -23,4 +24,6 @@ agent = create_agent(
     model=ChatOpenAI(model="gemini-2.5-pro"),
     tools=[call_sql_agent, call_web_agent, call_calculator_agent],
     system_prompt=SYSTEM_PROMPT,
+    # 순수한 사칙연산/현재 날짜·시간 질문은 LLM 없이 계산기 툴로 바로 답한다.
+    middleware=[FastPathRouter()] if MASTER_FAST_PATH else [],
 )
@@ -1,15 +1,26 @@
+import os
+
 from langchain.agents import create_agent
+from langchain.agents.middleware import ModelRequest, dynamic_prompt
 from langchain.tools import tool
 from langchain_openai import ChatOpenAI
 
+from agents.sub_agent import with_async_agent, with_response_cache
 from tools.db_tool import (
+    get_data_version,
+    get_schema_catalog_prompt,
+    describe_database,
     get_tables_from_db,
     get_column_info_from_table,
     get_all_data_from_table,
     filter_data_by_gte_or_lte,
     filter_data_by_inclusion,
     filter_data_by_like,
+    filter_data,
+    search_text,
     join_tables_on_column,
+    join_tables,
+    aggregate_table,
 )
 
 # Pre-defined values
@@ -18,20 +29,39 @@ SYSTEM_PROMPT = """
 당신은 AI 기반 연구와 솔루션 개발 및 판매를 하는 회사의 데이터베이스에 접근할 수 있는 에이전트입니다.
 데이터는 대부분 영어로 되어 있지만, 일부는 한국어로 되어 있을 수 있습니다.
 사용자가 요청한 정보를 제공하기 위해 적절한 도구를 사용하세요.
+이름이나 주제처럼 텍스트로 행을 찾을 때는 search_text 도구를 우선 사용하세요.
+조건이 여러 개인 필터링은 filter_data 도구 하나로 조건 트리와 필요한 컬럼만 지정해 한 번에 조회하세요.
+여러 테이블의 정보가 필요하면 join_tables 도구로 한 번에 조인하세요. 외래키를 따라 조인 경로가 자동으로 정해집니다.
+합계, 개수, 평균, 최솟값, 최댓값 등의 집계는 전체 데이터를 가져오지 말고 aggregate_table 도구로 DB에서 직접 계산하세요.
+행을 반환하는 도구의 결과는 페이지 단위로 나뉩니다. 응답의 next_cursor가 있고 더 많은 행이 필요하면 같은 인자에 cursor로 전달해 다음 페이지를 요청하세요.
+많은 행을 조회할 때는 format="columnar"를 지정하면 컬럼 헤더와 값 리스트로 더 작은 결과를 받을 수 있습니다.
 도구들을 이용해 답할 수 없는 경우에는 그 이유를 설명하고, 대신 할 수 있는 것들을 응답하세요.
 유용하고 정확한 답변을 제공하세요.
 """.strip()
+## schema: 스키마 카탈로그를 프롬프트에 넣어 테이블/컬럼 조회 왕복을 없앤다.
+SCHEMA_PROMPT = """
+
+DB 스키마는 다음과 같습니다 (테이블 (행 수), 컬럼 타입, PK, -> 외래키, {{가능한 값}}).
+이 정보로 충분하면 get_tables_from_db, get_column_info_from_table, describe_database를 호출하지 마세요.
+{catalog}"""
 ## tools
 TOOLS = [
+    describe_database,
     get_tables_from_db,
     get_column_info_from_table,
     get_all_data_from_table,
     filter_data_by_gte_or_lte,
     filter_data_by_inclusion,
     filter_data_by_like,
+    filter_data,
+    search_text,
     join_tables_on_column,
+    join_tables,
+    aggregate_table,
 ]
 TOOLS_DESCRIPTION = "\n".join([f"- {tool.name}: {tool.description}" for tool in TOOLS])
+## cache: 같은 질문의 응답을 재사용하는 시간(초). DB 응답은 DB 데이터가 바뀌면 TTL 전이라도 무효화된다.
+CACHE_TTL = float(os.getenv("SQL_AGENT_CACHE_TTL", "300"))
 ## agent
 AGENT_DESCRIPTION = f"""
 AI 기반 연구와 솔루션 개발 및 판매를 하는 회사의 데이터베이스에 접근할 수 있는 SQL 에이전트를 호출하여 응답을 반환.
@@ -48,14 +78,35 @@ Returns:
     dict: 에이전트의 응답.
 """.strip()
 
+
+def build_system_prompt() -> str:
+    """
+    현재 DB의 스키마 카탈로그를 붙인 시스템 프롬프트.
+    카탈로그는 스키마 버전이나 DB 파일이 바뀌었을 때만 다시 만들어지므로(행 추가 포함) 매 호출에 써도 된다.
+    """
+    try:
+        catalog = get_schema_catalog_prompt()
+    except Exception:
+        catalog = ""  # DB가 아직 없으면 describe_database 도구로 조회
+    return SYSTEM_PROMPT + SCHEMA_PROMPT.format(catalog=catalog) if catalog else SYSTEM_PROMPT
+
+
+@dynamic_prompt
+def schema_catalog_prompt(request: ModelRequest) -> str:
+    # import 시점에 고정하지 않고 모델 호출마다 만들어, 데이터 추가나 스키마 변경 후에도 행 수/컬럼이 맞게 한다.
+    return build_system_prompt()
+
+
 # 에이전트 인스턴스
 agent = create_agent(
     model=ChatOpenAI(model="gemini-2.5-flash"),
     tools=TOOLS,
-    system_prompt=SYSTEM_PROMPT,
+    middleware=[schema_catalog_prompt],
 )
 
 
+@with_response_cache(ttl=CACHE_TTL, get_version=get_data_version)
+@with_async_agent(lambda: agent)
 @tool(description=AGENT_DESCRIPTION)
 def call_sql_agent(input_text: str) -> dict:
     """
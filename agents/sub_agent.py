@@ -0,0 +1,208 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import functools
+import os
+import threading
+import time
+import unicodedata
+import weakref
+
+from langchain_core.runnables import RunnableConfig
+
+from tools.cache import LRUCache
+
+# 한 요청(마스터 에이전트의 한 도구 호출 단계)에서 동시에 실행되는 서브 에이전트 수의 기본 상한. 호출할 때마다 읽는다.
+# 도구 호출의 config에 max_concurrency가 있으면 그 값이 우선한다.
+SUB_AGENT_MAX_CONCURRENCY = int(os.getenv("SUB_AGENT_MAX_CONCURRENCY", "4"))
+
+# (이벤트 루프, 요청, 상한) -> 세마포어. 해당 요청의 호출이 모두 끝나면 자동으로 사라진다.
+_SEMAPHORES: "weakref.WeakValueDictionary[tuple, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+
+def _request_key(config: RunnableConfig) -> Optional[str]:
+    """
+    config가 속한 마스터 에이전트 요청의 식별자.
+
+    마스터 에이전트(create_agent)는 한 단계의 도구 호출을 각각 별도 태스크(Send)로 실행하므로
+    호출마다 run id와 checkpoint_ns가 다르다. 대신 최상위 그래프의 현재 체크포인트 id(checkpoint_map[""])는
+    같은 단계의 호출들이 공유하고 동시에 실행 중인 다른 요청과는 다르므로 이것으로 묶는다.
+    그래프 밖에서 호출되었으면 thread_id를, 그것도 없으면 None을 반환한다.
+    """
+    configurable = config.get("configurable") or {}
+    checkpoint_map = configurable.get("checkpoint_map") or {}
+    return checkpoint_map.get("") or configurable.get("thread_id")
+
+
+def _request_semaphore(config: RunnableConfig) -> asyncio.Semaphore:
+    """
+    같은 요청에서 나온 서브 에이전트 호출들이 공유하는 세마포어를 반환.
+    요청을 알 수 없으면(_request_key가 None) 이벤트 루프 단위로 공유한다.
+    """
+    limit = config.get("max_concurrency") or SUB_AGENT_MAX_CONCURRENCY
+    key = (id(asyncio.get_running_loop()), _request_key(config), limit)
+    semaphore = _SEMAPHORES.get(key)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        _SEMAPHORES[key] = semaphore
+    return semaphore
+
+
+def with_async_agent(get_agent: Callable[[], Any]):
+    """
+    서브 에이전트 호출 툴에 agent.ainvoke를 사용하는 async 구현(coroutine)을 붙이는 데코레이터.
+
+    마스터 에이전트를 ainvoke/astream으로 실행하면 한 단계의 여러 도구 호출이 이벤트 루프에서
+    동시에 진행되므로, 전체 지연 시간은 서브 에이전트 지연 시간의 합이 아니라 가장 느린 것에 가깝다.
+    get_agent는 호출 시점의 에이전트를 반환하는 함수로, 벤치마크 등에서 모듈의 agent를 바꿔 끼울 수 있다.
+    """
+
+    def decorator(agent_tool):
+        async def coroutine(input_text: str, config: RunnableConfig) -> str:
+            async with _request_semaphore(config):
+                response = await get_agent().ainvoke({"messages": [{"role": "user", "content": input_text}]})
+            return response["messages"][-1].text
+
+        agent_tool.coroutine = coroutine
+        return agent_tool
+
+    return decorator
+
+
+# 서브 에이전트 응답 캐시: (툴 이름, 정규화된 입력) -> (만료 시각, 데이터 버전, 응답)
+_RESPONSE_CACHE = LRUCache(
+    max_entries=int(os.getenv("SUB_AGENT_CACHE_MAX_ENTRIES", "512")),
+    max_bytes=int(os.getenv("SUB_AGENT_CACHE_MAX_BYTES", str(8 * 1024 * 1024))),
+)
+_RESPONSE_CACHE_MISSING = object()
+# 실행 중인 호출: (키, 데이터 버전) -> 결과를 받을 Future. 같은 키의 동시 호출은 이 결과를 기다린다.
+_IN_FLIGHT: Dict[tuple, Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def normalize_input(input_text: str) -> str:
+    """캐시 키로 쓰는 입력 정규화: 유니코드 NFKC, 연속 공백 하나로, 대소문자 무시."""
+    return " ".join(unicodedata.normalize("NFKC", input_text).split()).casefold()
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """서브 에이전트 응답 캐시의 hit/miss/eviction/invalidation 카운터와 현재 사용량을 반환."""
+    return _RESPONSE_CACHE.stats()
+
+
+def clear_response_cache() -> None:
+    """서브 에이전트 응답 캐시를 비운다."""
+    _RESPONSE_CACHE.clear()
+
+
+def _cached_response(key: Tuple[str, str], version: Hashable) -> Any:
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return _RESPONSE_CACHE_MISSING
+    expires_at, entry_version, response = entry
+    if time.monotonic() >= expires_at or entry_version != version:
+        _RESPONSE_CACHE.pop(key)
+        return _RESPONSE_CACHE_MISSING
+    return response
+
+
+def _join_in_flight(key: Tuple[str, str], version: Hashable) -> Tuple[Future, bool]:
+    """(결과 Future, 직접 실행해야 하는지). 같은 키가 같은 버전으로 이미 실행 중이면 그 Future를 돌려준다."""
+    with _IN_FLIGHT_LOCK:
+        future = _IN_FLIGHT.get((key, version))
+        if future is not None:
+            return future, False
+        future = Future()
+        _IN_FLIGHT[(key, version)] = future
+        return future, True
+
+
+def _finish_in_flight(
+    key: Tuple[str, str],
+    version: Hashable,
+    future: Future,
+    ttl: float,
+    response: Any = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """실행 결과를 캐시에 저장(성공 시)하고, 기다리던 호출들에게 결과나 예외를 전달."""
+    if error is None and ttl > 0:
+        size = len(str(response).encode("utf-8"))
+        _RESPONSE_CACHE.set(key, (time.monotonic() + ttl, version, response), size)
+    with _IN_FLIGHT_LOCK:
+        _IN_FLIGHT.pop((key, version), None)
+    if error is None:
+        future.set_result(response)
+    else:
+        future.set_exception(error)
+
+
+def with_response_cache(ttl: float, get_version: Optional[Callable[[], Hashable]] = None):
+    """
+    서브 에이전트 호출 툴의 응답을 (툴 이름, 정규화된 입력) 키로 캐시하는 데코레이터.
+
+    - ttl초가 지나면 만료된다. ttl이 0이면 저장하지 않고 아래의 중복 실행 제거만 한다.
+    - get_version이 주어지면 응답과 함께 저장한 버전이 현재 버전과 다를 때 무효화한다.
+      (예: SQL 에이전트는 DB 데이터 버전을 넘겨 DB가 바뀌면 다시 실행한다)
+    - 같은 키의 호출이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 받는다.
+      동기(func)와 async(coroutine) 호출 모두 같은 실행을 공유하며, 실행이 실패하면 예외도 공유한다.
+
+    with_async_agent 바깥에 적용해야 async 구현에도 캐시가 적용된다.
+    """
+
+    def decorator(agent_tool):
+        func = agent_tool.func
+        coroutine = agent_tool.coroutine
+
+        def prepare(input_text: str) -> Optional[Tuple[Tuple[str, str], Hashable]]:
+            try:
+                version = get_version() if get_version is not None else None
+            except Exception:
+                return None  # 버전을 알 수 없으면(DB 없음 등) 캐시를 거치지 않는다
+            return (agent_tool.name, normalize_input(input_text)), version
+
+        @functools.wraps(func)
+        def cached_func(input_text: str) -> str:
+            prepared = prepare(input_text)
+            if prepared is None:
+                return func(input_text)
+            key, version = prepared
+            response = _cached_response(key, version)
+            if response is not _RESPONSE_CACHE_MISSING:
+                return response
+            future, leader = _join_in_flight(key, version)
+            if not leader:
+                return future.result()
+            try:
+                response = func(input_text)
+            except BaseException as e:
+                _finish_in_flight(key, version, future, ttl, error=e)
+                raise
+            _finish_in_flight(key, version, future, ttl, response)
+            return response
+
+        async def cached_coroutine(input_text: str, config: RunnableConfig) -> str:
+            prepared = prepare(input_text)
+            if prepared is None:
+                return await coroutine(input_text, config)
+            key, version = prepared
+            response = _cached_response(key, version)
+            if response is not _RESPONSE_CACHE_MISSING:
+                return response
+            future, leader = _join_in_flight(key, version)
+            if not leader:
+                return await asyncio.wrap_future(future)
+            try:
+                response = await coroutine(input_text, config)
+            except BaseException as e:
+                _finish_in_flight(key, version, future, ttl, error=e)
+                raise
+            _finish_in_flight(key, version, future, ttl, response)
+            return response
+
+        agent_tool.func = cached_func
+        if coroutine is not None:
+            agent_tool.coroutine = cached_coroutine
+        return agent_tool
+
+    return decorator
@@ -1,8 +1,11 @@
+import os
+
 from langchain.agents import create_agent
 from langchain.tools import tool
 from langchain_openai import ChatOpenAI
 
-from tools.web_tool import google_search
+from agents.sub_agent import with_async_agent, with_response_cache
+from tools.web_tool import google_search, google_search_batch
 
 # Pre-defined values
 ## prompt
@@ -11,18 +14,22 @@ SYSTEM_PROMPT = """
 당신이 학습하지 못한 최신 정보도 웹 검색을 통해 찾아낼 수 있습니다. 
 오늘 날짜에 대해 확신을 하지 마세요. 학습된 지식이 오래되었을 수 있습니다.
 사용자가 요청한 정보를 제공하기 위해 적절한 도구를 사용하세요.
+여러 정보가 필요하면(비교 질문 등) google_search_batch로 필요한 쿼리를 한 번에 검색하세요.
 많은 검색 정보 중 필요한 정보를 잘 추출하여 유용하고 정확한 답변을 제공하세요.
 """.strip()
 ## tools
 TOOLS = [
     google_search,
+    google_search_batch,
 ]
 TOOLS_DESCRIPTION = "\n".join([f"- {tool.name}: {tool.description}" for tool in TOOLS])
+## cache: 같은 질문의 응답을 재사용하는 시간(초).
+CACHE_TTL = float(os.getenv("WEB_AGENT_CACHE_TTL", "1800"))
 ## agent
 AGENT_DESCRIPTION = f"""
 웹(인터넷)을 검색할 수 있는 에이전트를 호출하여 응답을 반환.
 사용자가 요청한 정보를 제공하기 위해 적절한 도구를 사용하세요.
-한 번에 하나의 정보만 검색합니다. 다수의 정보를 검색해야 하면 정보 단위를 나누어 여러 번 검색하세요.
+다수의 정보가 필요한 질문도 한 번에 요청할 수 있습니다. 에이전트가 여러 쿼리를 동시에 검색합니다.
 많은 검색 정보 중 필요한 정보를 잘 추출하여 유용하고 정확한 답변을 제공하세요.
 사용 가능한 도구는 다음과 같습니다:
 {TOOLS_DESCRIPTION}
@@ -40,6 +47,8 @@ agent = create_agent(
 )
 
 
+@with_response_cache(ttl=CACHE_TTL)
+@with_async_agent(lambda: agent)
 @tool(description=AGENT_DESCRIPTION)
 def call_web_agent(input_text: str) -> dict:
     """
@@ -0,0 +1,110 @@
+"""
+여러 스레드가 동시에 DB 툴을 호출할 때의 처리량 벤치마크.
+
+기본 설정 엔진(rollback journal, 읽기/쓰기)과 튜닝된 읽기 전용 WAL 엔진을 비교한다.
+--with-writer를 주면 별도 스레드가 계속 쓰기를 수행하는 상황(read-under-write)을 재현한다.
+
+사용법:
+    python -m db.init_db
+    python -m benchmarks.bench_db_concurrency --threads 1 4 8 --calls 200 --with-writer
+"""
+
+import argparse
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from db.engine import DB_PATH, create_sqlite_engine
+from tools import db_tool
+
+TOOL_CALLS = [
+    (db_tool.filter_data_by_gte_or_lte, {"table_name": "contracts", "column_name": "amount", "gte": 50000}),
+    (db_tool.filter_data_by_inclusion, {"table_name": "contracts", "column_name": "status", "include_values": ["active"]}),
+    (db_tool.join_tables, {"tables": ["invoices", "clients"], "columns": ["invoices.id", "clients.name"]}),
+    (
+        db_tool.aggregate_table,
+        {"table_name": "contracts", "group_by": ["client_id"], "aggregates": [{"function": "sum", "column": "amount"}]},
+    ),
+]
+
+
+def _writer(db_path: Path, stop: threading.Event, counter: list[int]) -> None:
+    conn = sqlite3.connect(db_path, timeout=5)
+    try:
+        while not stop.is_set():
+            conn.execute(
+                "INSERT INTO meetings (client_id, host_employee_id, topic, created_at) VALUES (1, 1, 'bench', ?)",
+                (datetime.now(timezone.utc).isoformat(sep=" "),),
+            )
+            conn.commit()
+            counter[0] += 1
+            time.sleep(0.001)
+    finally:
+        conn.close()
+
+
+def _run(engine, db_path: Path, threads: int, calls: int, with_writer: bool) -> tuple[float, int, int]:
+    db_tool._ENGINE = engine
+    db_tool._SCHEMA_METADATA = None
+    stop = threading.Event()
+    writes = [0]
+    writer = threading.Thread(target=_writer, args=(db_path, stop, writes)) if with_writer else None
+    if writer:
+        writer.start()
+
+    def worker(_):
+        errors = 0
+        for i in range(calls):
+            tool, args = TOOL_CALLS[i % len(TOOL_CALLS)]
+            if "error" in tool.func(**args):
+                errors += 1
+        return errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        errors = sum(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    if writer:
+        stop.set()
+        writer.join()
+    engine.dispose()
+    return threads * calls / elapsed, errors, writes[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent DB tool throughput.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--calls", type=int, default=200, help="스레드당 툴 호출 수")
+    parser.add_argument("--with-writer", action="store_true", help="동시에 쓰기를 수행하는 스레드 추가")
+    args = parser.parse_args()
+
+    if not DB_PATH.exists():
+        raise SystemExit(f"{DB_PATH} 가 없습니다. 먼저 `python -m db.init_db`를 실행하세요.")
+
+    print(f"{'engine':<10} {'threads':>7} {'calls/s':>10} {'errors':>7} {'writes':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ("default", "tuned"):
+            db_path = Path(tmp) / f"{label}.db"
+            shutil.copyfile(DB_PATH, db_path)
+            conn = sqlite3.connect(db_path)
+            conn.execute("PRAGMA journal_mode=" + ("DELETE" if label == "default" else "WAL"))
+            conn.close()
+            for threads in args.threads:
+                if label == "default":
+                    engine = create_engine(f"sqlite:///{db_path}", future=True)
+                else:
+                    engine = create_sqlite_engine(db_path, read_only=True)
+                throughput, errors, writes = _run(engine, db_path, threads, args.calls, args.with_writer)
+                print(f"{label:<10} {threads:>7} {throughput:>10.0f} {errors:>7} {writes:>7}")
+
+
+if __name__ == "__main__":
+    main()
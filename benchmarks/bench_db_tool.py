@@ -0,0 +1,82 @@
+"""
+DB 툴 호출당 지연 시간 벤치마크 (스키마 리플렉션 캐시 적용 전/후 비교).
+
+사용법:
+    python -m db.init_db
+    python -m benchmarks.bench_db_tool --iterations 500 --extra-tables 0
+"""
+
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import MetaData, Table, create_engine, inspect, select
+
+from tools import db_tool
+
+
+def _baseline_filter(engine, table_name: str, column_name: str, gte: float, limit: int) -> int:
+    """캐시 적용 전의 동작: 호출마다 inspect + MetaData 리플렉션."""
+    with engine.connect() as conn:
+        columns = inspect(conn).get_columns(table_name)
+        if column_name not in [col["name"] for col in columns]:
+            raise ValueError(column_name)
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        rows = conn.execute(select(table).where(table.c[column_name] >= gte).limit(limit)).fetchall()
+        return len(rows)
+
+
+def _cached_filter(table_name: str, column_name: str, gte: float, limit: int) -> int:
+    """스키마 캐시 적용 후의 동작. 결과 캐시를 비워 매번 실제로 쿼리하게 한다."""
+    db_tool.clear_result_cache()
+    result = db_tool.filter_data_by_gte_or_lte.func(table_name, column_name, gte=gte, limit=limit)
+    return result["row_count"]
+
+
+def _measure(fn, iterations: int) -> list[float]:
+    fn()  # warm-up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<10} mean={statistics.mean(samples):.3f}ms  p50={statistics.median(samples):.3f}ms  p95={p95:.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-call latency of DB tools.")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--extra-tables", type=int, default=0, help="스키마에 추가할 더미 테이블 수")
+    parser.add_argument("--limit", type=int, default=db_tool.DEFAULT_PAGE_SIZE, help="호출당 가져올 행 수")
+    args = parser.parse_args()
+
+    src = db_tool.DB_PATH
+    if not src.exists():
+        raise SystemExit(f"{src} 가 없습니다. 먼저 `python -m db.init_db`를 실행하세요.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        shutil.copyfile(src, db_path)
+        engine = create_engine(f"sqlite:///{db_path}", future=True)
+        with engine.begin() as conn:
+            for i in range(args.extra_tables):
+                conn.exec_driver_sql(f"CREATE TABLE extra_{i} (id INTEGER PRIMARY KEY, value TEXT, created_at DATETIME)")
+            table_count = len(inspect(conn).get_table_names())
+
+        db_tool.use_database(db_path)
+        print(f"tables={table_count} iterations={args.iterations} limit={args.limit}")
+        _report("baseline", _measure(lambda: _baseline_filter(engine, "contracts", "amount", 50000, args.limit), args.iterations))
+        _report("cached", _measure(lambda: _cached_filter("contracts", "amount", 50000, args.limit), args.iterations))
+
+
+if __name__ == "__main__":
+    main()
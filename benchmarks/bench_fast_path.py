@@ -0,0 +1,76 @@
+"""
+마스터 에이전트 빠른 경로(FastPathRouter) 벤치마크.
+
+산술/날짜 질문과 일반 질문을 섞은 목록을 빠른 경로가 있는/없는 마스터 에이전트로 처리한다.
+실제 LLM 대신 bench_sub_agents의 고정 지연 스텁 모델을 쓰며, 빠른 경로가 없으면 산술/날짜 질문도
+마스터 LLM -> call_calculator_agent -> 계산 에이전트 LLM을 거친다.
+
+사용법:
+    python -m benchmarks.bench_fast_path --latency 0.5
+"""
+
+from typing import Any
+import argparse
+import os
+import time
+
+from langchain.agents import create_agent
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")  # 모듈 import 시 만들어지는 ChatOpenAI는 호출되지 않는다
+
+from agents import calculator_agent  # noqa: E402
+from agents.fast_path import FastPathRouter, get_router_stats  # noqa: E402
+from benchmarks.bench_sub_agents import LatencyChatModel  # noqa: E402
+
+QUESTIONS = [
+    "1234*5678",
+    "1,234 곱하기 5,678은 얼마야?",
+    "(3+4)/2 계산해줘",
+    "오늘 며칠이야?",
+    "지금 몇 시야?",
+    "what time is it",
+    "메시와 호날두의 라리가 한 시즌 최다 골 기록의 차이는?",
+    "활성 계약 중 금액이 가장 큰 계약은?",
+]
+
+
+def _master_respond(messages: list[BaseMessage]) -> AIMessage:
+    if isinstance(messages[-1], HumanMessage):
+        tool_call = {"name": "call_calculator_agent", "args": {"input_text": messages[-1].content}, "id": "call_0"}
+        return AIMessage(content="", tool_calls=[tool_call])
+    return AIMessage(content="done")
+
+
+def _run(agent: Any, questions: list[str]) -> float:
+    start = time.perf_counter()
+    for question in questions:
+        agent.invoke({"messages": [{"role": "user", "content": question}]})
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the master agent fast path.")
+    parser.add_argument("--latency", type=float, default=0.5, help="LLM 호출당 지연 시간(초)")
+    args = parser.parse_args()
+
+    calculator_agent.agent = create_agent(
+        model=LatencyChatModel(latency=args.latency, respond=lambda messages: AIMessage(content="ok")), tools=[]
+    )
+
+    def master(middleware: list) -> Any:
+        model = LatencyChatModel(latency=args.latency, respond=_master_respond)
+        return create_agent(model=model, tools=[calculator_agent.call_calculator_agent], middleware=middleware)
+
+    baseline = _run(master([]), QUESTIONS)
+    routed = _run(master([FastPathRouter()]), QUESTIONS)
+    stats = get_router_stats()
+    print(f"questions={len(QUESTIONS)} llm latency={args.latency}s")
+    print(f"full graph      {baseline:>7.3f}s")
+    print(f"fast path       {routed:>7.3f}s")
+    print(f"routes          {stats['routes']}")
+    print(f"fast path total {stats['fast_path_ms']:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+부분 문자열 검색 벤치마크: LIKE '%term%' 전체 스캔 vs FTS5 trigram 인덱스.
+
+임시 DB에 meetings 행을 N개(기본 1,000,000) 만들고, 같은 DB에서 FTS 인덱스 생성 전/후로
+filter_data_by_like 툴의 호출 지연 시간을 비교한다. 결과 캐시는 매 호출 전에 비운다.
+
+사용법:
+    python -m benchmarks.bench_fts --meetings 1000000 --iterations 20
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from db.engine import create_sqlite_engine
+from db.fts import create_fts_indexes
+from db.init_db import Base
+from tools import db_tool
+
+TOPIC_WORDS = [
+    "Quarterly", "Business", "Review", "Technical", "Architecture", "Roadmap", "Alignment",
+    "Renewal", "Pilot", "Feedback", "분기", "리뷰", "기술", "아키텍처", "로드맵", "갱신", "파일럿", "피드백",
+]
+
+# (검색어 패턴, 설명): 흔한 단어 / 드문 코드 / 없는 단어 / 한글 단어
+PATTERNS = [
+    ("%Roadmap%", "common"),
+    ("%PRJ-77777%", "rare"),
+    ("%Offsite%", "missing"),
+    ("%피드백%", "korean"),
+]
+
+
+def _seed(db_path: Path, meetings: int) -> None:
+    engine = create_sqlite_engine(db_path)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    rng = random.Random(7)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("INSERT INTO clients (id, name, industry, city, created_at) VALUES (1, 'Acme', 'Tech', 'Seoul', '2025-01-01')")
+    conn.execute(
+        "INSERT INTO employees (id, name, email, title, created_at) VALUES (1, 'Kim', 'kim@example.com', 'AE', '2025-01-01')"
+    )
+    rows = (
+        (1, 1, f"{' '.join(rng.sample(TOPIC_WORDS, 3))} PRJ-{rng.randrange(100000):05d}", "2025-01-01 00:00:00")
+        for _ in range(meetings)
+    )
+    conn.executemany("INSERT INTO meetings (client_id, host_employee_id, topic, created_at) VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def _measure(pattern: str, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        db_tool.clear_result_cache()
+        start = time.perf_counter()
+        result = db_tool.filter_data_by_like.func("meetings", "topic", pattern, limit=100)
+        samples.append((time.perf_counter() - start) * 1000)
+        if "error" in result:
+            raise SystemExit(result["error"])
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LIKE scans against FTS5 lookups.")
+    parser.add_argument("--meetings", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        start = time.perf_counter()
+        _seed(db_path, args.meetings)
+        print(f"seeded meetings={args.meetings} in {time.perf_counter() - start:.1f}s")
+
+        db_tool.use_database(db_path)
+        results: dict[str, dict[str, float]] = {}
+        for mode in ("like", "fts5"):
+            if mode == "fts5":
+                start = time.perf_counter()
+                create_fts_indexes(create_sqlite_engine(db_path), tables=["meetings"])
+                print(f"built FTS index in {time.perf_counter() - start:.1f}s")
+            for pattern, label in PATTERNS:
+                results.setdefault(label, {})[mode] = statistics.median(_measure(pattern, args.iterations))
+
+        print(f"{'pattern':<8} {'like p50':>10} {'fts5 p50':>10} {'speedup':>8}")
+        for label, timings in results.items():
+            print(f"{label:<8} {timings['like']:>8.2f}ms {timings['fts5']:>8.2f}ms {timings['like'] / timings['fts5']:>7.1f}x")
+        db_tool._get_engine().dispose()
+
+
+if __name__ == "__main__":
+    main()
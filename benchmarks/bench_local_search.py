@@ -0,0 +1,76 @@
+"""
+로컬 BM25 검색 백엔드 벤치마크: 인덱스 생성 시간, 인덱스 로드 시간, 쿼리 지연 시간(p50/p95).
+
+test/web_test_10.json의 문단을 문장 순서를 바꿔 --copies배로 늘린 임시 코퍼스를 색인하고,
+web_test_10.json의 질문들로 검색한다. recall@1은 원본 문단(복제본 포함)이 1위로 나온 비율이다.
+
+사용법:
+    python -m benchmarks.bench_local_search --copies 2000
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+
+from tools.local_search import LocalSearchClient, build_index
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "test" / "web_test_10.json"
+
+
+def _write_corpus(corpus_dir: Path, copies: int, seed: int) -> None:
+    rng = random.Random(seed)
+    data = json.loads(TEST_DATA.read_text(encoding="utf-8"))["data"]
+    for copy in range(copies):
+        for i, article in enumerate(data):
+            sentences = article["paragraphs"][0]["context"].split(". ")
+            rng.shuffle(sentences)
+            (corpus_dir / f"{article['title']}__{copy}_{i}.txt").write_text(". ".join(sentences), encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the local BM25 search backend.")
+    parser.add_argument("--copies", type=int, default=1000, help="web_test_10.json 문단 복제 배수")
+    parser.add_argument("--rounds", type=int, default=20, help="질문 목록을 반복 검색하는 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = json.loads(TEST_DATA.read_text(encoding="utf-8"))["data"]
+    questions = [(article["title"], article["paragraphs"][0]["qas"][0]["question"]) for article in data]
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir, index_dir = Path(tmp) / "corpus", Path(tmp) / "index"
+        corpus_dir.mkdir()
+        _write_corpus(corpus_dir, args.copies, args.seed)
+
+        start = time.perf_counter()
+        build_index([corpus_dir], index_dir)
+        build_seconds = time.perf_counter() - start
+
+        client = LocalSearchClient([corpus_dir], index_dir)
+        start = time.perf_counter()
+        client._load()
+        load_seconds = time.perf_counter() - start
+
+        samples, correct = [], 0
+        for _ in range(args.rounds):
+            for title, question in questions:
+                start = time.perf_counter()
+                results = client.search({"q": question})["organic_results"]
+                samples.append(time.perf_counter() - start)
+                correct += bool(results) and results[0]["title"].startswith(f"{title}__")
+        samples.sort()
+
+        num_docs = args.copies * len(data)
+        print(f"documents={num_docs} postings={(index_dir / 'postings.bin').stat().st_size / 1e6:.1f}MB")
+        print(f"build           {build_seconds * 1000:>9.1f}ms")
+        print(f"load            {load_seconds * 1000:>9.1f}ms")
+        print(f"query p50       {statistics.median(samples) * 1000:>9.2f}ms")
+        print(f"query p95       {samples[int(len(samples) * 0.95)] * 1000:>9.2f}ms")
+        print(f"recall@1        {correct / len(samples):>9.2%}")
+
+
+if __name__ == "__main__":
+    main()
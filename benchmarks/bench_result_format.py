@@ -0,0 +1,108 @@
+"""
+DB 툴 결과 포맷(rows vs columnar)의 변환 시간과 직렬화 크기 벤치마크.
+
+사용법:
+    python -m benchmarks.bench_result_format --rows 10000 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, insert, select
+
+from tools.db_tool import _rows_to_columnar, _rows_to_table_dicts
+
+
+def _baseline_rows_to_table_dicts(rows, column_names):
+    """변경 전 변환기: 행마다 tuple 복사 + 인덱스 루프."""
+    formatted_rows = []
+    for row in rows:
+        row_values = tuple(row)
+        formatted_rows.append({column_names[idx]: row_values[idx] for idx in range(len(column_names))})
+    return formatted_rows
+
+
+def _stringify(content) -> str:
+    """LangChain이 툴 결과를 ToolMessage 문자열로 바꾸는 방식과 동일 (JSON 실패 시 str)."""
+    try:
+        return json.dumps(content, ensure_ascii=False)
+    except Exception:
+        return str(content)
+
+
+def _build_table(row_count: int):
+    engine = create_engine("sqlite://", future=True)
+    metadata = MetaData()
+    table = Table(
+        "contracts",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("client_id", Integer),
+        Column("product_id", Integer),
+        Column("sales_rep_id", Integer),
+        Column("amount", Integer),
+        Column("term", String),
+        Column("status", String),
+        Column("created_at", DateTime),
+    )
+    metadata.create_all(engine)
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(table),
+            [
+                {
+                    "client_id": rng.randint(1, 500),
+                    "product_id": rng.randint(1, 12),
+                    "sales_rep_id": rng.randint(1, 300),
+                    "amount": rng.randint(50000, 150000),
+                    "term": rng.choice(["6 months", "12 months", "24 months"]),
+                    "status": rng.choice(["active", "pending", "closed"]),
+                    "created_at": base + timedelta(minutes=i),
+                }
+                for i in range(row_count)
+            ],
+        )
+    with engine.connect() as conn:
+        rows = conn.execute(select(table)).fetchall()
+    return table, rows
+
+
+def _timed(fn, repeat: int = 3):
+    """fn을 repeat번 실행해 마지막 결과와 최소 소요 시간(ms)을 반환."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return value, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DB tool result encodings.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'format':<16} {'convert(ms)':>12} {'serialize(ms)':>14} {'size(bytes)':>12}")
+    for row_count in args.rows:
+        table, rows = _build_table(row_count)
+        column_names = [col.name for col in table.c]
+        cases = {
+            "rows (baseline)": lambda: _baseline_rows_to_table_dicts(rows, column_names),
+            "rows": lambda: _rows_to_table_dicts(rows, column_names),
+            "columnar": lambda: _rows_to_columnar(rows, table.c),
+        }
+        for label, convert in cases.items():
+            formatted, convert_ms = _timed(convert)
+            payload = {"table": table.name, "columns": column_names, "rows": formatted}
+            serialized, serialize_ms = _timed(lambda: _stringify(payload))
+            size = len(serialized.encode("utf-8"))
+            print(f"{row_count:>8} {label:<16} {convert_ms:>12.1f} {serialize_ms:>14.1f} {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+DB 시드 속도 벤치마크.
+
+임시 DB에 대해 reset_db() + insert_data_into_db()를 스케일 팩터별로 실행하고 (--workers로 생성 프로세스 수 지정)
+삽입 행 수, 초당 삽입 행 수, 최대 메모리 사용량(RSS)을 출력한다.
+생성기는 청크 단위로 스트리밍하므로 생성기 자체의 메모리는 스케일 팩터와 무관하다.
+RSS 증가분은 SQLite 페이지 캐시/mmap과 인덱스 생성 시 정렬에 쓰이는 메모리다.
+
+사용법:
+    python -m benchmarks.bench_seed --scale-factor 100 1000 10000 --workers 4
+"""
+
+import argparse
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from db import init_db
+
+
+def _seed(db_path: Path, scale_factor: float, workers: int) -> tuple[dict[str, int], float]:
+    init_db.DB_PATH = db_path
+    init_db._ENGINE = None
+    init_db.reset_db()
+    start = time.perf_counter()
+    counts = init_db.insert_data_into_db(scale_factor=scale_factor, workers=workers)
+    elapsed = time.perf_counter() - start
+    init_db._ENGINE.dispose()
+    return counts, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DB seeding throughput.")
+    parser.add_argument("--scale-factor", type=float, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'scale':>8} {'inserted':>10} {'seconds':>8} {'rows/s':>10} {'max RSS':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale_factor in args.scale_factor:
+            counts, elapsed = _seed(Path(tmp) / f"seed_{scale_factor}.db", scale_factor, args.workers)
+            total = sum(counts.values())
+            max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{scale_factor:>8g} {total:>10} {elapsed:>8.2f} {total / elapsed:>10.0f} {max_rss_mb:>7.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+DB 준비 시간 벤치마크: 매번 새로 생성 vs 스냅샷 파일 복제 vs 인메모리 DB 로드.
+
+임시 스냅샷 디렉터리를 사용하므로 db/snapshots와 db/data.db는 건드리지 않는다.
+각 방식의 준비 시간과, 파일/인메모리 DB 각각에서 첫 DB 툴 호출(filter_data)까지 걸린 시간을 출력한다.
+
+사용법:
+    python -m benchmarks.bench_snapshot --scale-factor 100
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from db import init_db, snapshot
+from db.sample_data import build_plan
+from tools import db_tool
+
+
+def _first_query(target) -> float:
+    start = time.perf_counter()
+    db_tool.use_database(target)
+    result = db_tool.filter_data.func("contracts", where={"column": "status", "op": "eq", "value": "active"}, limit=10)
+    if "error" in result:
+        raise SystemExit(result["error"])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark DB startup with and without snapshots.")
+    parser.add_argument("--scale-factor", type=float, default=100)
+    args = parser.parse_args()
+
+    plan = build_plan(args.scale_factor)
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot.SNAPSHOT_DIR = init_db.SNAPSHOT_DIR = Path(tmp) / "snapshots"
+        db_path = Path(tmp) / "data.db"
+        init_db.use_database(db_path)
+
+        timings = {}
+        start = time.perf_counter()
+        init_db.prepare_database(plan, db_path=db_path)
+        timings["generate"] = time.perf_counter() - start
+        start = time.perf_counter()
+        init_db.prepare_database(plan, db_path=db_path)
+        timings["file snapshot"] = time.perf_counter() - start
+        start = time.perf_counter()
+        uri = init_db.prepare_database(plan, in_memory="bench_snapshot")
+        timings["in-memory"] = time.perf_counter() - start
+
+        first_query = {"file": _first_query(db_path), "in-memory": _first_query(uri)}
+
+        print(f"scale_factor={args.scale_factor:g}")
+        for mode, elapsed in timings.items():
+            print(f"prepare {mode:<14} {elapsed * 1000:>9.1f}ms")
+        for mode, elapsed in first_query.items():
+            print(f"first query {mode:<10} {elapsed * 1000:>9.1f}ms")
+        db_tool._get_engine().dispose()
+        init_db._get_engine().dispose()
+        snapshot.drop_memory_db("bench_snapshot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+마스터 에이전트가 한 단계에서 서브 에이전트 3개를 호출할 때의 전체 지연 시간 벤치마크.
+
+실제 LLM 대신 고정 지연 시간을 주입한 스텁 채팅 모델을 사용한다. 마스터 모델은 첫 호출에서
+call_sql_agent / call_web_agent / call_calculator_agent를 한 번에 요청하고, 각 서브 에이전트는
+--latency초 뒤에 바로 답한다. 순차 호출의 합, invoke(ToolNode 스레드 풀), 동기 툴을 스레드로 돌리는 ainvoke,
+agent.ainvoke를 쓰는 async 툴의 ainvoke, 서브 에이전트 동시 실행 상한(SUB_AGENT_MAX_CONCURRENCY)을 1로 둔 ainvoke를 비교한다.
+마지막 두 행은 --requests개의 요청을 동시에 처리할 때로, 스레드 방식은 기본 스레드 풀 크기에 막힌다.
+
+사용법:
+    python -m benchmarks.bench_sub_agents --latency 0.5 --iterations 3
+"""
+
+from typing import Any, Callable
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import time
+
+from langchain.agents import create_agent
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")  # 모듈 import 시 만들어지는 ChatOpenAI는 호출되지 않는다
+
+from agents import calculator_agent, sql_agent, sub_agent, web_agent  # noqa: E402
+
+SUB_AGENT_TOOLS = [sql_agent.call_sql_agent, web_agent.call_web_agent, calculator_agent.call_calculator_agent]
+
+
+class LatencyChatModel(BaseChatModel):
+    """respond(messages)의 결과를 latency초 뒤에 반환하는 스텁 채팅 모델."""
+
+    latency: float
+    respond: Callable[[list[BaseMessage]], AIMessage]
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-stub"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "LatencyChatModel":
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self.respond(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self.respond(messages))])
+
+
+def _master_respond(messages: list[BaseMessage]) -> AIMessage:
+    if isinstance(messages[-1], HumanMessage):
+        tool_calls = [
+            {"name": tool.name, "args": {"input_text": f"{messages[-1].content} part {i}"}, "id": f"call_{i}"}
+            for i, tool in enumerate(SUB_AGENT_TOOLS)
+        ]
+        return AIMessage(content="", tool_calls=tool_calls)
+    return AIMessage(content="done")
+
+
+def _measure(run: Callable[[], Any], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async sub-agent fan-out.")
+    parser.add_argument("--latency", type=float, default=0.5, help="서브 에이전트 LLM 호출당 지연 시간(초)")
+    parser.add_argument("--master-latency", type=float, default=0.05, help="마스터 LLM 호출당 지연 시간(초)")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=20, help="동시에 처리하는 마스터 요청 수 (x N 행)")
+    args = parser.parse_args()
+
+    for module in (sql_agent, web_agent, calculator_agent):
+        module.agent = create_agent(
+            model=LatencyChatModel(latency=args.latency, respond=lambda messages: AIMessage(content="ok")), tools=[]
+        )
+    master = create_agent(
+        model=LatencyChatModel(latency=args.master_latency, respond=_master_respond), tools=SUB_AGENT_TOOLS
+    )
+    # coroutine이 없는 툴: ainvoke가 동기 구현을 스레드 풀에서 실행하던 이전 동작
+    thread_master = create_agent(
+        model=LatencyChatModel(latency=args.master_latency, respond=_master_respond),
+        tools=[tool.model_copy(update={"coroutine": None}) for tool in SUB_AGENT_TOOLS],
+    )
+    # 요청마다 질문을 다르게 해 서브 에이전트 응답 캐시가 측정에 끼어들지 않게 한다.
+    question_ids = itertools.count()
+
+    def request() -> dict:
+        return {"messages": [{"role": "user", "content": f"multi-part question {next(question_ids)}"}]}
+
+    async def capped(agent, limit: int) -> None:
+        # 그래프 전체를 제한하는 config의 max_concurrency가 아니라 서브 에이전트 상한만 바꾼다.
+        previous = sub_agent.SUB_AGENT_MAX_CONCURRENCY
+        sub_agent.SUB_AGENT_MAX_CONCURRENCY = limit
+        try:
+            await agent.ainvoke(request())
+        finally:
+            sub_agent.SUB_AGENT_MAX_CONCURRENCY = previous
+
+    async def concurrent(agent) -> None:
+        await asyncio.gather(*(agent.ainvoke(request()) for _ in range(args.requests)))
+
+    results = {
+        "sequential": _measure(lambda: [tool.func(input_text=f"q {next(question_ids)}") for tool in SUB_AGENT_TOOLS], args.iterations),
+        "invoke": _measure(lambda: master.invoke(request()), args.iterations),
+        "ainvoke thread": _measure(lambda: asyncio.run(thread_master.ainvoke(request())), args.iterations),
+        "ainvoke": _measure(lambda: asyncio.run(master.ainvoke(request())), args.iterations),
+        "ainvoke cap=1": _measure(lambda: asyncio.run(capped(master, 1)), args.iterations),
+        f"thread x{args.requests}": _measure(lambda: asyncio.run(concurrent(thread_master)), args.iterations),
+        f"ainvoke x{args.requests}": _measure(lambda: asyncio.run(concurrent(master)), args.iterations),
+    }
+    print(f"sub-agent latency={args.latency}s x {len(SUB_AGENT_TOOLS)}, master latency={args.master_latency}s x 2")
+    for label, seconds in results.items():
+        print(f"{label:<15} {seconds:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
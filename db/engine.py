@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+DB_PATH = Path(__file__).parent / "data.db"
+
+# Per-connection tuning, overridable through the environment.
+# cache_size < 0 is in KiB (SQLite convention), so -65536 is a 64 MiB page cache.
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))
+SQLITE_MAX_OVERFLOW = int(os.getenv("SQLITE_MAX_OVERFLOW", "8"))
+
+
+def memory_db_uri(name: str) -> str:
+    """URI of a named shared-cache in-memory database that every connection in the process can open."""
+    return f"file:{name}?mode=memory&cache=shared"
+
+
+def is_memory_db(db_path: Path | str) -> bool:
+    return str(db_path).startswith("file:") and "mode=memory" in str(db_path)
+
+
+def create_sqlite_engine(
+    db_path: Path | str = DB_PATH,
+    read_only: bool = False,
+    cache_size: int = SQLITE_CACHE_SIZE,
+    mmap_size: int = SQLITE_MMAP_SIZE,
+    temp_store: str = SQLITE_TEMP_STORE,
+    busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+) -> Engine:
+    """
+    Create a pooled SQLite engine with the project-wide PRAGMA settings.
+
+    Writable engines switch the database to WAL so that readers never block on the writer.
+    Read-only engines open the file with `mode=ro`, so tools cannot modify data and many
+    pooled connections can read in parallel (from Streamlit sessions or LangGraph workers).
+
+    `db_path` may also be a memory_db_uri(); such a database has no journal file, and
+    read-only engines enforce read-only access with PRAGMA query_only instead of `mode=ro`.
+    """
+    in_memory = is_memory_db(db_path)
+    if in_memory:
+        url = f"sqlite:///{db_path}&uri=true"
+    elif read_only:
+        url = f"sqlite:///file:{Path(db_path)}?mode=ro&uri=true"
+    else:
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        url = f"sqlite:///{db_path}"
+
+    engine = create_engine(
+        url,
+        echo=False,
+        future=True,
+        # SQLAlchemy would pick a single-connection pool for in-memory URIs; a shared-cache
+        # in-memory database can serve many connections just like a file.
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=False,
+        connect_args={"check_same_thread": False, "timeout": busy_timeout_ms / 1000},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if in_memory:
+                if read_only:
+                    cursor.execute("PRAGMA query_only=ON")
+            elif not read_only:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                # NORMAL is durable across application crashes in WAL mode and avoids an fsync per commit.
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            cursor.execute(f"PRAGMA cache_size={int(cache_size)}")
+            cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            cursor.execute(f"PRAGMA temp_store={temp_store}")
+        finally:
+            cursor.close()
+
+    return engine
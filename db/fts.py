@@ -0,0 +1,109 @@
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.engine import Connection, Engine
+
+# Text columns mirrored into an FTS5 shadow index, per table.
+FTS_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "departments": ("name", "location"),
+    "employees": ("name", "email", "title"),
+    "products": ("name", "category"),
+    "clients": ("name", "industry", "city"),
+    "projects": ("name",),
+    "meetings": ("topic",),
+}
+
+FTS_SUFFIX = "_fts"
+# The trigram tokenizer indexes every 3-character window, so it matches substrings of
+# mixed Korean/English text without word segmentation and can serve LIKE '%term%'.
+# Terms shorter than this cannot use the index and fall back to LIKE; when every term of
+# a search is that short (e.g. two-syllable Korean words like "분기 리뷰") the whole table
+# is scanned.
+FTS_MIN_TERM_LENGTH = 3
+
+# FTS5 keeps its index in these shadow tables next to the virtual table.
+_SHADOW_TABLE_PATTERN = re.compile(rf"{FTS_SUFFIX}(_data|_idx|_docsize|_config|_content)?$")
+
+
+def fts_table_name(table_name: str) -> str:
+    return f"{table_name}{FTS_SUFFIX}"
+
+
+def is_fts_table(table_name: str) -> bool:
+    """FTS 가상 테이블 또는 그 shadow 테이블이면 True. 스키마 리플렉션에서 제외하는 데 쓴다."""
+    return _SHADOW_TABLE_PATTERN.search(table_name) is not None
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _create_statements(table_name: str, columns: Tuple[str, ...]) -> list[str]:
+    """external content FTS5 테이블과 원본 테이블을 따라가는 INSERT/DELETE/UPDATE 트리거 DDL."""
+    fts = fts_table_name(table_name)
+    column_list = ", ".join(_quote(col) for col in columns)
+    new_values = ", ".join(f"new.{_quote(col)}" for col in columns)
+    old_values = ", ".join(f"old.{_quote(col)}" for col in columns)
+    insert_new = f"INSERT INTO {_quote(fts)}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    delete_old = (
+        f"INSERT INTO {_quote(fts)}({_quote(fts)}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {_quote(fts)} USING fts5("
+        f"{column_list}, content={_quote(table_name)}, content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote(fts + '_ai')} AFTER INSERT ON {_quote(table_name)} BEGIN "
+        f"{insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote(fts + '_ad')} AFTER DELETE ON {_quote(table_name)} BEGIN "
+        f"{delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {_quote(fts + '_au')} AFTER UPDATE ON {_quote(table_name)} BEGIN "
+        f"{delete_old} {insert_new} END",
+        # Index rows that already exist in the content table.
+        f"INSERT INTO {_quote(fts)}({_quote(fts)}) VALUES ('rebuild')",
+    ]
+
+
+def create_fts_indexes(engine: Engine, tables: Optional[Iterable[str]] = None) -> list[str]:
+    """
+    Create FTS5 trigram indexes (and their sync triggers) for the configured text columns.
+
+    Safe to re-run: existing indexes are rebuilt from their content tables. Returns the
+    names of the FTS tables that were created or rebuilt.
+    """
+    selected = list(tables) if tables is not None else list(FTS_COLUMNS)
+    created: list[str] = []
+    with engine.begin() as conn:
+        existing = {
+            row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for table_name in selected:
+            if table_name not in existing:
+                continue
+            for statement in _create_statements(table_name, FTS_COLUMNS[table_name]):
+                conn.exec_driver_sql(statement)
+            created.append(fts_table_name(table_name))
+    return created
+
+
+def drop_fts_indexes(engine: Engine) -> None:
+    """Drop every FTS index and its triggers, e.g. before a bulk load that should not pay trigger costs."""
+    with engine.begin() as conn:
+        for table_name in FTS_COLUMNS:
+            fts = fts_table_name(table_name)
+            for suffix in ("_ai", "_ad", "_au"):
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {_quote(fts + suffix)}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {_quote(fts)}")
+
+
+def get_fts_columns(conn: Connection) -> Dict[str, Tuple[str, ...]]:
+    """DB에 실제로 존재하는 FTS 인덱스를 {원본 테이블: 인덱싱된 컬럼} 형태로 반환."""
+    indexed: Dict[str, Tuple[str, ...]] = {}
+    rows = conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%fts5%'"
+    ).fetchall()
+    for (fts,) in rows:
+        if not fts.endswith(FTS_SUFFIX):
+            continue
+        table_name = fts[: -len(FTS_SUFFIX)]
+        columns = conn.exec_driver_sql(f"PRAGMA table_info({_quote(fts)})").fetchall()
+        indexed[table_name] = tuple(col[1] for col in columns)
+    return indexed
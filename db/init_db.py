@@ -1,8 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timedelta
 from pathlib import Path
-from datetime import datetime, timezone
+from typing import Optional, Union
+import sqlite3
+import tempfile
+import time
 
 from sqlalchemy import (
-    create_engine,
     Column,
     Integer,
     String,
@@ -10,21 +16,25 @@ from sqlalchemy import (
     DateTime,
 )
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
-import random
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
 
+from db import engine as db_engine, fts as fts_module, sample_data
+from db.engine import DB_PATH, create_sqlite_engine, is_memory_db
+from db.fts import create_fts_indexes, drop_fts_indexes
 from db.sample_data import (
-    generate_departments,
-    generate_employees,
-    generate_products,
-    generate_clients,
-    generate_contracts,
-    generate_invoices,
-    generate_projects,
-    generate_meetings,
-    generate_project_assignments,
+    DEFAULT_SEED,
+    OWNER_TITLES,
+    SALES_TITLES,
+    TABLE_COLUMNS,
+    TABLE_ORDER,
+    GenerationPlan,
+    build_plan,
+    iter_table,
+    scaled_row_counts,
 )
+from db.snapshot import SNAPSHOT_DIR, clone_file, load_into_memory, snapshot_key, snapshot_path, store_snapshot
 
-DB_PATH = Path(__file__).parent / "data.db"
 Base = declarative_base()
 _ENGINE = None
 SessionLocal = None
@@ -33,11 +43,21 @@ SessionLocal = None
 def _get_engine():
     global _ENGINE, SessionLocal
     if _ENGINE is None:
-        _ENGINE = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
+        _ENGINE = create_sqlite_engine(DB_PATH)
         SessionLocal = sessionmaker(bind=_ENGINE, expire_on_commit=False, future=True)
     return _ENGINE
 
 
+def use_database(db_path: Union[Path, str]) -> None:
+    """Point this module at another database file or a memory_db_uri(); later calls use it."""
+    global DB_PATH, _ENGINE, SessionLocal
+    if _ENGINE is not None:
+        _ENGINE.dispose()
+    DB_PATH = db_path if is_memory_db(db_path) else Path(db_path)
+    _ENGINE = None
+    SessionLocal = None
+
+
 def get_session() -> Session:
     if SessionLocal is None:
         _get_engine()
@@ -63,7 +83,7 @@ class Employee(Base):
     name = Column(String, nullable=False)
     email = Column(String, nullable=False, unique=True)
     title = Column(String, nullable=False)
-    department_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"))
+    department_id = Column(Integer, ForeignKey("departments.id", ondelete="SET NULL"), index=True)
     created_at = Column(DateTime(timezone=True), nullable=False)
 
     department = relationship("Department", back_populates="employees")
@@ -91,13 +111,13 @@ class Client(Base):
 class Contract(Base):
     __tablename__ = "contracts"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
-    sales_rep_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"))
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
+    sales_rep_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"), index=True)
     amount = Column(Integer, nullable=False)
     term = Column(String, nullable=False)  # e.g., "12 months"
-    status = Column(String, nullable=False)  # active, pending, closed
-    created_at = Column(DateTime(timezone=True), nullable=False)
+    status = Column(String, nullable=False, index=True)  # active, pending, closed
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
     client = relationship("Client")
     product = relationship("Product")
@@ -107,11 +127,11 @@ class Contract(Base):
 class Invoice(Base):
     __tablename__ = "invoices"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="CASCADE"), nullable=False)
+    contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="CASCADE"), nullable=False, index=True)
     amount_due = Column(Integer, nullable=False)
     amount_paid = Column(Integer, nullable=False)
     method = Column(String, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
     contract = relationship("Contract")
 
@@ -120,10 +140,10 @@ class Project(Base):
     __tablename__ = "projects"
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False)
-    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
-    owner_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"))
-    phase = Column(String, nullable=False)  # PoC, Pilot, Production
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"), index=True)
+    phase = Column(String, nullable=False, index=True)  # PoC, Pilot, Production
     created_at = Column(DateTime(timezone=True), nullable=False)
 
     client = relationship("Client")
@@ -134,10 +154,10 @@ class Project(Base):
 class Meeting(Base):
     __tablename__ = "meetings"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
-    host_employee_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"))
+    client_id = Column(Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True)
+    host_employee_id = Column(Integer, ForeignKey("employees.id", ondelete="SET NULL"), index=True)
     topic = Column(String, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
     client = relationship("Client")
     host = relationship("Employee")
@@ -146,8 +166,8 @@ class Meeting(Base):
 class ProjectAssignment(Base):
     __tablename__ = "project_assignments"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), nullable=False, index=True)
     role = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False)
 
@@ -155,220 +175,520 @@ class ProjectAssignment(Base):
     employee = relationship("Employee")
 
 
-# Defaults: keep each table between 10 and 30 rows
-DEFAULT_DEPARTMENTS = 10
-DEFAULT_EMPLOYEES = 30
-DEFAULT_PRODUCTS = 12
-DEFAULT_CLIENTS = 20
-DEFAULT_CONTRACTS = 25
-DEFAULT_INVOICES = 25
-DEFAULT_PROJECTS = 20
-DEFAULT_MEETINGS = 20
-DEFAULT_ASSIGNMENTS = 60
+def _remove_db_files(db_path: Path) -> None:
+    for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        if path.exists():
+            path.unlink()
 
 
-def reset_db() -> None:
-    if DB_PATH.exists():
-        DB_PATH.unlink()
-    engine = _get_engine()
-    Base.metadata.create_all(engine)
+def _sorted_indexes(table) -> list:
+    # Table.indexes is a set; a fixed order keeps the schema (and so the file bytes) reproducible.
+    return sorted(table.indexes, key=lambda index: index.name)
 
 
-def _index_by_name(items, key):
-    return {x[key]: x for x in items}
+def _create_schema(engine) -> None:
+    """
+    Create every table and index in a fixed order.
 
+    metadata.create_all() emits each table's indexes in set order, which differs between
+    processes, and the root pages they get decide the layout of everything loaded later.
+    """
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+            for index in _sorted_indexes(table):
+                conn.execute(CreateIndex(index))
 
-def insert_data_into_db(
-    departments_count: int = DEFAULT_DEPARTMENTS,
-    employees_count: int = DEFAULT_EMPLOYEES,
-    products_count: int = DEFAULT_PRODUCTS,
-    clients_count: int = DEFAULT_CLIENTS,
-    contracts_count: int = DEFAULT_CONTRACTS,
-    invoices_count: int = DEFAULT_INVOICES,
-    projects_count: int = DEFAULT_PROJECTS,
-    meetings_count: int = DEFAULT_MEETINGS,
-    assignments_count: int = DEFAULT_ASSIGNMENTS,
-) -> None:
-    random.seed(42)
-    now = datetime.now(timezone.utc)
-    with get_session() as session:
-        # Departments
-        dept_data = generate_departments(departments_count)
-        dept_objs: dict[str, Department] = {}
-        for d in dept_data:
-            obj = Department(name=d["name"], location=d["location"], created_at=now)
-            session.add(obj)
-            dept_objs[d["name"]] = obj
-        session.flush()
-
-        # Employees
-        emp_data = generate_employees(employees_count, dept_data)
-        emp_objs: dict[str, Employee] = {}
-        for e in emp_data:
-            dep = dept_objs.get(e["department_name"])  # type: ignore
-            obj = Employee(
-                name=e["name"],
-                email=e["email"],
-                title=e["title"],
-                department_id=dep.id if dep else None,
-                created_at=now,
-            )
-            session.add(obj)
-            emp_objs[e["email"]] = obj
-        session.flush()
-
-        # Products
-        prod_data = generate_products(products_count)
-        prod_objs: dict[str, Product] = {}
-        for p in prod_data:
-            obj = Product(
-                name=p["name"],
-                category=p["category"],
-                price=p["price"],
-                billing=p["billing"],
-                created_at=now,
-            )
-            session.add(obj)
-            prod_objs[p["name"]] = obj
-        session.flush()
-
-        # Clients
-        client_data = generate_clients(clients_count)
-        client_objs: dict[str, Client] = {}
-        for c in client_data:
-            obj = Client(
-                name=c["name"],
-                industry=c["industry"],
-                city=c["city"],
-                created_at=now,
-            )
-            session.add(obj)
-            client_objs[c["name"]] = obj
-        session.flush()
-
-        # Contracts
-        contract_data = generate_contracts(contracts_count, client_data, prod_data, emp_data)
-        contract_objs: list[Contract] = []
-        for ct in contract_data:
-            obj = Contract(
-                client_id=client_objs[ct["client_name"]].id,
-                product_id=prod_objs[ct["product_name"]].id,
-                sales_rep_id=emp_objs.get(ct["sales_rep_email"]).id if emp_objs.get(ct["sales_rep_email"]) else None,
-                amount=ct["amount"],
-                term=ct["term"],
-                status=ct["status"],
-                created_at=now,
-            )
-            session.add(obj)
-            contract_objs.append(obj)
-        session.flush()
-
-        # Invoices
-        invoice_data = generate_invoices(invoices_count, contract_data)
-        for inv in invoice_data:
-            # find matching contract by client+product
-            match = next(
-                (
-                    c
-                    for c in contract_objs
-                    if c.client.name == inv["contract_client_name"] and c.product.name == inv["contract_product_name"]
-                ),
-                None,
-            )
-            if match is None:
-                continue
-            obj = Invoice(
-                contract_id=match.id,
-                amount_due=inv["amount_due"],
-                amount_paid=inv["amount_paid"],
-                method=inv["method"],
-                created_at=now,
-            )
-            session.add(obj)
-        session.flush()
-
-        # Projects
-        proj_data = generate_projects(projects_count, client_data, prod_data, emp_data)
-        for pr in proj_data:
-            obj = Project(
-                name=pr["name"],
-                client_id=client_objs[pr["client_name"]].id,
-                product_id=prod_objs[pr["product_name"]].id,
-                owner_id=emp_objs.get(pr["owner_email"]).id if emp_objs.get(pr["owner_email"]) else None,
-                phase=pr["phase"],
-                created_at=now,
-            )
-            session.add(obj)
-        session.flush()
-
-        # Meetings
-        mtg_data = generate_meetings(meetings_count, client_data, emp_data)
-        for m in mtg_data:
-            obj = Meeting(
-                client_id=client_objs[m["client_name"]].id,
-                host_employee_id=emp_objs.get(m["host_email"]).id if emp_objs.get(m["host_email"]) else None,
-                topic=m["topic"],
-                created_at=now,
-            )
-            session.add(obj)
-
-        session.flush()
-
-        # Project Assignments (many-to-many participation)
-        # build lightweight dicts for generator
-        proj_light = [
-            {
-                "name": p.name,
-                "owner_email": next((e for e_email, e in emp_objs.items() if e.id == p.owner_id), None)
-                and next((email for email, e in emp_objs.items() if e.id == p.owner_id), None),
-            }
-            for p in session.query(Project).all()
-        ]
-        emp_light = [{"email": email} for email in emp_objs.keys()]
-        assign_data = generate_project_assignments(assignments_count, proj_light, emp_light)
-        name_to_project = {p.name: p for p in session.query(Project).all()}
-        for a in assign_data:
-            proj = name_to_project.get(a["project_name"])  # type: ignore
-            emp = emp_objs.get(a["employee_email"])  # type: ignore
-            if not proj or not emp:
-                continue
-            obj = ProjectAssignment(
-                project_id=proj.id,
-                employee_id=emp.id,
-                role=a["role"],
-                created_at=now,
+
+def reset_db() -> None:
+    if is_memory_db(DB_PATH):
+        # There is no file to delete; empty the shared in-memory database instead.
+        engine = _get_engine()
+        drop_fts_indexes(engine)
+        Base.metadata.drop_all(engine)
+        _create_schema(engine)
+        return
+    # Drop pooled connections first so the old file (and its WAL/SHM sidecars) can be removed.
+    if _ENGINE is not None:
+        _ENGINE.dispose()
+    _remove_db_files(DB_PATH)
+    engine = _get_engine()
+    _create_schema(engine)
+
+
+MODELS = {
+    "departments": Department,
+    "employees": Employee,
+    "products": Product,
+    "clients": Client,
+    "contracts": Contract,
+    "invoices": Invoice,
+    "projects": Project,
+    "meetings": Meeting,
+    "project_assignments": ProjectAssignment,
+}
+
+
+def _bulk_insert(conn, model, columns: tuple[str, ...], batches) -> int:
+    """
+    Insert batches of row tuples (ordered like `columns`), one executemany() per batch.
+
+    Rows go straight to the DBAPI cursor, skipping SQLAlchemy's per-row parameter
+    processing, so values must already be in their stored form. Returns the row count.
+    """
+    table = model.__table__
+    statement = (
+        f'INSERT INTO "{table.name}" ({", ".join(columns)}) VALUES ({", ".join("?" for _ in columns)})'
+    )
+    written = 0
+    for batch in batches:
+        if batch:
+            conn.exec_driver_sql(statement, batch)
+            written += len(batch)
+    return written
+
+
+@contextmanager
+def _bulk_load_connection():
+    """
+    Yield a connection with durability turned off for the duration of a bulk load.
+
+    The rollback journal and fsyncs only matter if the load is interrupted, and a
+    half-seeded database is rebuilt from scratch anyway. WAL mode and the normal
+    synchronous level are restored before the connection is returned.
+    """
+    engine = _get_engine()
+    # Leaving WAL mode requires that no other connection has the database open.
+    engine.dispose()
+    indexes = [index for table in Base.metadata.sorted_tables for index in _sorted_indexes(table)]
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        # Building each secondary index once over sorted data beats maintaining it row by row.
+        for index in indexes:
+            index.drop(conn, checkfirst=True)
+        conn.commit()
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+            for index in indexes:
+                index.create(conn, checkfirst=True)
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+            conn.commit()
+
+
+def insert_plan(plan: GenerationPlan) -> dict[str, int]:
+    """
+    Generate and insert every table of a plan in a single transaction, in FK order.
+
+    Rows are streamed chunk by chunk from db.sample_data, so memory use stays flat
+    regardless of the plan size. Returns the number of rows written per table.
+    """
+    counts: dict[str, int] = {}
+    with _bulk_load_connection() as conn, conn.begin():
+        for table in TABLE_ORDER:
+            counts[table] = _bulk_insert(conn, MODELS[table], TABLE_COLUMNS[table], iter_table(plan, table))
+    return counts
+
+
+# Shards are merged through ATTACH, which must happen outside the load transaction,
+# so every shard has to be attached at once. SQLite allows 10 attached databases by default.
+MAX_WORKERS = 10
+
+
+def _shard_chunks(plan: GenerationPlan, table: str, shard: int, shards: int) -> range:
+    """Contiguous slice of a table's chunks assigned to one shard, so shards concatenate in id order."""
+    chunk_count = plan.chunk_count(table)
+    return range(chunk_count * shard // shards, chunk_count * (shard + 1) // shards)
+
+
+def _write_shard(plan: GenerationPlan, shard: int, shards: int, path: str) -> dict[str, int]:
+    """
+    Worker entry point: generate this shard's chunks of every table into a standalone SQLite file.
+
+    The shard only holds the tables (no secondary indexes) and is thrown away after the merge,
+    so it is written without a journal or fsyncs. Returns the rows written per table.
+    """
+    counts: dict[str, int] = {}
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN")
+        for table in TABLE_ORDER:
+            model_table = MODELS[table].__table__
+            conn.execute(str(CreateTable(model_table).compile(dialect=sqlite_dialect.dialect())))
+            columns = TABLE_COLUMNS[table]
+            statement = (
+                f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES ({", ".join("?" for _ in columns)})'
             )
-            session.add(obj)
+            counts[table] = 0
+            for batch in iter_table(plan, table, _shard_chunks(plan, table, shard, shards)):
+                conn.executemany(statement, batch)
+                counts[table] += len(batch)
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return counts
+
+
+def insert_plan_parallel(plan: GenerationPlan, workers: int) -> dict[str, int]:
+    """
+    Generate a plan in `workers` processes and merge the shards into the database.
+
+    Each worker writes a contiguous range of every table's chunks into its own shard
+    file. The parent attaches all shards and copies them with INSERT ... SELECT, table
+    by table in FK order and shard by shard in id order, inside the same single
+    transaction insert_plan() uses. Since chunk generation is deterministic and rows
+    reach the database in the same order, the resulting file is byte-for-byte
+    identical to a single-worker run.
+    """
+    if not 1 <= workers <= MAX_WORKERS:
+        raise ValueError(f"workers must be between 1 and {MAX_WORKERS}, got {workers}")
+
+    counts = {table: 0 for table in TABLE_ORDER}
+    shard_dir = None if is_memory_db(DB_PATH) else DB_PATH.parent
+    with tempfile.TemporaryDirectory(prefix="seed-shards-", dir=shard_dir) as tmp:
+        paths = [str(Path(tmp) / f"shard_{shard}.db") for shard in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_write_shard, plan, shard, workers, path) for shard, path in enumerate(paths)]
+            for future in futures:
+                future.result()
+
+        with _bulk_load_connection() as conn:
+            for shard, path in enumerate(paths):
+                conn.exec_driver_sql(f"ATTACH DATABASE ? AS shard_{shard}", (path,))
+            conn.commit()
+            try:
+                with conn.begin():
+                    for table in TABLE_ORDER:
+                        columns = ", ".join(TABLE_COLUMNS[table])
+                        for shard in range(workers):
+                            result = conn.exec_driver_sql(
+                                f'INSERT INTO main."{table}" ({columns}) '
+                                f'SELECT {columns} FROM shard_{shard}."{table}" ORDER BY id'
+                            )
+                            counts[table] += result.rowcount
+            finally:
+                for shard in range(workers):
+                    conn.exec_driver_sql(f"DETACH DATABASE shard_{shard}")
+                conn.commit()
+    return counts
 
-        session.commit()
+
+def insert_data_into_db(
+    departments_count: Optional[int] = None,
+    employees_count: Optional[int] = None,
+    products_count: Optional[int] = None,
+    clients_count: Optional[int] = None,
+    contracts_count: Optional[int] = None,
+    invoices_count: Optional[int] = None,
+    projects_count: Optional[int] = None,
+    meetings_count: Optional[int] = None,
+    assignments_count: Optional[int] = None,
+    *,
+    scale_factor: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    workers: int = 1,
+) -> dict[str, int]:
+    """
+    Seed every table with generated data.
+
+    Row counts scale linearly with `scale_factor` (1.0 is a small demo dataset, see
+    db.sample_data.BASE_ROW_COUNTS); any *_count argument overrides its table's count.
+    The same arguments always produce the same rows; with workers > 1 generation is
+    spread over that many processes and the resulting file is identical to a
+    single-worker run. Returns the rows written per table.
+    """
+    plan = build_plan(
+        scale_factor,
+        seed,
+        overrides={
+            "departments": departments_count,
+            "employees": employees_count,
+            "products": products_count,
+            "clients": clients_count,
+            "contracts": contracts_count,
+            "invoices": invoices_count,
+            "projects": projects_count,
+            "meetings": meetings_count,
+            "project_assignments": assignments_count,
+        },
+    )
+    if workers > 1:
+        return insert_plan_parallel(plan, workers)
+    return insert_plan(plan)
+
+
+# Tables that grow in append mode; the rest (people, catalogs, clients, projects) stay fixed.
+APPEND_TABLES = ("contracts", "invoices", "meetings", "project_assignments")
+
+
+def build_append_plan(
+    counts: dict[str, int], span: timedelta = timedelta(days=30), seed: int = DEFAULT_SEED
+) -> GenerationPlan:
+    """
+    Plan for adding `counts` rows on top of the current database.
+
+    New ids continue after each table's max id, foreign keys point at existing rows
+    (contracts go to existing sales reps, invoices bill contracts of the same batch), and
+    created_at is spread over `span` starting right after the latest created_at in any
+    append table, so new rows are always newer than every existing one. Since the rng of
+    each chunk is seeded with the table's first id, every batch differs while the same
+    database state always yields the same batch.
+    """
+    with _get_engine().connect() as conn:
+        max_ids = {
+            table: conn.exec_driver_sql(f'SELECT COALESCE(MAX(id), 0) FROM "{table}"').scalar() for table in TABLE_ORDER
+        }
+        latest = max(
+            (conn.exec_driver_sql(f'SELECT MAX(created_at) FROM "{table}"').scalar() or "" for table in APPEND_TABLES),
+            default="",
+        )
+        employees = conn.exec_driver_sql("SELECT id, title FROM employees ORDER BY id").fetchall()
+        products = conn.exec_driver_sql("SELECT name, price FROM products ORDER BY id").fetchall()
+
+    start = datetime.fromisoformat(latest) + timedelta(seconds=1) if latest else datetime.now().replace(microsecond=0)
+    return GenerationPlan(
+        counts=tuple((table, counts.get(table, 0)) for table in TABLE_ORDER),
+        seed=seed,
+        start=start,
+        end=start + span,
+        first_ids=tuple((table, max_id + 1) for table, max_id in max_ids.items()),
+        # Ids are assigned densely, so the max id is also the number of rows a foreign key may reference.
+        existing_counts=tuple(max_ids.items()),
+        existing_sales_reps=tuple(employee_id for employee_id, title in employees if title in SALES_TITLES),
+        existing_owners=tuple(employee_id for employee_id, title in employees if title in OWNER_TITLES),
+        existing_products=tuple((name, price) for name, price in products),
+    )
+
+
+def append_data(
+    scale_factor: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    span: timedelta = timedelta(days=30),
+    counts: Optional[dict[str, Optional[int]]] = None,
+) -> dict[str, int]:
+    """
+    Append new contracts, invoices, meetings and project assignments to the existing data.
+
+    Row counts follow `scale_factor` like a full seed (overridable per table through
+    `counts`). Unlike insert_plan(), the rows go in through an ordinary transaction with
+    WAL and every index in place, so concurrent readers keep working and see the batch
+    atomically. Returns the rows written per table.
+    """
+    scaled = scaled_row_counts(scale_factor, counts)
+    plan = build_append_plan({table: scaled[table] for table in APPEND_TABLES}, span, seed)
+    written: dict[str, int] = {}
+    with _get_engine().begin() as conn:
+        for table in APPEND_TABLES:
+            written[table] = _bulk_insert(conn, MODELS[table], TABLE_COLUMNS[table], iter_table(plan, table))
+    return written
+
+
+def trickle(
+    interval: float,
+    batches: Optional[int] = None,
+    scale_factor: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    counts: Optional[dict[str, Optional[int]]] = None,
+    on_batch=None,
+) -> int:
+    """
+    Periodically append a small batch, simulating a production database that grows while agents read it.
+
+    Every `interval` seconds one append_data() batch is committed whose created_at values
+    advance by `interval` as well. Runs `batches` times (forever if None) and returns the
+    number of batches written; `on_batch(index, written)` is called after each commit.
+    """
+    written_batches = 0
+    next_run = time.monotonic()
+    while batches is None or written_batches < batches:
+        written = append_data(scale_factor, seed, timedelta(seconds=interval), counts)
+        written_batches += 1
+        if on_batch is not None:
+            on_batch(written_batches, written)
+        next_run += interval
+        time.sleep(max(0.0, next_run - time.monotonic()))
+    return written_batches
+
+
+def database_snapshot_key(plan: GenerationPlan, fts: bool = True) -> str:
+    """
+    Snapshot key of the database a plan produces.
+
+    Covers the plan, the generator source and the schema DDL, so editing either one
+    invalidates old snapshots. The worker count is left out because it does not change
+    the output.
+    """
+    dialect = sqlite_dialect.dialect()
+    schema = "\n".join(
+        str(ddl.compile(dialect=dialect))
+        for table in Base.metadata.sorted_tables
+        for ddl in [CreateTable(table), *(CreateIndex(index) for index in _sorted_indexes(table))]
+    )
+    sources = [Path(sample_data.__file__)] + ([Path(fts_module.__file__)] if fts else [])
+    return snapshot_key({"plan": asdict(plan), "fts": fts}, sources, schema)
+
+
+def _build_snapshot(plan: GenerationPlan, key: str, workers: int, fts: bool) -> Path:
+    """Generate a plan into a scratch file and store it as the snapshot for `key`."""
+    previous = DB_PATH
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="build-", dir=SNAPSHOT_DIR) as tmp:
+        use_database(Path(tmp) / "build.db")
+        try:
+            reset_db()
+            if workers > 1:
+                insert_plan_parallel(plan, workers)
+            else:
+                insert_plan(plan)
+            if fts:
+                create_fts_indexes(_get_engine())
+            _get_engine().dispose()
+            return store_snapshot(DB_PATH, key)
+        finally:
+            use_database(previous)
+
+
+def prepare_database(
+    plan: Optional[GenerationPlan] = None,
+    workers: int = 1,
+    fts: bool = True,
+    in_memory: Optional[str] = None,
+    db_path: Optional[Path] = None,
+) -> Union[Path, str]:
+    """
+    Make the database for `plan` available, generating it only if no snapshot exists yet.
+
+    Generated databases are cached in SNAPSHOT_DIR under database_snapshot_key(). The
+    snapshot is then either cloned over `db_path` (a reflink where the filesystem supports
+    it; defaults to the current file DB_PATH) or, with `in_memory`, loaded through the
+    backup API into the shared-cache in-memory database of that name. This module is
+    switched to the result, which is returned so other modules can follow, e.g.
+    `tools.db_tool.use_database(prepare_database(plan, in_memory="bench"))`.
+    """
+    plan = plan or build_plan()
+    key = database_snapshot_key(plan, fts)
+    path = snapshot_path(key)
+    if not path.exists():
+        path = _build_snapshot(plan, key, workers, fts)
+
+    if in_memory is not None:
+        target = load_into_memory(path, in_memory)
+    else:
+        if db_path is not None:
+            target = Path(db_path)
+        else:
+            target = db_engine.DB_PATH if is_memory_db(DB_PATH) else DB_PATH
+        if _ENGINE is not None:
+            _ENGINE.dispose()
+        _remove_db_files(target)
+        clone_file(path, target)
+    use_database(target)
+    return target
 
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Reset and seed SQLite DB with realistic B2B AI company data.")
-    parser.add_argument("--departments", type=int, default=DEFAULT_DEPARTMENTS)
-    parser.add_argument("--employees", type=int, default=DEFAULT_EMPLOYEES)
-    parser.add_argument("--products", type=int, default=DEFAULT_PRODUCTS)
-    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS)
-    parser.add_argument("--contracts", type=int, default=DEFAULT_CONTRACTS)
-    parser.add_argument("--invoices", type=int, default=DEFAULT_INVOICES)
-    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS)
-    parser.add_argument("--meetings", type=int, default=DEFAULT_MEETINGS)
-    parser.add_argument("--assignments", type=int, default=DEFAULT_ASSIGNMENTS)
+    parser.add_argument(
+        "--scale-factor", type=float, default=1.0, help="Multiplier for the row counts of every scaling table."
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--workers", type=int, default=1, help=f"Generator processes (1-{MAX_WORKERS}); output is identical for any value."
+    )
+    parser.add_argument("--departments", type=int)
+    parser.add_argument("--employees", type=int)
+    parser.add_argument("--products", type=int)
+    parser.add_argument("--clients", type=int)
+    parser.add_argument("--contracts", type=int)
+    parser.add_argument("--invoices", type=int)
+    parser.add_argument("--projects", type=int)
+    parser.add_argument("--meetings", type=int)
+    parser.add_argument("--assignments", type=int)
+    parser.add_argument("--no-fts", action="store_true", help="Skip building FTS5 full-text indexes.")
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Add contracts, invoices, meetings and assignments to the existing DB instead of resetting it.",
+    )
+    parser.add_argument(
+        "--append-days", type=float, default=30, help="Days of created_at covered by one --append batch."
+    )
+    parser.add_argument(
+        "--trickle",
+        type=float,
+        metavar="SECONDS",
+        help="Keep appending one batch every SECONDS seconds (implies --append).",
+    )
+    parser.add_argument("--batches", type=int, help="Stop --trickle after this many batches.")
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help=f"Reuse (or create) a prebuilt snapshot in {SNAPSHOT_DIR} instead of always regenerating.",
+    )
     args = parser.parse_args()
 
-    reset_db()
-    insert_data_into_db(
-        departments_count=args.departments,
-        employees_count=args.employees,
-        products_count=args.products,
-        clients_count=args.clients,
-        contracts_count=args.contracts,
-        invoices_count=args.invoices,
-        projects_count=args.projects,
-        meetings_count=args.meetings,
-        assignments_count=args.assignments,
+    plan = build_plan(
+        args.scale_factor,
+        args.seed,
+        overrides={
+            "departments": args.departments,
+            "employees": args.employees,
+            "products": args.products,
+            "clients": args.clients,
+            "contracts": args.contracts,
+            "invoices": args.invoices,
+            "projects": args.projects,
+            "meetings": args.meetings,
+            "project_assignments": args.assignments,
+        },
     )
-    total_tables = 9
-    print(f"Seeded DB at {DB_PATH} with realistic data across {total_tables} tables.")
+    overrides = {
+        "contracts": args.contracts,
+        "invoices": args.invoices,
+        "meetings": args.meetings,
+        "project_assignments": args.assignments,
+    }
+    if args.trickle is not None:
+        print(f"Trickling into {DB_PATH} every {args.trickle:g}s (Ctrl+C to stop).")
+
+        def _report(index: int, written: dict[str, int]) -> None:
+            print(f"batch {index}: " + ", ".join(f"{table}={count}" for table, count in written.items()), flush=True)
+
+        try:
+            trickle(args.trickle, args.batches, args.scale_factor, args.seed, overrides, on_batch=_report)
+        except KeyboardInterrupt:
+            pass
+    elif args.append:
+        start = time.perf_counter()
+        written = append_data(args.scale_factor, args.seed, timedelta(days=args.append_days), overrides)
+        print(
+            f"Appended to DB at {DB_PATH}: "
+            + ", ".join(f"{table}={count:,}" for table, count in written.items())
+            + f" in {time.perf_counter() - start:.2f}s."
+        )
+    elif args.snapshot:
+        start = time.perf_counter()
+        cached = snapshot_path(database_snapshot_key(plan, fts=not args.no_fts)).exists()
+        prepare_database(plan, workers=args.workers, fts=not args.no_fts)
+        source = "restored from snapshot" if cached else "generated and snapshotted"
+        print(f"DB at {DB_PATH} {source} in {time.perf_counter() - start:.2f}s.")
+    else:
+        reset_db()
+        start = time.perf_counter()
+        counts = insert_plan_parallel(plan, args.workers) if args.workers > 1 else insert_plan(plan)
+        elapsed = time.perf_counter() - start
+        if not args.no_fts:
+            # Built after seeding so the bulk load does not pay per-row trigger costs.
+            create_fts_indexes(_get_engine())
+        total_tables = 9
+        print(
+            f"Seeded DB at {DB_PATH} with realistic data across {total_tables} tables "
+            f"({sum(counts.values()):,} rows in {elapsed:.2f}s)."
+        )
@@ -1,8 +1,18 @@
 import random
-from typing import List, Dict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 # ----- Generators for realistic B2B AI company -----
+#
+# Every table is generated in fixed-size chunks. Chunk k of a table is produced by its own
+# random.Random seeded from (seed, table, k), and row ids are derived from the chunk index,
+# so any chunk can be generated on its own, in any order or process, with identical output.
+# Foreign keys are drawn as ids from the referenced table's id range, and rows that depend on
+# another table's values (invoice amounts, project names, owner assignments) regenerate the
+# referenced chunk instead of keeping the whole table in memory.
 
 DEPARTMENTS = [
     {"name": "Research", "location": "Toronto"},
@@ -39,217 +49,465 @@ PRODUCT_CATALOG = [
     },
 ]
 
+FIRST_NAMES = [
+    "Minji",
+    "Jiwon",
+    "Hyun",
+    "Sujin",
+    "Hana",
+    "Jisoo",
+    "Taeyang",
+    "Joon",
+    "Mingyu",
+    "Eunwoo",
+    "Seojin",
+    "Hyejin",
+    "Donghyun",
+    "Yuna",
+    "Sangmin",
+]
+LAST_NAMES = ["Park", "Kim", "Lee", "Choi", "Jung", "Kang", "Yoon", "Han"]
+TITLES = [
+    "Research Scientist",
+    "ML Engineer",
+    "Data Engineer",
+    "Product Manager",
+    "Sales Manager",
+    "Account Executive",
+    "Solutions Architect",
+    "Customer Success Manager",
+]
+SALES_TITLES = [t for t in TITLES if "Sales" in t or "Account" in t]
+OWNER_TITLES = [t for t in TITLES if "Engineer" in t or "Scientist" in t or "Architect" in t]
+
+# Every first/last name pair in a fixed shuffled order; employee ids walk through it (see employee_profile).
+_NAME_PAIRS = [(first, last) for first in FIRST_NAMES for last in LAST_NAMES]
+random.Random("employee-names").shuffle(_NAME_PAIRS)
+
+INDUSTRIES = ["Retail", "Finance", "Healthcare", "Manufacturing", "Technology", "Energy"]
+CITIES = ["New York", "Chicago", "San Francisco", "Toronto", "Boston", "Seattle"]
+TERMS = ["12 months", "24 months", "6 months"]
+STATUSES = ["active", "pending", "closed"]
+METHODS = ["wire", "credit_card", "ach"]
+PHASES = ["PoC", "Pilot", "Production"]
+TOPICS = [
+    "Quarterly Business Review",
+    "Technical Architecture",
+    "Roadmap Alignment",
+    "Renewal Discussion",
+    "Pilot Feedback",
+    # Korean topics so that search_text and like filters are exercised on Korean text.
+    "분기 비즈니스 리뷰",
+    "기술 아키텍처 검토",
+    "갱신 협의",
+]
+ROLES = ["Owner", "Tech Lead", "Engineer", "Scientist", "Architect", "CSM"]
+PARTICIPANT_ROLES = [r for r in ROLES if r != "Owner"]
+
+# Columns of the row tuples yielded for each table, in insert order.
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "departments": ("id", "name", "location", "created_at"),
+    "employees": ("id", "name", "email", "title", "department_id", "created_at"),
+    "products": ("id", "name", "category", "price", "billing", "created_at"),
+    "clients": ("id", "name", "industry", "city", "created_at"),
+    "contracts": ("id", "client_id", "product_id", "sales_rep_id", "amount", "term", "status", "created_at"),
+    "invoices": ("id", "contract_id", "amount_due", "amount_paid", "method", "created_at"),
+    "projects": ("id", "name", "client_id", "product_id", "owner_id", "phase", "created_at"),
+    "meetings": ("id", "client_id", "host_employee_id", "topic", "created_at"),
+    "project_assignments": ("id", "project_id", "employee_id", "role", "created_at"),
+}
+# Foreign-key dependency order.
+TABLE_ORDER = list(TABLE_COLUMNS)
+
+# Row counts at scale factor 1. Departments and products are catalogs and do not scale.
+BASE_ROW_COUNTS: Dict[str, int] = {
+    "departments": 10,
+    "employees": 30,
+    "products": 12,
+    "clients": 20,
+    "contracts": 25,
+    "invoices": 25,
+    "projects": 20,
+    "meetings": 20,
+    "project_assignments": 60,
+}
+FIXED_TABLES = {"departments", "products"}
+
+DEFAULT_SEED = 42
+CHUNK_SIZE = 10_000
+
+# created_at values are spread over a fixed window so output does not depend on the clock.
+TIME_WINDOW_END = datetime(2025, 6, 30)
+TIME_WINDOW_DAYS = 3 * 365
+_EPOCH = datetime(1970, 1, 1)
+
+
+def scaled_row_counts(scale_factor: float = 1.0, overrides: Optional[Dict[str, Optional[int]]] = None) -> Dict[str, int]:
+    """Row counts per table for a scale factor; explicit overrides win."""
+    counts = {
+        table: base if table in FIXED_TABLES else max(1, round(base * scale_factor))
+        for table, base in BASE_ROW_COUNTS.items()
+    }
+    for table, count in (overrides or {}).items():
+        if count is not None:
+            counts[table] = count
+    return counts
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """
+    What to generate: row counts, seed and created_at window per table.
+
+    `first_ids` and `existing_counts` support generating rows on top of an existing
+    database: new ids start at first_ids[table], and foreign keys may point at any of
+    existing_counts[table] + counts[table] rows of the referenced table. The existing_*
+    pools describe rows already in the database that generated rows pick from by role
+    (sales reps for contracts, owners for projects, (name, price) per product id).
+    """
+
+    counts: Tuple[Tuple[str, int], ...]
+    seed: int = DEFAULT_SEED
+    start: datetime = TIME_WINDOW_END - timedelta(days=TIME_WINDOW_DAYS)
+    end: datetime = TIME_WINDOW_END
+    first_ids: Tuple[Tuple[str, int], ...] = field(default=())
+    existing_counts: Tuple[Tuple[str, int], ...] = field(default=())
+    existing_sales_reps: Tuple[int, ...] = field(default=())
+    existing_owners: Tuple[int, ...] = field(default=())
+    existing_products: Tuple[Tuple[str, int], ...] = field(default=())
+
+    def count(self, table: str) -> int:
+        return dict(self.counts).get(table, 0)
+
+    def first_id(self, table: str) -> int:
+        return dict(self.first_ids).get(table, 1)
+
+    def total(self, table: str) -> int:
+        """Rows of `table` that foreign keys may reference (existing + generated)."""
+        return dict(self.existing_counts).get(table, 0) + self.count(table)
+
+    def chunk_count(self, table: str) -> int:
+        return -(-self.count(table) // CHUNK_SIZE)
+
+
+def build_plan(
+    scale_factor: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    overrides: Optional[Dict[str, Optional[int]]] = None,
+) -> GenerationPlan:
+    counts = scaled_row_counts(scale_factor, overrides)
+    return GenerationPlan(counts=tuple(counts.items()), seed=seed)
+
+
+def _rng(plan: GenerationPlan, table: str, chunk: int) -> random.Random:
+    # String seeds are hashed with SHA-512, so they are stable across processes and runs.
+    return random.Random(f"{plan.seed}:{table}:{chunk}:{plan.first_id(table)}")
+
+
+def _pick(rng: random.Random, items: Sequence):
+    return items[int(rng.random() * len(items))]
+
+
+def _pick_id(rng: random.Random, count: int) -> int:
+    return int(rng.random() * count) + 1
+
+
+@lru_cache(maxsize=4096)
+def _date_prefix(day: int) -> str:
+    return (_EPOCH + timedelta(days=day)).strftime("%Y-%m-%d ")
+
+
+def format_timestamp(seconds: float) -> str:
+    """Seconds since the epoch in the form SQLAlchemy's SQLite DateTime type stores."""
+    whole = int(seconds)
+    day, rest = divmod(whole, 86400)
+    hour, rest = divmod(rest, 3600)
+    minute, second = divmod(rest, 60)
+    return f"{_date_prefix(day)}{hour:02d}:{minute:02d}:{second:02d}.000000"
+
+
+def _timestamps(plan: GenerationPlan, table: str, rng: random.Random, offset: int):
+    """created_at generator for rows offset, offset+1, ...: increasing and spread evenly over the window."""
+    start = (plan.start - _EPOCH).total_seconds()
+    step = (plan.end - plan.start).total_seconds() / max(plan.count(table), 1)
+    position = offset
+    while True:
+        yield start + step * (position + rng.random())
+        position += 1
+
+
+def _chunk_bounds(plan: GenerationPlan, table: str, chunk: int) -> Tuple[int, int]:
+    """(offset of the first row, number of rows) of a chunk."""
+    offset = chunk * CHUNK_SIZE
+    return offset, min(CHUNK_SIZE, plan.count(table) - offset)
+
+
+# ----- Per-table chunk generators -----
 
-def generate_departments(n: int) -> List[Dict]:
-    # Repeat/trim from catalog to reach n (10-30)
-    items = []
-    idx = 0
-    while len(items) < n:
-        base = DEPARTMENTS[idx % len(DEPARTMENTS)].copy()
+
+def _departments(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "departments", chunk)
+    offset, size = _chunk_bounds(plan, "departments", chunk)
+    times = _timestamps(plan, "departments", rng, offset)
+    rows = []
+    for idx in range(offset, offset + size):
+        base = DEPARTMENTS[idx % len(DEPARTMENTS)]
         suffix = (idx // len(DEPARTMENTS)) + 1
-        base["name"] = base["name"] if suffix == 1 else f"{base['name']} {suffix}"
-        items.append(base)
-        idx += 1
-    return items[:n]
-
-
-def generate_employees(n: int, departments: List[Dict]) -> List[Dict]:
-    random.seed(7)
-    first_names = [
-        "Minji",
-        "Jiwon",
-        "Hyun",
-        "Sujin",
-        "Hana",
-        "Jisoo",
-        "Taeyang",
-        "Joon",
-        "Mingyu",
-        "Eunwoo",
-        "Seojin",
-        "Hyejin",
-        "Donghyun",
-        "Yuna",
-        "Sangmin",
-    ]
-    last_names = ["Park", "Kim", "Lee", "Choi", "Jung", "Kang", "Yoon", "Han"]
-    titles = [
-        "Research Scientist",
-        "ML Engineer",
-        "Data Engineer",
-        "Product Manager",
-        "Sales Manager",
-        "Account Executive",
-        "Solutions Architect",
-        "Customer Success Manager",
-    ]
+        name = base["name"] if suffix == 1 else f"{base['name']} {suffix}"
+        rows.append((plan.first_id("departments") + idx, name, base["location"], format_timestamp(next(times))))
+    return rows
+
+
+def employee_profile(employee_id: int) -> Tuple[str, str]:
+    """
+    (name, email) of an employee, derived from the id alone. Ids go through every name pair
+    before one repeats, and the n-th repeat gets the same "name{n+1}@" email suffix the
+    original seeder used for duplicates, so emails stay unique without tracking them.
+    """
+    repeat, index = divmod(employee_id - 1, len(_NAME_PAIRS))
+    first, last = _NAME_PAIRS[index]
+    suffix = str(repeat + 1) if repeat else ""
+    return f"{first} {last}", f"{first.lower()}.{last.lower()}{suffix}@vectorai.com"
 
-    employees: List[Dict] = []
-    used_emails: set[str] = set()
-    for i in range(n):
-        name = f"{random.choice(first_names)} {random.choice(last_names)}"
-        base_email = f"{name.lower().replace(' ', '.')}@vectorai.com"
-        email = base_email
-        suffix = 2
-        while email in used_emails:
-            email = base_email.replace("@", f"{suffix}@")
-            suffix += 1
-        used_emails.add(email)
-        dept = random.choice(departments)
-        title = random.choice(titles)
-        employees.append(
-            {
-                "name": name,
-                "email": email,
-                "title": title,
-                "department_name": dept["name"],
-            }
+
+def _employees(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "employees", chunk)
+    offset, size = _chunk_bounds(plan, "employees", chunk)
+    times = _timestamps(plan, "employees", rng, offset)
+    departments = plan.total("departments")
+    rows = []
+    for idx in range(offset, offset + size):
+        employee_id = plan.first_id("employees") + idx
+        name, email = employee_profile(employee_id)
+        rows.append(
+            (
+                employee_id,
+                name,
+                email,
+                _pick(rng, TITLES),
+                _pick_id(rng, departments),
+                format_timestamp(next(times)),
+            )
         )
-    return employees
+    return rows
 
 
-def generate_products(n: int) -> List[Dict]:
-    items = []
-    idx = 0
-    while len(items) < n:
-        base = PRODUCT_CATALOG[idx % len(PRODUCT_CATALOG)].copy()
+def _products(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "products", chunk)
+    offset, size = _chunk_bounds(plan, "products", chunk)
+    times = _timestamps(plan, "products", rng, offset)
+    rows = []
+    for idx in range(offset, offset + size):
+        base = PRODUCT_CATALOG[idx % len(PRODUCT_CATALOG)]
         suffix = (idx // len(PRODUCT_CATALOG)) + 1
-        base["name"] = base["name"] if suffix == 1 else f"{base['name']} v{suffix}"
+        name = base["name"] if suffix == 1 else f"{base['name']} v{suffix}"
         # Add small price variance
-        base["price"] = int(base["price"] * random.uniform(0.9, 1.15))
-        items.append(base)
-        idx += 1
-    return items[:n]
-
-
-def generate_clients(n: int) -> List[Dict]:
-    random.seed(11)
-    industries = [
-        "Retail",
-        "Finance",
-        "Healthcare",
-        "Manufacturing",
-        "Technology",
-        "Energy",
-    ]
-    cities = ["New York", "Chicago", "San Francisco", "Toronto", "Boston", "Seattle"]
-    clients: List[Dict] = []
-    for i in range(n):
-        name = f"Acme Corp {i+1:02d}"
-        clients.append(
-            {
-                "name": name,
-                "industry": random.choice(industries),
-                "city": random.choice(cities),
-            }
+        price = int(base["price"] * rng.uniform(0.9, 1.15))
+        rows.append(
+            (plan.first_id("products") + idx, name, base["category"], price, base["billing"], format_timestamp(next(times)))
         )
-    return clients
-
-
-def generate_contracts(n: int, clients: List[Dict], products: List[Dict], employees: List[Dict]) -> List[Dict]:
-    random.seed(13)
-    terms = ["12 months", "24 months", "6 months"]
-    statuses = ["active", "pending", "closed"]
-    contracts: List[Dict] = []
-    for i in range(n):
-        client = random.choice(clients)
-        product = random.choice(products)
-        rep = random.choice([e for e in employees if "Sales" in e["title"] or "Account" in e["title"]])
-        amount = int(product["price"] * random.uniform(0.8, 1.3))
-        contracts.append(
-            {
-                "client_name": client["name"],
-                "product_name": product["name"],
-                "sales_rep_email": rep["email"],
-                "amount": amount,
-                "term": random.choice(terms),
-                "status": random.choice(statuses),
-            }
+    return rows
+
+
+def client_name(client_id: int) -> str:
+    """Name of a client, derived from the id alone so that other tables (e.g. project names) can use it."""
+    return f"Acme Corp {client_id:02d}"
+
+
+def _clients(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "clients", chunk)
+    offset, size = _chunk_bounds(plan, "clients", chunk)
+    times = _timestamps(plan, "clients", rng, offset)
+    rows = []
+    for idx in range(offset, offset + size):
+        client_id = plan.first_id("clients") + idx
+        rows.append(
+            (client_id, client_name(client_id), _pick(rng, INDUSTRIES), _pick(rng, CITIES), format_timestamp(next(times)))
         )
-    return contracts
-
-
-def generate_invoices(n: int, contracts: List[Dict]) -> List[Dict]:
-    random.seed(17)
-    methods = ["wire", "credit_card", "ach"]
-    invoices: List[Dict] = []
-    for i in range(n):
-        contract = random.choice(contracts)
-        due = int(contract["amount"] * random.uniform(0.25, 0.5))
-        paid = due if random.random() > 0.2 else int(due * random.uniform(0.3, 0.9))
-        invoices.append(
-            {
-                "contract_client_name": contract["client_name"],
-                "contract_product_name": contract["product_name"],
-                "amount_due": due,
-                "amount_paid": paid,
-                "method": random.choice(methods),
-            }
+    return rows
+
+
+@lru_cache(maxsize=8)
+def _employee_pools(plan: GenerationPlan) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """(sales rep ids, project owner ids), computed once per plan from existing and generated employees."""
+    reps: List[int] = list(plan.existing_sales_reps)
+    owners: List[int] = list(plan.existing_owners)
+    for chunk in range(plan.chunk_count("employees")):
+        for employee_id, _, _, title, _, _ in _employees(plan, chunk):
+            if title in SALES_TITLES:
+                reps.append(employee_id)
+            elif title in OWNER_TITLES:
+                owners.append(employee_id)
+    return tuple(reps), tuple(owners)
+
+
+@lru_cache(maxsize=8)
+def _product_catalog(plan: GenerationPlan) -> Tuple[Tuple[str, int], ...]:
+    """(name, price) for every product id, in id order."""
+    generated = tuple((row[1], row[3]) for chunk in range(plan.chunk_count("products")) for row in _products(plan, chunk))
+    return plan.existing_products + generated
+
+
+def _contract_rows(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    """Contract rows with created_at still in epoch seconds (invoices need it as a number)."""
+    rng = _rng(plan, "contracts", chunk)
+    offset, size = _chunk_bounds(plan, "contracts", chunk)
+    times = _timestamps(plan, "contracts", rng, offset)
+    reps, _ = _employee_pools(plan)
+    catalog = _product_catalog(plan)
+    clients, products = plan.total("clients"), plan.total("products")
+    rows = []
+    for idx in range(offset, offset + size):
+        product_id = _pick_id(rng, products)
+        _, price = catalog[(product_id - 1) % len(catalog)]
+        rows.append(
+            (
+                plan.first_id("contracts") + idx,
+                _pick_id(rng, clients),
+                product_id,
+                _pick(rng, reps) if reps else None,
+                int(price * rng.uniform(0.8, 1.3)),
+                _pick(rng, TERMS),
+                _pick(rng, STATUSES),
+                next(times),
+            )
         )
-    return invoices
-
-
-def generate_projects(n: int, clients: List[Dict], products: List[Dict], employees: List[Dict]) -> List[Dict]:
-    random.seed(19)
-    phases = ["PoC", "Pilot", "Production"]
-    projects: List[Dict] = []
-    for i in range(n):
-        client = random.choice(clients)
-        product = random.choice(products)
-        owner = random.choice([e for e in employees if "Engineer" in e["title"] or "Scientist" in e["title"] or "Architect" in e["title"]])
-        projects.append(
-            {
-                "name": f"{product['name']} - {client['name']} Deployment",
-                "client_name": client["name"],
-                "product_name": product["name"],
-                "owner_email": owner["email"],
-                "phase": random.choice(phases),
-            }
+    return rows
+
+
+def _contracts(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    return [(*row[:-1], format_timestamp(row[-1])) for row in _contract_rows(plan, chunk)]
+
+
+@lru_cache(maxsize=2)
+def _contract_chunk(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    return _contract_rows(plan, chunk)
+
+
+def _invoices(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "invoices", chunk)
+    offset, size = _chunk_bounds(plan, "invoices", chunk)
+    rows = []
+    contract_chunks = plan.chunk_count("contracts")
+    if not contract_chunks:
+        return rows
+    # Each invoice chunk bills contracts from the proportional contract chunk, so
+    # amounts and dates come from a single regenerated chunk rather than every contract.
+    contracts = _contract_chunk(plan, chunk * contract_chunks // max(plan.chunk_count("invoices"), 1))
+    # Invoices are issued within 90 days after the contract is signed, or within the plan's
+    # window if that is shorter (small append batches must not jump far into the future).
+    max_delay = min(90 * 86400, (plan.end - plan.start).total_seconds())
+    for idx in range(offset, offset + size):
+        contract_id, _, _, _, amount, _, _, contract_created = _pick(rng, contracts)
+        due = int(amount * rng.uniform(0.25, 0.5))
+        paid = due if rng.random() > 0.2 else int(due * rng.uniform(0.3, 0.9))
+        issued = contract_created + rng.uniform(0, max_delay)
+        rows.append((plan.first_id("invoices") + idx, contract_id, due, paid, _pick(rng, METHODS), format_timestamp(issued)))
+    return rows
+
+
+def _projects(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "projects", chunk)
+    offset, size = _chunk_bounds(plan, "projects", chunk)
+    times = _timestamps(plan, "projects", rng, offset)
+    _, owners = _employee_pools(plan)
+    catalog = _product_catalog(plan)
+    clients, products = plan.total("clients"), plan.total("products")
+    rows = []
+    for idx in range(offset, offset + size):
+        client_id = _pick_id(rng, clients)
+        product_id = _pick_id(rng, products)
+        product_name, _ = catalog[(product_id - 1) % len(catalog)]
+        rows.append(
+            (
+                plan.first_id("projects") + idx,
+                f"{product_name} - {client_name(client_id)} Deployment",
+                client_id,
+                product_id,
+                _pick(rng, owners) if owners else None,
+                _pick(rng, PHASES),
+                format_timestamp(next(times)),
+            )
         )
-    return projects
+    return rows
 
 
-def generate_meetings(n: int, clients: List[Dict], employees: List[Dict]) -> List[Dict]:
-    random.seed(23)
-    topics = [
-        "Quarterly Business Review",
-        "Technical Architecture",
-        "Roadmap Alignment",
-        "Renewal Discussion",
-        "Pilot Feedback",
-    ]
-    meetings: List[Dict] = []
-    for i in range(n):
-        client = random.choice(clients)
-        host = random.choice(employees)
-        meetings.append(
-            {
-                "client_name": client["name"],
-                "host_email": host["email"],
-                "topic": random.choice(topics),
-            }
+def _meetings(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    rng = _rng(plan, "meetings", chunk)
+    offset, size = _chunk_bounds(plan, "meetings", chunk)
+    times = _timestamps(plan, "meetings", rng, offset)
+    clients, employees = plan.total("clients"), plan.total("employees")
+    return [
+        (
+            plan.first_id("meetings") + idx,
+            _pick_id(rng, clients),
+            _pick_id(rng, employees),
+            _pick(rng, TOPICS),
+            format_timestamp(next(times)),
         )
-    return meetings
-
-
-def generate_project_assignments(n: int, projects: List[Dict], employees: List[Dict]) -> List[Dict]:
-    """Generate many-to-many project participation with roles."""
-    random.seed(29)
-    roles = ["Owner", "Tech Lead", "Engineer", "Scientist", "Architect", "CSM"]
-    assignments: List[Dict] = []
-    # ensure at least one owner per project present in dataset
-    owner_emails = {p.get("owner_email") for p in projects if p.get("owner_email")}
-    email_to_emp = {e["email"]: e for e in employees}
-    for p in projects:
-        owner_email = p.get("owner_email")
-        if owner_email and owner_email in email_to_emp:
-            assignments.append({"project_name": p["name"], "employee_email": owner_email, "role": "Owner"})
-    # add random participants per project (2-6 each)
-    for p in projects:
-        count = random.randint(2, 6)
-        picks = random.sample(employees, k=min(count, len(employees)))
-        for e in picks:
-            role = random.choice([r for r in roles if r != "Owner"])  # avoid duplicating owner
-            assignments.append({"project_name": p["name"], "employee_email": e["email"], "role": role})
-    # trim to n if oversized
-    return assignments[:n]
+        for idx in range(offset, offset + size)
+    ]
+
+
+def _project_assignments(plan: GenerationPlan, chunk: int) -> List[tuple]:
+    """
+    Many-to-many project participation with roles.
+
+    The first rows give every generated project its owner (one row per project, in project
+    order); the remaining rows add participants with non-owner roles to random projects.
+    """
+    rng = _rng(plan, "project_assignments", chunk)
+    offset, size = _chunk_bounds(plan, "project_assignments", chunk)
+    times = _timestamps(plan, "project_assignments", rng, offset)
+    projects, employees = plan.count("projects"), plan.total("employees")
+    first_project = plan.first_id("projects")
+    owner_rows: Dict[int, tuple] = {}
+    rows = []
+    for idx in range(offset, offset + size):
+        if idx < projects:
+            project_chunk, position = divmod(idx, CHUNK_SIZE)
+            if project_chunk not in owner_rows:
+                owner_rows[project_chunk] = tuple(_projects(plan, project_chunk))
+            project = owner_rows[project_chunk][position]
+            # The owner joins when the project is created.
+            project_id, employee_id, role, created_at = project[0], project[4], "Owner", project[6]
+            if employee_id is None:
+                employee_id, role = _pick_id(rng, employees), _pick(rng, PARTICIPANT_ROLES)
+            next(times)
+        else:
+            if projects:
+                project_id = first_project + int(rng.random() * projects)
+            else:
+                project_id = _pick_id(rng, plan.total("projects"))
+            employee_id, role = _pick_id(rng, employees), _pick(rng, PARTICIPANT_ROLES)
+            created_at = format_timestamp(next(times))
+        rows.append((plan.first_id("project_assignments") + idx, project_id, employee_id, role, created_at))
+    return rows
+
+
+_CHUNK_GENERATORS = {
+    "departments": _departments,
+    "employees": _employees,
+    "products": _products,
+    "clients": _clients,
+    "contracts": _contracts,
+    "invoices": _invoices,
+    "projects": _projects,
+    "meetings": _meetings,
+    "project_assignments": _project_assignments,
+}
+
+
+def generate_chunk(plan: GenerationPlan, table: str, chunk: int) -> List[tuple]:
+    """Rows of one chunk of a table, as tuples ordered like TABLE_COLUMNS[table]."""
+    return _CHUNK_GENERATORS[table](plan, chunk)
+
+
+def iter_table(plan: GenerationPlan, table: str, chunks: Optional[Sequence[int]] = None) -> Iterator[List[tuple]]:
+    """
+    Lazily yield a table's rows one chunk (at most CHUNK_SIZE rows) at a time.
+
+    Only the current chunk is held in memory, so memory use does not grow with the scale factor.
+    """
+    for chunk in range(plan.chunk_count(table)) if chunks is None else chunks:
+        yield generate_chunk(plan, table, chunk)
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from db.engine import memory_db_uri
+
+# Prebuilt databases, one file per snapshot key.
+SNAPSHOT_DIR = Path(os.getenv("DB_SNAPSHOT_DIR", str(Path(__file__).parent / "snapshots")))
+
+# Linux ioctl that makes `dst` share `src`'s extents (btrfs, XFS, ...): an O(1) copy-on-write clone.
+_FICLONE = 0x40049409
+
+# A shared-cache in-memory database lives as long as at least one connection to it is open,
+# so each loaded database keeps one connection here.
+_MEMORY_KEEPERS: Dict[str, sqlite3.Connection] = {}
+_MEMORY_LOCK = threading.Lock()
+
+
+def snapshot_key(params: Dict[str, Any], sources: Iterable[Path], schema: str = "") -> str:
+    """
+    Hash of everything that determines a generated database's contents.
+
+    `params` are the generation arguments, `sources` the files whose code produces the
+    rows, and `schema` the DDL, so editing the generator or the models invalidates old
+    snapshots. The SQLite version is included because it can change the file layout.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    for source in sources:
+        digest.update(Path(source).read_bytes())
+    digest.update(schema.encode("utf-8"))
+    digest.update(sqlite3.sqlite_version.encode("ascii"))
+    return digest.hexdigest()
+
+
+def snapshot_path(key: str) -> Path:
+    return SNAPSHOT_DIR / f"{key[:32]}.db"
+
+
+def clone_file(src: Path, dst: Path) -> None:
+    """Copy `src` to `dst`, as a reflink when the filesystem supports it."""
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    try:
+        import fcntl
+
+        with open(src, "rb") as fin, open(tmp, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+    except (ImportError, OSError):
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def store_snapshot(db_path: Path, key: str) -> Path:
+    """
+    Save a consistent copy of `db_path` under `key` and return its path.
+
+    The copy goes through the backup API, so committed data still in a -wal file is
+    included, and is published with an atomic rename so readers never see a partial file.
+    """
+    path = snapshot_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    src = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    dst = sqlite3.connect(tmp)
+    try:
+        src.backup(dst)
+        # A snapshot is a single self-contained file; the restored copy switches back to WAL on open.
+        dst.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        dst.close()
+        src.close()
+    os.replace(tmp, path)
+    return path
+
+
+def load_into_memory(db_path: Path, name: str) -> str:
+    """
+    Copy a database file into the shared-cache in-memory database `name` via the backup API.
+
+    Returns the URI that create_sqlite_engine() and the DB tools accept. The database stays
+    alive until drop_memory_db(name) is called; loading the same name again replaces its contents.
+    """
+    uri = memory_db_uri(name)
+    with _MEMORY_LOCK:
+        keeper = _MEMORY_KEEPERS.get(name)
+        if keeper is None:
+            keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            _MEMORY_KEEPERS[name] = keeper
+        src = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            src.backup(keeper)
+        finally:
+            src.close()
+    return uri
+
+
+def drop_memory_db(name: str) -> None:
+    """Release an in-memory database once every other connection to it is closed as well."""
+    with _MEMORY_LOCK:
+        keeper = _MEMORY_KEEPERS.pop(name, None)
+    if keeper is not None:
+        keeper.close()
@@ -0,0 +1,424 @@
+"""
+DB 툴 회귀 테스트. 임시 DB를 만들어 사용하므로 db/data.db는 건드리지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_db_tool.py"
+"""
+
+from contextlib import closing
+from pathlib import Path
+import asyncio
+import copy
+import sqlite3
+import tempfile
+import unittest
+
+from langchain_core.tools import BaseTool
+from sqlalchemy import event
+
+from db import init_db
+from db.engine import create_sqlite_engine
+from db.fts import create_fts_indexes
+from tools import db_tool, index_advisor
+
+_TMP: tempfile.TemporaryDirectory
+_DB_PATH: Path
+
+
+def setUpModule():
+    global _TMP, _DB_PATH
+    _TMP = tempfile.TemporaryDirectory()
+    _DB_PATH = Path(_TMP.name) / "test.db"
+    previous = init_db.DB_PATH
+    init_db.use_database(_DB_PATH)
+    try:
+        init_db.reset_db()
+        init_db.insert_data_into_db()
+        create_fts_indexes(init_db._get_engine())
+    finally:
+        init_db.use_database(previous)
+    db_tool.use_database(_DB_PATH)
+
+
+def tearDownModule():
+    db_tool.use_database(init_db.DB_PATH)
+    _TMP.cleanup()
+
+
+def _row_count(table_name: str) -> int:
+    return _query(f"SELECT COUNT(*) FROM {table_name}")[0][0]
+
+
+def _query(sql: str) -> list:
+    with closing(sqlite3.connect(_DB_PATH)) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def _execute(sql: str, parameters: tuple = ()) -> None:
+    with closing(sqlite3.connect(_DB_PATH)) as conn:
+        conn.execute(sql, parameters)
+        conn.commit()
+
+
+def _all_pages(db_tool_fn, args: dict) -> list:
+    """next_cursor를 따라가며 모든 페이지를 가져온다. 마지막 페이지 외에는 limit만큼 차 있어야 한다."""
+    pages = [db_tool_fn.invoke(args)]
+    while pages[-1]["next_cursor"] is not None:
+        if len(pages) > 100:
+            raise AssertionError("pagination does not terminate")
+        pages.append(db_tool_fn.invoke({**args, "cursor": pages[-1]["next_cursor"]}))
+    for page in pages:
+        assert "error" not in page, page
+    return pages
+
+
+class PaginationTest(unittest.TestCase):
+    def assertPages(self, pages: list, limit: int):
+        self.assertTrue(all(page["row_count"] == limit for page in pages[:-1]))
+        self.assertLessEqual(pages[-1]["row_count"], limit)
+        self.assertIsNone(pages[-1]["next_cursor"])
+
+    def test_default_order_is_primary_key(self):
+        pages = _all_pages(db_tool.get_all_data_from_table, {"table_name": "contracts", "limit": 7})
+        self.assertPages(pages, 7)
+        ids = [row["id"] for page in pages for row in page["rows"]]
+        self.assertEqual(ids, [row[0] for row in _query("SELECT id FROM contracts ORDER BY id")])
+
+    def test_order_by_with_ties_uses_primary_key_tiebreak(self):
+        args = {"table_name": "contracts", "order_by": "-status", "limit": 4}
+        pages = _all_pages(db_tool.get_all_data_from_table, args)
+        self.assertPages(pages, 4)
+        ids = [row["id"] for page in pages for row in page["rows"]]
+        self.assertEqual(ids, [row[0] for row in _query("SELECT id FROM contracts ORDER BY status DESC, id DESC")])
+        # 같은 인자로 다시 호출해도 같은 순서
+        self.assertEqual(pages, _all_pages(db_tool.get_all_data_from_table, args))
+
+    def test_filter_tool_pages_cover_all_matches(self):
+        args = {"table_name": "contracts", "column_name": "amount", "gte": 50000, "order_by": "amount", "limit": 5}
+        pages = _all_pages(db_tool.filter_data_by_gte_or_lte, args)
+        amounts = [row["amount"] for page in pages for row in page["rows"]]
+        expected = _query("SELECT amount FROM contracts WHERE amount >= 50000 ORDER BY amount, id")
+        self.assertEqual(amounts, [row[0] for row in expected])
+
+    def test_full_last_page_has_no_cursor(self):
+        count = _row_count("departments")
+        result = db_tool.get_all_data_from_table.invoke({"table_name": "departments", "limit": count})
+        self.assertEqual(result["row_count"], count)
+        self.assertIsNone(result["next_cursor"])
+
+    def test_cursor_must_match_order_by(self):
+        first = db_tool.get_all_data_from_table.invoke({"table_name": "contracts", "order_by": "amount", "limit": 3})
+        result = db_tool.get_all_data_from_table.invoke(
+            {"table_name": "contracts", "order_by": "-amount", "limit": 3, "cursor": first["next_cursor"]}
+        )
+        self.assertIn("error", result)
+        result = db_tool.get_all_data_from_table.invoke({"table_name": "contracts", "cursor": "not-a-cursor"})
+        self.assertIn("error", result)
+
+    def test_join_tables_order_by(self):
+        args = {
+            "tables": ["contracts", "clients"],
+            "columns": ["contracts.id", "clients.name"],
+            "order_by": "-clients.name",
+            "limit": 6,
+        }
+        pages = _all_pages(db_tool.join_tables, args)
+        self.assertPages(pages, 6)
+        rows = [(row["contracts.id"], row["clients.name"]) for page in pages for row in page["rows"]]
+        expected = _query(
+            "SELECT contracts.id, clients.name FROM contracts JOIN clients ON contracts.client_id = clients.id "
+            "ORDER BY clients.name DESC, contracts.id DESC, clients.id DESC"
+        )
+        self.assertEqual(rows, expected)
+
+    def test_join_tables_on_column_order_by(self):
+        args = {
+            "left_table": "contracts",
+            "right_table": "clients",
+            "join_column_left": "client_id",
+            "join_column_right": "id",
+            "order_by": "amount",
+            "limit": 6,
+        }
+        pages = _all_pages(db_tool.join_tables_on_column, args)
+        self.assertPages(pages, 6)
+        ids = [row["contracts"]["id"] for page in pages for row in page["rows"]]
+        self.assertEqual(ids, [row[0] for row in _query("SELECT id FROM contracts ORDER BY amount, id")])
+
+
+class FtsFilterTest(unittest.TestCase):
+    def _count_checkouts(self) -> list:
+        checkouts = []
+        engine = db_tool._get_engine()
+        listener = lambda *args: checkouts.append(1)  # noqa: E731
+        event.listen(engine, "checkout", listener)
+        self.addCleanup(event.remove, engine, "checkout", listener)
+        return checkouts
+
+    def test_like_filters_use_the_callers_connection(self):
+        db_tool.clear_result_cache()
+        checkouts = self._count_checkouts()
+        result = db_tool.filter_data.invoke(
+            {"table_name": "clients", "where": {"column": "name", "op": "like", "value": "%Acme%"}, "limit": 1000}
+        )
+        self.assertEqual(len(checkouts), 1)
+        expected = _query("SELECT id FROM clients WHERE name LIKE '%Acme%' ORDER BY id")
+        self.assertEqual([row["id"] for row in result["rows"]], [row[0] for row in expected])
+
+        db_tool.filter_data_by_like.invoke({"table_name": "meetings", "column_name": "topic", "like_pattern": "%Review%"})
+        db_tool.search_text.invoke({"table_name": "meetings", "query": "Review"})
+        self.assertEqual(len(checkouts), 3)
+
+    def test_search_text_matches_like_for_korean_and_short_terms(self):
+        for query, sql_where, index in (
+            ("아키텍처", "topic LIKE '%아키텍처%'", "fts5"),
+            ("비즈니스 리뷰", "topic LIKE '%비즈니스%' AND topic LIKE '%리뷰%'", "fts5"),
+            ("분기 리뷰", "topic LIKE '%분기%' AND topic LIKE '%리뷰%'", "like"),
+        ):
+            with self.subTest(query=query):
+                result = db_tool.search_text.invoke({"table_name": "meetings", "query": query, "limit": 1000})
+                expected = _query(f"SELECT id FROM meetings WHERE {sql_where} ORDER BY id")
+                self.assertEqual([row["id"] for row in result["rows"]], [row[0] for row in expected])
+                self.assertEqual(result["index"], index)
+        self.assertTrue(_query("SELECT id FROM meetings WHERE topic LIKE '%비즈니스 리뷰%'"))
+
+
+class JoinTablesTest(unittest.TestCase):
+    def test_intermediate_tables_are_joined_along_foreign_keys(self):
+        result = db_tool.join_tables.invoke(
+            {"tables": ["invoices", "clients"], "columns": ["invoices.id", "clients.name"], "limit": 1000}
+        )
+        self.assertEqual(result["tables"], ["invoices", "contracts", "clients"])
+        self.assertEqual(
+            [step["on"] for step in result["join_path"]],
+            ["invoices.contract_id = contracts.id", "contracts.client_id = clients.id"],
+        )
+        expected = _query(
+            "SELECT invoices.id, clients.name FROM invoices JOIN contracts ON invoices.contract_id = contracts.id "
+            "JOIN clients ON contracts.client_id = clients.id ORDER BY invoices.id"
+        )
+        self.assertEqual([(row["invoices.id"], row["clients.name"]) for row in result["rows"]], expected)
+
+    def test_nullable_foreign_key_uses_left_join(self):
+        sales_rep_id = _query("SELECT sales_rep_id FROM contracts WHERE id = 1")[0][0]
+        _execute("UPDATE contracts SET sales_rep_id = NULL WHERE id = 1")
+        self.addCleanup(_execute, "UPDATE contracts SET sales_rep_id = ? WHERE id = 1", (sales_rep_id,))
+
+        result = db_tool.join_tables.invoke(
+            {"tables": ["contracts", "employees"], "columns": ["contracts.id", "employees.name"], "limit": 1000}
+        )
+        self.assertEqual(result["join_path"][0]["type"], "left")
+        self.assertEqual(result["row_count"], _row_count("contracts"))
+        self.assertEqual(result["rows"][0], {"contracts.id": 1, "employees.name": None})
+
+    def test_filters_on_joined_columns(self):
+        result = db_tool.join_tables.invoke(
+            {
+                "tables": ["contracts", "clients"],
+                "columns": ["contracts.id"],
+                "filters": [{"column": "clients.id", "op": "lte", "value": 3}, {"column": "contracts.status", "value": "active"}],
+                "limit": 1000,
+            }
+        )
+        expected = _query("SELECT id FROM contracts WHERE client_id <= 3 AND status = 'active' ORDER BY id")
+        self.assertEqual([row["contracts.id"] for row in result["rows"]], [row[0] for row in expected])
+        self.assertIn("error", db_tool.join_tables.invoke({"tables": ["contracts", "no_such_table"]}))
+
+
+class IndexAdvisorTest(unittest.TestCase):
+    def setUp(self):
+        index_advisor.reset_column_usage()
+        self.addCleanup(index_advisor.reset_column_usage)
+        db_tool.clear_result_cache()
+
+    def test_seeded_schema_indexes_foreign_keys(self):
+        for table in init_db.Base.metadata.sorted_tables:
+            for fk in table.foreign_keys:
+                with self.subTest(column=f"{table.name}.{fk.parent.name}"):
+                    indexed = _query(f"PRAGMA index_list({table.name})")
+                    leading = {_query(f"PRAGMA index_info({row[1]})")[0][2] for row in indexed}
+                    self.assertIn(fk.parent.name, leading)
+
+    def test_report_lists_only_unindexed_columns_in_use(self):
+        db_tool.filter_data.invoke(
+            {
+                "table_name": "meetings",
+                "where": {"and": [{"column": "id", "op": "gt", "value": 1}, {"column": "host_employee_id", "value": 2}]},
+                "order_by": "topic",
+            }
+        )
+        writable = create_sqlite_engine(_DB_PATH)
+        self.addCleanup(writable.dispose)
+        report = index_advisor.get_index_report(writable)
+        missing = [(item["table"], item["column"], item["kinds"]) for item in report]
+        self.assertEqual(missing, [("meetings", "topic", {"order_by": 1})])
+
+        index_advisor.create_missing_indexes(writable, report=report)
+        self.addCleanup(_execute, 'DROP INDEX IF EXISTS "ix_meetings_topic"')
+        self.assertEqual(index_advisor.get_index_report(writable), [])
+
+
+class AsyncToolTest(unittest.TestCase):
+    def test_every_tool_has_a_coroutine(self):
+        tools = [value for value in vars(db_tool).values() if isinstance(value, BaseTool)]
+        self.assertGreater(len(tools), 5)
+        for tool in tools:
+            with self.subTest(tool=tool.name):
+                self.assertIsNotNone(tool.coroutine)
+
+    def test_concurrent_ainvoke_matches_invoke_without_blocking_the_loop(self):
+        calls = [
+            (db_tool.get_all_data_from_table, {"table_name": table, "limit": 5})
+            for table in ("clients", "contracts", "employees", "meetings")
+        ] + [(db_tool.aggregate_table, {"table_name": "contracts", "aggregates": [{"function": "count"}]})]
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            try:
+                results = await asyncio.gather(*(tool.ainvoke(args) for tool, args in calls))
+            finally:
+                task.cancel()
+            return results, ticks
+
+        db_tool.clear_result_cache()
+        results, ticks = asyncio.run(run())
+        self.assertEqual(results, [tool.invoke(args) for tool, args in calls])
+        self.assertGreater(ticks, 1)  # DB 호출 중에도 이벤트 루프가 다른 작업을 실행했다
+
+
+class FilterDataTest(unittest.TestCase):
+    def assertFilters(self, where: dict, sql_where: str, **kwargs):
+        result = db_tool.filter_data.invoke({"table_name": "contracts", "where": where, "limit": 1000, **kwargs})
+        expected = _query(f"SELECT contracts.id FROM contracts WHERE {sql_where} ORDER BY contracts.id")
+        self.assertEqual([row["id"] for row in result["rows"]], [row[0] for row in expected])
+        return result
+
+    def test_nested_predicates(self):
+        self.assertFilters(
+            {
+                "or": [
+                    {
+                        "and": [
+                            {"column": "status", "value": "active"},
+                            {"column": "amount", "op": "between", "value": [80000, 120000]},
+                        ]
+                    },
+                    {"not": {"column": "term", "op": "in", "value": ["12 months", "24 months"]}},
+                ]
+            },
+            "(status = 'active' AND amount BETWEEN 80000 AND 120000) OR NOT term IN ('12 months', '24 months')",
+        )
+        self.assertFilters({"column": "sales_rep_id", "op": "is_null", "value": False}, "sales_rep_id IS NOT NULL")
+
+    def test_projection_and_related_table_columns(self):
+        result = self.assertFilters(
+            {"column": "clients.industry", "value": "Finance"},
+            "client_id IN (SELECT id FROM clients WHERE industry = 'Finance')",
+            columns=["id", "amount", "clients.name"],
+        )
+        self.assertEqual(result["columns"], ["id", "amount", "clients.name"])
+        self.assertTrue(all(set(row) == {"id", "amount", "clients.name"} for row in result["rows"]))
+        self.assertEqual(result["join_path"][0]["on"], "contracts.client_id = clients.id")
+
+    def test_invalid_predicates_return_errors(self):
+        for where in ({"column": "amount", "op": "regex", "value": "1"}, {"and": []}, {"op": "eq", "value": 1}):
+            with self.subTest(where=where):
+                self.assertIn("error", db_tool.filter_data.invoke({"table_name": "contracts", "where": where}))
+
+
+class AggregateTableTest(unittest.TestCase):
+    def test_bare_count_returns_row_count(self):
+        result = db_tool.aggregate_table.invoke({"table_name": "meetings", "aggregates": [{"function": "count"}]})
+        self.assertEqual(result["rows"], [{"count": _row_count("meetings")}])
+
+    def test_grouped_count_sums_to_row_count(self):
+        result = db_tool.aggregate_table.invoke(
+            {"table_name": "contracts", "aggregates": [{"function": "count"}], "group_by": ["status"]}
+        )
+        self.assertEqual(sum(row["count"] for row in result["rows"]), _row_count("contracts"))
+
+    def test_duplicate_output_names_are_rejected(self):
+        for args in (
+            {"aggregates": [{"function": "count", "alias": "status"}], "group_by": ["status"]},
+            {"aggregates": [{"function": "sum", "column": "amount", "alias": "total"}, {"function": "count", "alias": "total"}]},
+            {"aggregates": [{"function": "count"}], "group_by": ["status", "status"]},
+        ):
+            with self.subTest(args=args):
+                result = db_tool.aggregate_table.invoke({"table_name": "contracts", **args})
+                self.assertIn("error", result)
+                self.assertIn("Duplicate output column names", result["error"])
+
+
+class ResultFormatTest(unittest.TestCase):
+    def test_rows_and_columnar_serialize_datetimes_alike(self):
+        args = {"table_name": "meetings", "limit": 5}
+        rows = db_tool.get_all_data_from_table.invoke({**args, "format": "rows"})
+        columnar = db_tool.get_all_data_from_table.invoke({**args, "format": "columnar"})
+        index = columnar["columns"].index("created_at")
+        self.assertEqual([row["created_at"] for row in rows["rows"]], [values[index] for values in columnar["rows"]])
+        self.assertRegex(rows["rows"][0]["created_at"], r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+    def test_join_formats_serialize_datetimes_alike(self):
+        args = {
+            "left_table": "meetings",
+            "right_table": "clients",
+            "join_column_left": "client_id",
+            "join_column_right": "id",
+            "limit": 5,
+        }
+        rows = db_tool.join_tables_on_column.invoke({**args, "format": "rows"})
+        columnar = db_tool.join_tables_on_column.invoke({**args, "format": "columnar"})
+        index = columnar["columns"].index("meetings.created_at")
+        self.assertEqual(
+            [row["meetings"]["created_at"] for row in rows["rows"]], [values[index] for values in columnar["rows"]]
+        )
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_cached_result_is_not_shared_with_callers(self):
+        db_tool.clear_result_cache()
+        args = {"table_name": "clients", "limit": 3}
+        first = db_tool.get_all_data_from_table.invoke(args)
+        expected = copy.deepcopy(first)
+        first["rows"][0]["name"] = "changed"
+        first["rows"].clear()
+
+        second = db_tool.get_all_data_from_table.invoke(args)
+        self.assertEqual(second, expected)
+        second["columns"].append("changed")
+        self.assertEqual(db_tool.get_all_data_from_table.invoke(args), expected)
+        self.assertGreaterEqual(db_tool.get_result_cache_stats()["hits"], 2)
+
+    def test_defaults_and_argument_order_share_a_cache_entry(self):
+        db_tool.clear_result_cache()
+        hits = db_tool.get_result_cache_stats()["hits"]
+        db_tool.get_all_data_from_table.invoke({"table_name": "products", "limit": 5})
+        db_tool.get_all_data_from_table.invoke({"limit": 5, "format": "rows", "table_name": "products"})
+        self.assertEqual(db_tool.get_result_cache_stats()["hits"], hits + 1)
+
+    def test_commits_invalidate_cached_results(self):
+        args = {"table_name": "clients", "column_name": "id", "include_values": [1]}
+        name = db_tool.filter_data_by_inclusion.invoke(args)["rows"][0]["name"]
+        self.assertEqual(db_tool.filter_data_by_inclusion.invoke(args)["rows"][0]["name"], name)
+
+        _execute("UPDATE clients SET name = 'Renamed Client' WHERE id = 1")
+        self.addCleanup(_execute, "UPDATE clients SET name = ? WHERE id = 1", (name,))
+        self.assertEqual(db_tool.filter_data_by_inclusion.invoke(args)["rows"][0]["name"], "Renamed Client")
+        self.assertGreaterEqual(db_tool.get_result_cache_stats()["invalidations"], 1)
+
+    def test_errors_are_not_cached(self):
+        db_tool.clear_result_cache()
+        self.assertIn("error", db_tool.get_all_data_from_table.invoke({"table_name": "no_such_table"}))
+        self.assertEqual(db_tool.get_result_cache_stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
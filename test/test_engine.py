@@ -0,0 +1,74 @@
+"""
+공용 SQLite 엔진 팩토리(create_sqlite_engine) 회귀 테스트. 임시 DB 파일을 사용한다.
+
+사용법:
+    python -m unittest discover -s test -p "test_engine.py"
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from db.engine import create_sqlite_engine, memory_db_uri
+
+
+class CreateSqliteEngineTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = Path(tmp.name) / "test.db"
+        self.writable = self._engine(self.db_path)
+        with self.writable.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+            conn.execute(text("INSERT INTO items (name) VALUES ('a'), ('b')"))
+
+    def _engine(self, db_path, **kwargs):
+        engine = create_sqlite_engine(db_path, **kwargs)
+        self.addCleanup(engine.dispose)
+        return engine
+
+    def _pragma(self, engine, name: str):
+        with engine.connect() as conn:
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_pragmas_are_applied_to_every_connection(self):
+        engine = self._engine(self.db_path, busy_timeout_ms=1234, cache_size=-2048, temp_store="MEMORY")
+        self.assertEqual(self._pragma(engine, "journal_mode"), "wal")
+        self.assertEqual(self._pragma(engine, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self._pragma(engine, "busy_timeout"), 1234)
+        self.assertEqual(self._pragma(engine, "cache_size"), -2048)
+        self.assertEqual(self._pragma(engine, "temp_store"), 2)  # MEMORY
+
+    def test_read_only_engine_rejects_writes(self):
+        for engine in (
+            self._engine(self.db_path, read_only=True),
+            self._engine(memory_db_uri("test_engine"), read_only=True),
+        ):
+            with self.subTest(url=str(engine.url)), engine.connect() as conn:
+                with self.assertRaises(OperationalError):
+                    conn.execute(text("CREATE TABLE other (id INTEGER)"))
+
+    def test_read_only_connections_read_while_a_write_is_open(self):
+        reader = self._engine(self.db_path, read_only=True, pool_size=4)
+        barrier = threading.Barrier(4)
+
+        def count(_) -> int:
+            with reader.connect() as conn:
+                barrier.wait(timeout=5)  # 네 연결이 동시에 열려 있는 상태에서 읽는다
+                return conn.execute(text("SELECT COUNT(*) FROM items")).scalar()
+
+        with self.writable.begin() as conn:
+            conn.execute(text("INSERT INTO items (name) VALUES ('c')"))
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                counts = list(executor.map(count, range(4)))
+        # 커밋 전 쓰기는 WAL 덕분에 읽기를 막지 않고, 읽는 쪽에는 보이지 않는다.
+        self.assertEqual(counts, [2, 2, 2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+수학 표현식 평가기 회귀 테스트. NumPy가 있으면 evaluate_over의 배열 계산을, 없으면 위치별 계산을 검사한다.
+
+사용법:
+    python -m unittest discover -s test -p "test_expression.py"
+"""
+
+import unittest
+
+from tools.expression import ExpressionError, compile_expression, evaluate_over
+
+
+class EvaluateOverTest(unittest.TestCase):
+    def assertMatchesScalar(self, source: str, columns: dict, scalars: dict = None):
+        """evaluate_over 결과가 위치마다 evaluate를 호출한 결과와 값/타입/에러까지 같은지 확인."""
+        compiled = compile_expression(source)
+        results = evaluate_over(compiled, columns, scalars)
+        for i, result in enumerate(results):
+            variables = {**(scalars or {}), **{name: values[i] for name, values in columns.items()}}
+            with self.subTest(source=source, position=i):
+                try:
+                    expected = compiled.evaluate(variables)
+                except ExpressionError as e:
+                    self.assertIsInstance(result, ExpressionError)
+                    self.assertEqual(str(result), str(e))
+                    continue
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+
+    def test_large_ints_keep_precision(self):
+        big = 2**53 + 1
+        self.assertEqual(evaluate_over(compile_expression("x + 1"), {"x": [big, 3]}), [big + 1, 4])
+        self.assertMatchesScalar("x * y", {"x": [big, 2**62], "y": [3, 5]})
+
+    def test_result_types_match_scalar_evaluation(self):
+        self.assertMatchesScalar("x / 2", {"x": [4, 5, -6]})
+        self.assertMatchesScalar("x / 2", {"x": [4.0, 5.0, -6.0]})
+        self.assertMatchesScalar("x // y + x % y", {"x": [7.5, -7.5], "y": [2.0, 2.0]})
+        self.assertMatchesScalar("min(x, 1) + max(x, 0)", {"x": [2.5, 0.5]})
+        self.assertMatchesScalar("round(x, 2) + round(x)", {"x": [2.675, 1.005, 2.5]})
+        self.assertMatchesScalar("2 + 3", {"x": [1.0, 2.0]})
+        self.assertMatchesScalar("x * rate", {"x": [100.0, 250.5]}, {"rate": 3})
+
+    def test_errors_match_scalar_evaluation(self):
+        self.assertMatchesScalar("x / y", {"x": [1.0, 2.0, 3.0], "y": [1.0, 0.0, 3.0]})
+        self.assertMatchesScalar("x ** 2", {"x": [2.0, 1e200]})
+        self.assertMatchesScalar("1 / 0 + x", {"x": [1.0, 2.0]})
+
+
+class RestrictionTest(unittest.TestCase):
+    def assertRejected(self, source: str, variables: dict = None):
+        with self.subTest(source=source, variables=variables):
+            with self.assertRaises(ExpressionError):
+                compile_expression(source).evaluate(variables)
+
+    def test_lists_only_as_min_max_sum_arguments(self):
+        self.assertRejected("[1] * 10**9")
+        self.assertRejected("[1, 2] + [3]")
+        self.assertRejected("abs([1])")
+        self.assertRejected("sum([1, 2], [3])")
+        self.assertRejected("x * 3", {"x": [1, 2]})
+        self.assertRejected("x + 1", {"x": "1"})
+        self.assertEqual(compile_expression("sum([1, 2, 3]) + max(x)").evaluate({"x": [4, 5]}), 11)
+        self.assertEqual(str(compile_expression("sum(x)").evaluate({"x": [0.1, 0.2]}, exact=True)), "0.3")
+
+    def test_complex_results_are_rejected(self):
+        self.assertRejected("(-8) ** 0.5")
+        self.assertRejected("x ** 0.5", {"x": -4.0})
+        results = evaluate_over(compile_expression("x ** 0.5"), {"x": [4.0, -4.0]})
+        self.assertEqual(results[0], 2.0)
+        self.assertIsInstance(results[1], ExpressionError)
+
+
+if __name__ == "__main__":
+    unittest.main()
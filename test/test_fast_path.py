@@ -0,0 +1,82 @@
+"""
+마스터 에이전트 빠른 경로 라우터(classify) 회귀 테스트. LLM은 호출하지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_fast_path.py"
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("OPENAI_API_KEY", "test")  # 모듈 import 시 만들어지는 ChatOpenAI는 호출되지 않는다
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+from agents.fast_path import FastPathRouter, classify  # noqa: E402
+
+
+class ClassifyTest(unittest.TestCase):
+    def assertRoutes(self, expected: dict):
+        for text, route in expected.items():
+            with self.subTest(text=text):
+                self.assertEqual(classify(text)[0], route)
+
+    def test_current_date_and_time_questions(self):
+        self.assertRoutes(
+            {
+                "오늘 며칠이야?": "date",
+                "지금 몇 시야": "time",
+                "오늘 무슨 요일이야": "weekday",
+                "오늘 날짜 알려줘": "date",
+                "지금 시간 알려줘": "time",
+                "몇 시 몇 분이야?": "time",
+                "what is the date today?": "date",
+                "What's today's date": "date",
+                "what day is it today": "weekday",
+                "what time is it now?": "time",
+                "whats the current time": "time",
+            }
+        )
+
+    def test_other_date_questions_go_to_the_full_graph(self):
+        self.assertRoutes(
+            {
+                "what is the date of the next election": "full",
+                "whats the date tomorrow": "full",
+                "What is the day of the week of 2030-01-01?": "full",
+                "what is the day Korea was liberated": "full",
+                "what time is it in New York": "full",
+                "what is the time difference between Seoul and Paris": "full",
+                "내일 며칠이야?": "full",
+                "2030년 1월 1일은 무슨 요일이야?": "full",
+                "일요일 무슨 일이야": "full",
+                "몇 시간이야": "full",
+                "시간이 뭐야": "full",
+                "무슨 일이야?": "full",
+                "지금 몇 시간 남았어?": "full",
+            }
+        )
+
+    def test_arithmetic(self):
+        self.assertEqual(classify("1,234 곱하기 5,678은 얼마야?"), ("arithmetic", "1234 * 5678"))
+        self.assertRoutes({"2024-01-01": "full", "메시와 호날두의 골 수 차이는?": "full"})
+
+
+class FastPathRouterTest(unittest.TestCase):
+    def test_only_the_first_question_of_a_conversation_takes_the_fast_path(self):
+        router = FastPathRouter()
+        first = router.before_agent({"messages": [HumanMessage("지금 몇 시야?")]}, None)
+        self.assertEqual(first["jump_to"], "end")
+
+        follow_up = {
+            "messages": [
+                HumanMessage("뉴욕 지사 회의는 몇 시에 시작해?"),
+                AIMessage("오전 9시(뉴욕 시간)에 시작합니다."),
+                HumanMessage("지금 몇 시야?"),
+            ]
+        }
+        self.assertNotIn("jump_to", router.before_agent(follow_up, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
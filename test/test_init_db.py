@@ -0,0 +1,187 @@
+"""
+DB 시드 회귀 테스트. 임시 DB를 만들어 사용하므로 db/data.db는 건드리지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_init_db.py"
+"""
+
+from contextlib import closing
+from pathlib import Path
+from unittest import mock
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from db import init_db, snapshot
+from db.sample_data import BASE_ROW_COUNTS, TABLE_ORDER
+
+
+def _query(db_path: Path, sql: str) -> list:
+    with closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute(sql).fetchall()
+
+
+class InsertDataTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        previous = init_db.DB_PATH
+        self.db_path = Path(tmp.name) / "test.db"
+        init_db.use_database(self.db_path)
+        self.addCleanup(init_db.use_database, previous)
+        init_db.reset_db()
+
+    def test_positional_counts_keep_their_original_order(self):
+        counts = init_db.insert_data_into_db(3, 4, 5)
+        self.assertEqual((counts["departments"], counts["employees"], counts["products"]), (3, 4, 5))
+
+    def test_generation_options_are_keyword_only(self):
+        with self.assertRaises(TypeError):
+            init_db.insert_data_into_db(3, 4, 5, 6, 7, 8, 9, 10, 11, 2.0)
+
+    def test_bulk_load_writes_every_row_and_restores_indexes(self):
+        counts = init_db.insert_data_into_db()
+        init_db._get_engine().dispose()
+        self.assertEqual(counts, BASE_ROW_COUNTS)
+        for table in TABLE_ORDER:
+            self.assertEqual(_query(self.db_path, f"SELECT COUNT(*) FROM {table}")[0][0], counts[table])
+        self.assertEqual(_query(self.db_path, "PRAGMA foreign_key_check"), [])
+        # 적재 중 지웠던 보조 인덱스와 WAL 모드가 다시 설정되어 있어야 한다.
+        expected = sorted(index.name for table in init_db.Base.metadata.sorted_tables for index in table.indexes)
+        indexes = _query(
+            self.db_path, "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY name"
+        )
+        self.assertEqual([name for (name,) in indexes], expected)
+        self.assertEqual(_query(self.db_path, "PRAGMA journal_mode")[0][0], "wal")
+
+
+class AppendTest(unittest.TestCase):
+    counts = {"contracts": 5, "invoices": 5, "meetings": 4, "project_assignments": 6}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.db_path = self.tmp / "test.db"
+        previous = init_db.DB_PATH
+        init_db.use_database(self.db_path)
+        self.addCleanup(init_db.use_database, previous)
+        init_db.reset_db()
+        init_db.insert_data_into_db()
+
+    def _table_state(self) -> dict:
+        init_db._get_engine().dispose()
+        return {
+            table: _query(self.db_path, f"SELECT COUNT(*), MAX(id), MAX(created_at) FROM {table}")[0]
+            for table in TABLE_ORDER
+        }
+
+    def test_append_continues_ids_after_the_newest_rows(self):
+        before = self._table_state()
+        written = init_db.append_data(counts=self.counts)
+        after = self._table_state()
+        self.assertEqual(written, self.counts)
+        latest = max(before[table][2] for table in init_db.APPEND_TABLES)
+        for table in TABLE_ORDER:
+            with self.subTest(table=table):
+                count, max_id, _ = before[table]
+                added = self.counts.get(table, 0)
+                self.assertEqual(after[table][:2], (count + added, max_id + added))
+                if added:
+                    oldest_new = _query(self.db_path, f"SELECT MIN(created_at) FROM {table} WHERE id > {max_id}")[0][0]
+                    self.assertGreater(oldest_new, latest)
+        self.assertEqual(_query(self.db_path, "PRAGMA foreign_key_check"), [])
+
+    def test_same_database_state_yields_the_same_batch(self):
+        init_db._get_engine().dispose()
+        copy_path = self.tmp / "copy.db"
+        shutil.copyfile(self.db_path, copy_path)
+        init_db.append_data(counts=self.counts)
+        init_db.use_database(copy_path)
+        init_db.append_data(counts=self.counts)
+        init_db._get_engine().dispose()
+        for table in init_db.APPEND_TABLES:
+            with self.subTest(table=table):
+                sql = f"SELECT * FROM {table} ORDER BY id"
+                self.assertEqual(_query(copy_path, sql), _query(self.db_path, sql))
+
+    def test_trickle_appends_one_batch_per_interval(self):
+        reported = []
+        batches = init_db.trickle(0, batches=3, counts=self.counts, on_batch=lambda i, written: reported.append(i))
+        self.assertEqual((batches, reported), (3, [1, 2, 3]))
+        after = self._table_state()
+        self.assertEqual(after["meetings"][0], BASE_ROW_COUNTS["meetings"] + 3 * self.counts["meetings"])
+        meetings = _query(self.db_path, "SELECT client_id, host_employee_id, topic FROM meetings ORDER BY id")
+        self.assertNotEqual(meetings[-4:], meetings[-8:-4])  # 배치마다 다른 행이 생성된다
+
+
+class ParallelSeedTest(unittest.TestCase):
+    def _seed(self, workers: int) -> Path:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        db_path = Path(tmp.name) / "test.db"
+        previous = init_db.DB_PATH
+        init_db.use_database(db_path)
+        try:
+            init_db.reset_db()
+            init_db.insert_data_into_db(employees_count=300, meetings_count=25_000, workers=workers)
+        finally:
+            init_db.use_database(previous)
+        return db_path
+
+    def test_workers_produce_the_same_rows_as_a_single_process(self):
+        single, parallel = self._seed(1), self._seed(3)
+        for table in TABLE_ORDER:
+            with self.subTest(table=table):
+                sql = f"SELECT * FROM {table} ORDER BY id"
+                self.assertEqual(_query(parallel, sql), _query(single, sql))
+        self.assertEqual(_query(parallel, "PRAGMA foreign_key_check"), [])
+
+    def test_worker_count_is_bounded(self):
+        with self.assertRaises(ValueError):
+            init_db.insert_plan_parallel(init_db.build_plan(), init_db.MAX_WORKERS + 1)
+
+
+class SnapshotTest(unittest.TestCase):
+    plan = init_db.build_plan(overrides={"meetings": 50})
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        for module in (init_db, snapshot):
+            patcher = mock.patch.object(module, "SNAPSHOT_DIR", self.tmp / "snapshots")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(init_db.use_database, init_db.DB_PATH)
+
+    def test_second_prepare_reuses_the_snapshot(self):
+        first = init_db.prepare_database(self.plan, db_path=self.tmp / "first.db")
+        self.assertEqual(len(list((self.tmp / "snapshots").glob("*.db"))), 1)
+        with mock.patch.object(init_db, "_build_snapshot", side_effect=AssertionError("snapshot not reused")):
+            second = init_db.prepare_database(self.plan, db_path=self.tmp / "second.db")
+        init_db._get_engine().dispose()
+        for table in TABLE_ORDER:
+            with self.subTest(table=table):
+                sql = f"SELECT * FROM {table} ORDER BY id"
+                self.assertEqual(_query(second, sql), _query(first, sql))
+        self.assertEqual(_query(second, "SELECT COUNT(*) FROM meetings")[0][0], 50)
+
+    def test_snapshot_key_follows_plan_and_fts(self):
+        key = init_db.database_snapshot_key(self.plan)
+        self.assertEqual(init_db.database_snapshot_key(init_db.build_plan(overrides={"meetings": 50})), key)
+        self.assertNotEqual(init_db.database_snapshot_key(init_db.build_plan()), key)
+        self.assertNotEqual(init_db.database_snapshot_key(self.plan, fts=False), key)
+
+    def test_in_memory_database(self):
+        self.addCleanup(snapshot.drop_memory_db, "test_init_db")
+        uri = init_db.prepare_database(self.plan, in_memory="test_init_db")
+        self.assertEqual(init_db.DB_PATH, uri)
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0], 50)
+        self.assertEqual(list(self.tmp.glob("*.db")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+로컬 문서 BM25 검색(LocalSearchClient) 회귀 테스트. 임시 디렉터리에 만든 문서와 인덱스를 사용한다.
+
+사용법:
+    python -m unittest discover -s test -p "test_local_search.py"
+"""
+
+from pathlib import Path
+from unittest import mock
+import json
+import math
+import tempfile
+import unittest
+
+from tools import local_search
+from tools.local_search import B, K1, LocalSearchClient, tokenize
+
+DOCUMENTS = {
+    "메시.txt": "리오넬 메시는 바르셀로나에서 뛰며 통산 800골 이상을 기록했다. 메시의 골 기록은 계속 늘고 있다.",
+    "호날두.txt": "크리스티아누 호날두는 통산 골 기록에서 메시를 앞선다. 호날두의 골은 900골을 넘었다.",
+    "날씨.md": "# 오늘의 날씨\n서울은 맑고 부산은 흐리다. 골목길에는 바람이 분다.",
+    "notes.txt": "Python BM25 ranking notes. BM25 uses term frequency and inverse document frequency.",
+}
+KORQUAD = {
+    "data": [
+        {
+            "title": "대한민국",
+            "paragraphs": [{"context": "대한민국의 수도는 서울이다."}, {"context": "대한민국은 동아시아에 있다."}],
+        }
+    ]
+}
+
+
+def _reference_scores(documents: list, query: str) -> dict:
+    """색인 없이 문서마다 직접 계산한 BM25 점수 {문서 번호: 점수}."""
+    tokenized = [tokenize(f"{document['title']} {document['text']}") for document in documents]
+    avg_length = sum(map(len, tokenized)) / len(tokenized)
+    scores = {}
+    for term in set(tokenize(query)):
+        df = sum(term in tokens for tokens in tokenized)
+        if not df:
+            continue
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        for doc_id, tokens in enumerate(tokenized):
+            tf = tokens.count(term)
+            if tf:
+                norm = K1 * (1 - B + B * len(tokens) / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+    return scores
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_hangul_words_become_bigrams(self):
+        self.assertEqual(tokenize("호날두의 BM25 골"), ["호날", "날두", "두의", "bm25", "골"])
+
+
+class LocalSearchClientTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.corpus = Path(tmp.name) / "corpus"
+        self.corpus.mkdir()
+        for name, text in DOCUMENTS.items():
+            (self.corpus / name).write_text(text, encoding="utf-8")
+        (self.corpus / "korquad.json").write_text(json.dumps(KORQUAD, ensure_ascii=False), encoding="utf-8")
+        self.index_dir = Path(tmp.name) / "index"
+
+    def _client(self, **kwargs) -> LocalSearchClient:
+        client = LocalSearchClient([self.corpus], self.index_dir, **kwargs)
+        client._load()
+        if hasattr(client, "_mmap"):
+            self.addCleanup(client._mmap.close)
+            self.addCleanup(client._postings.release)
+        return client
+
+    def _titles(self, client: LocalSearchClient, query: str) -> list:
+        return [item["title"] for item in client.search({"q": query})["organic_results"]]
+
+    def test_most_relevant_document_ranks_first(self):
+        client = self._client()
+        self.assertEqual(self._titles(client, "호날두의 골 기록")[0], "호날두")
+        self.assertEqual(self._titles(client, "메시가 바르셀로나에서")[0], "메시")
+        self.assertEqual(self._titles(client, "bm25 ranking"), ["notes"])
+        self.assertEqual(self._titles(client, "없는단어zzz"), [])
+
+    def test_scores_match_a_direct_bm25_computation(self):
+        client = self._client()
+        for query in ("호날두의 골 기록", "서울 날씨", "대한민국 수도", "frequency"):
+            with self.subTest(query=query):
+                expected = _reference_scores(client._documents, query)
+                results = client.query(query, top_k=len(client._documents))
+                self.assertEqual({doc_id for _, doc_id in results}, set(expected))
+                for score, doc_id in results:
+                    self.assertAlmostEqual(score, expected[doc_id])
+
+    def test_results_have_the_serpapi_shape(self):
+        client = self._client(top_k=2, snippet_chars=20)
+        results = client.search({"q": "대한민국 수도"})["organic_results"]
+        self.assertEqual([item["position"] for item in results], [1, 2])
+        self.assertEqual(results[0]["link"], "local://korquad.json#0.0")
+        self.assertIn("수도", results[0]["snippet"])
+        self.assertTrue(all(len(item["snippet"].strip(".")) <= 20 for item in results))
+
+    def test_index_is_rebuilt_only_when_files_change(self):
+        with mock.patch.object(local_search, "build_index", wraps=local_search.build_index) as build:
+            self._client()
+            self._client()
+            self.assertEqual(build.call_count, 1)
+
+            (self.corpus / "메시.txt").write_text("메시는 은퇴 후 감독이 되었다.", encoding="utf-8")
+            client = self._client()
+            self.assertEqual(build.call_count, 2)
+        self.assertEqual(self._titles(client, "감독")[0], "메시")
+
+
+if __name__ == "__main__":
+    unittest.main()
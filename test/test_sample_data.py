@@ -0,0 +1,69 @@
+"""
+샘플 데이터 생성기 회귀 테스트. DB 없이 생성기 출력만 검사한다.
+
+사용법:
+    python -m unittest discover -s test -p "test_sample_data.py"
+"""
+
+import unittest
+
+from db.sample_data import (
+    BASE_ROW_COUNTS,
+    CHUNK_SIZE,
+    FIXED_TABLES,
+    TABLE_COLUMNS,
+    build_plan,
+    generate_chunk,
+    iter_table,
+    scaled_row_counts,
+)
+
+
+class ScaledRowCountsTest(unittest.TestCase):
+    def test_catalog_tables_do_not_scale_and_overrides_win(self):
+        counts = scaled_row_counts(10, {"meetings": 7, "clients": None})
+        for table, base in BASE_ROW_COUNTS.items():
+            with self.subTest(table=table):
+                if table == "meetings":
+                    self.assertEqual(counts[table], 7)
+                elif table in FIXED_TABLES:
+                    self.assertEqual(counts[table], base)
+                else:
+                    self.assertEqual(counts[table], base * 10)
+
+
+class GenerateChunkTest(unittest.TestCase):
+    plan = build_plan(overrides={"employees": CHUNK_SIZE * 2 + 500, "meetings": CHUNK_SIZE * 2 + 500})
+
+    def test_chunks_do_not_depend_on_generation_order(self):
+        for table in ("employees", "meetings"):
+            with self.subTest(table=table):
+                in_order = list(iter_table(self.plan, table))
+                self.assertEqual(len(in_order), 3)
+                shuffled = [generate_chunk(self.plan, table, chunk) for chunk in (2, 0, 1)]
+                self.assertEqual(shuffled, [in_order[2], in_order[0], in_order[1]])
+
+    def test_same_seed_same_rows(self):
+        other_seed = build_plan(seed=7)
+        for table in TABLE_COLUMNS:
+            with self.subTest(table=table):
+                rows = list(iter_table(build_plan(), table))
+                self.assertEqual(rows, list(iter_table(build_plan(), table)))
+                if table not in FIXED_TABLES:
+                    self.assertNotEqual(rows, list(iter_table(other_seed, table)))
+
+    def test_ids_are_dense_and_emails_unique(self):
+        rows = [row for chunk in iter_table(self.plan, "employees") for row in chunk]
+        self.assertEqual([row[0] for row in rows], list(range(1, self.plan.count("employees") + 1)))
+        emails = [row[TABLE_COLUMNS["employees"].index("email")] for row in rows]
+        self.assertEqual(len(set(emails)), len(emails))
+
+    def test_created_at_increases_within_the_window(self):
+        created_at = [row[-1] for chunk in iter_table(self.plan, "meetings") for row in chunk]
+        self.assertEqual(created_at, sorted(created_at))
+        self.assertGreaterEqual(created_at[0], f"{self.plan.start:%Y-%m-%d %H:%M:%S}")
+        self.assertLessEqual(created_at[-1], f"{self.plan.end:%Y-%m-%d %H:%M:%S}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+웹 검색 캐시(SearchCache) 회귀 테스트. 임시 파일을 사용하며 실제 검색은 하지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_search_cache.py"
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import tempfile
+import unittest
+
+from tools.search_cache import SearchCache
+
+PARAMS = {"q": "테스트 검색어", "backend": "stub"}
+
+
+class SearchCacheTest(unittest.TestCase):
+    def _cache(self, **kwargs) -> SearchCache:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache = SearchCache(Path(tmp.name) / "search.db", **kwargs)
+        self.addCleanup(cache._conn.close)
+        return cache
+
+    def _last_used(self, cache: SearchCache) -> float:
+        return cache._conn.execute("SELECT last_used FROM search_cache").fetchone()[0]
+
+    def test_hits_within_touch_interval_do_not_write(self):
+        cache = self._cache(touch_interval=60)
+        cache.get_or_fetch(PARAMS, lambda: {"organic_results": []})
+        written = self._last_used(cache)
+        changes = cache._conn.total_changes
+        for _ in range(10):
+            cache.get_or_fetch(PARAMS, lambda: self.fail("cached result expected"))
+        self.assertEqual(self._last_used(cache), written)
+        self.assertEqual(cache._conn.total_changes, changes)
+
+    def test_hits_after_touch_interval_refresh_last_used(self):
+        cache = self._cache(touch_interval=0)
+        cache.get_or_fetch(PARAMS, lambda: {"organic_results": []})
+        written = self._last_used(cache)
+        cache.get_or_fetch(PARAMS, lambda: self.fail("cached result expected"))
+        self.assertGreaterEqual(self._last_used(cache), written)
+        self.assertGreater(cache._conn.total_changes, 1)
+
+    def test_counters_are_exact_under_concurrent_lookups(self):
+        cache = self._cache()
+        cache.get_or_fetch(PARAMS, lambda: {"organic_results": []})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: cache.get_or_fetch(PARAMS, dict), range(800)))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (800, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
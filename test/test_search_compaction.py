@@ -0,0 +1,107 @@
+"""
+검색 결과 압축(compact_result, fit_to_budget, CompactionStats) 회귀 테스트. 검색은 하지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_search_compaction.py"
+"""
+
+import json
+import unittest
+
+from tools.search_compaction import CompactionStats, compact_result, estimate_tokens, fit_to_budget
+
+SERPAPI_RESULT = {
+    "search_metadata": {"id": "abc", "status": "Success"},
+    "answer_box": {"type": "organic_result", "answer": "672골", "thumbnail": "https://example.com/t.png"},
+    "organic_results": [
+        {
+            "position": 1,
+            "title": "날씨 소식",
+            "link": "https://example.com/weather",
+            "snippet": "오늘은 맑음",
+            "sitelinks": {"inline": [{"title": "더보기", "link": "https://example.com/more"}]},
+        },
+        {
+            "position": 2,
+            "title": "메시 통산 골 기록",
+            "link": "https://example.com/messi",
+            "snippet": "메시는 통산 골 " + "기록 " * 200,
+            "date": "2024-05-01",
+        },
+    ],
+}
+
+
+def _tokens(value) -> int:
+    return estimate_tokens(json.dumps(value, ensure_ascii=False))
+
+
+class CompactResultTest(unittest.TestCase):
+    def test_keeps_only_answer_and_result_fields(self):
+        result = compact_result(SERPAPI_RESULT)
+        self.assertEqual(result["answer"], "672골")
+        self.assertEqual(
+            result["organic_results"][0],
+            {"title": "날씨 소식", "link": "https://example.com/weather", "snippet": "오늘은 맑음"},
+        )
+        self.assertEqual(result["organic_results"][1]["date"], "2024-05-01")
+        self.assertNotIn("search_metadata", result)
+        self.assertGreater(result["source_bytes"], len(json.dumps(result, ensure_ascii=False).encode("utf-8")))
+
+    def test_compacting_twice_is_a_no_op(self):
+        result = compact_result(SERPAPI_RESULT)
+        self.assertIs(compact_result(result), result)
+
+    def test_estimate_tokens_counts_hangul_per_character(self):
+        self.assertEqual(estimate_tokens("abcd"), 1)
+        self.assertEqual(estimate_tokens("가나다"), 3)
+
+
+class FitToBudgetTest(unittest.TestCase):
+    result = compact_result(SERPAPI_RESULT)
+
+    def test_query_matches_rank_first_and_snippets_are_trimmed(self):
+        fitted = fit_to_budget("메시 골", self.result, max_tokens=10_000, snippet_chars=20)
+        self.assertEqual(
+            [item["link"] for item in fitted["organic_results"]],
+            ["https://example.com/messi", "https://example.com/weather"],
+        )
+        self.assertTrue(all(len(item["snippet"]) <= 20 for item in fitted["organic_results"]))
+        self.assertNotIn("source_bytes", fitted)
+
+    def test_fitted_result_stays_within_budget(self):
+        for budget in (60, 120, 400):
+            with self.subTest(budget=budget):
+                fitted = fit_to_budget("메시 골", self.result, max_tokens=budget, snippet_chars=1000)
+                self.assertLessEqual(_tokens(fitted), budget)
+                # 스니펫 전체가 예산을 넘어도 가장 관련 있는 결과 하나는 잘린 스니펫으로 남는다.
+                self.assertEqual(fitted["organic_results"][0]["link"], "https://example.com/messi")
+
+        # 제목과 link만으로도 예산을 넘으면 결과를 담지 않는다.
+        fitted = fit_to_budget("메시 골", self.result, max_tokens=20, snippet_chars=1000)
+        self.assertEqual(fitted["organic_results"], [])
+
+
+class CompactionStatsTest(unittest.TestCase):
+    def test_records_savings_per_call_and_in_total(self):
+        stats = CompactionStats()
+        result = compact_result(SERPAPI_RESULT)
+        for query in ("메시 골", "날씨"):
+            fitted = fit_to_budget(query, result, max_tokens=100, snippet_chars=50)
+            entry = stats.record(query, result, fitted)
+            self.assertEqual(entry["tokens_before"], result["source_tokens"])
+            self.assertEqual(entry["tokens_after"], _tokens(fitted))
+            self.assertGreater(entry["tokens_saved"], 0)
+
+        totals = stats.stats()
+        self.assertEqual(totals["calls"], 2)
+        self.assertEqual(totals["tokens_before"], 2 * result["source_tokens"])
+        self.assertEqual(totals["tokens_saved"], totals["tokens_before"] - totals["tokens_after"])
+        self.assertEqual(totals["last"]["query"], "날씨")
+
+        stats.reset()
+        self.assertEqual(stats.stats()["calls"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
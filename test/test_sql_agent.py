@@ -0,0 +1,56 @@
+"""
+SQL 에이전트 시스템 프롬프트 회귀 테스트. 임시 DB를 만들어 사용하며 LLM은 호출하지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_sql_agent.py"
+"""
+
+from contextlib import closing
+from pathlib import Path
+import os
+import sqlite3
+import tempfile
+import unittest
+
+os.environ.setdefault("OPENAI_API_KEY", "test")  # 모듈 import 시 만들어지는 ChatOpenAI는 호출되지 않는다
+
+from agents import sql_agent  # noqa: E402
+from db import init_db  # noqa: E402
+from tools import db_tool  # noqa: E402
+
+
+class SystemPromptTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = Path(tmp.name) / "test.db"
+        previous = init_db.DB_PATH
+        init_db.use_database(self.db_path)
+        try:
+            init_db.reset_db()
+            init_db.insert_data_into_db()
+        finally:
+            init_db.use_database(previous)
+        db_tool.use_database(self.db_path)
+        self.addCleanup(db_tool.use_database, init_db.DB_PATH)
+
+    def _execute(self, sql: str) -> int:
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(sql)
+            return conn.execute("SELECT COUNT(*) FROM departments").fetchone()[0]
+
+    def test_prompt_follows_row_count_changes(self):
+        count = self._execute("SELECT 1")
+        self.assertIn(f"departments ({count} rows)", sql_agent.build_system_prompt())
+
+        count = self._execute("INSERT INTO departments (name, location, created_at) VALUES ('Prompt Test', 'Seoul', '2025-01-01')")
+        self.assertIn(f"departments ({count} rows)", sql_agent.build_system_prompt())
+
+    def test_prompt_follows_schema_changes(self):
+        self.assertNotIn("prompt_test", sql_agent.build_system_prompt())
+        self._execute("CREATE TABLE prompt_test (id INTEGER PRIMARY KEY)")
+        self.assertIn("prompt_test", sql_agent.build_system_prompt())
+
+
+if __name__ == "__main__":
+    unittest.main()
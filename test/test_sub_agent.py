@@ -0,0 +1,175 @@
+"""
+서브 에이전트 동시 실행 상한 회귀 테스트. 스텁 모델을 사용하며 LLM은 호출하지 않는다.
+
+사용법:
+    python -m unittest discover -s test -p "test_sub_agent.py"
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import itertools
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("OPENAI_API_KEY", "test")  # 모듈 import 시 만들어지는 ChatOpenAI는 호출되지 않는다
+
+from langchain.agents import create_agent  # noqa: E402
+from langchain_core.messages import AIMessage  # noqa: E402
+from langchain_core.tools import tool  # noqa: E402
+
+from agents import calculator_agent, sql_agent, sub_agent, web_agent  # noqa: E402
+from benchmarks.bench_sub_agents import SUB_AGENT_TOOLS, LatencyChatModel, _master_respond  # noqa: E402
+
+
+class _TrackingAgent:
+    """ainvoke가 동시에 몇 개 실행 중인지 기록하는 서브 에이전트 스텁."""
+
+    def __init__(self, tracker: dict):
+        self.tracker = tracker
+
+    async def ainvoke(self, inputs: dict) -> dict:
+        self.tracker["running"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.tracker["running"] -= 1
+        return {"messages": [AIMessage(content="ok")]}
+
+
+class ConcurrencyCapTest(unittest.TestCase):
+    questions = itertools.count()
+
+    def setUp(self):
+        self.tracker = {"running": 0, "peak": 0}
+        for module in (sql_agent, web_agent, calculator_agent):
+            previous = module.agent
+            module.agent = _TrackingAgent(self.tracker)
+            self.addCleanup(setattr, module, "agent", previous)
+        previous = sub_agent.SUB_AGENT_MAX_CONCURRENCY
+        self.addCleanup(setattr, sub_agent, "SUB_AGENT_MAX_CONCURRENCY", previous)
+        self.master = create_agent(model=LatencyChatModel(latency=0, respond=_master_respond), tools=SUB_AGENT_TOOLS)
+
+    def _run(self, requests: int) -> None:
+        async def run() -> None:
+            # 질문을 매번 다르게 해 서브 에이전트 응답 캐시를 거치지 않게 한다.
+            await asyncio.gather(
+                *(
+                    self.master.ainvoke({"messages": [{"role": "user", "content": f"cap test {next(self.questions)}"}]})
+                    for _ in range(requests)
+                )
+            )
+
+        asyncio.run(run())
+
+    def test_cap_applies_to_calls_of_one_request(self):
+        sub_agent.SUB_AGENT_MAX_CONCURRENCY = 1
+        self._run(requests=1)
+        self.assertEqual(self.tracker["peak"], 1)
+
+    def test_calls_of_one_request_run_concurrently_under_the_cap(self):
+        sub_agent.SUB_AGENT_MAX_CONCURRENCY = len(SUB_AGENT_TOOLS)
+        self._run(requests=1)
+        self.assertEqual(self.tracker["peak"], len(SUB_AGENT_TOOLS))
+
+    def test_cap_is_per_request(self):
+        sub_agent.SUB_AGENT_MAX_CONCURRENCY = 1
+        self._run(requests=3)
+        self.assertEqual(self.tracker["peak"], 3)
+
+
+class _CountingAgent:
+    """ainvoke 호출 횟수를 세고, fail이 설정되어 있으면 예외를 내는 서브 에이전트 스텁."""
+
+    def __init__(self, delay: float = 0.05):
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+
+    def answer(self, input_text: str) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("LLM error")
+        return f"answer {self.calls}: {input_text}"
+
+    async def ainvoke(self, inputs: dict) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"messages": [AIMessage(content=f"answer {self.calls}")]}
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        sub_agent.clear_response_cache()
+        self.agent = _CountingAgent()
+        self.version = 1
+
+    def _tool(self, ttl: float = 60):
+        agent = self.agent
+
+        @tool
+        def call_stub_agent(input_text: str) -> str:
+            """스텁 서브 에이전트."""
+            return agent.answer(input_text)
+
+        wrapped = sub_agent.with_async_agent(lambda: agent)(call_stub_agent)
+        return sub_agent.with_response_cache(ttl, get_version=lambda: self.version)(wrapped)
+
+    def test_normalized_inputs_share_a_response(self):
+        stub = self._tool()
+        first = stub.invoke({"input_text": "매출  상위 고객은?"})
+        self.assertEqual(stub.invoke({"input_text": " 매출 상위 고객은? "}), first)
+        self.assertEqual(stub.invoke({"input_text": "TOP clients"}), stub.invoke({"input_text": "top  CLIENTS"}))
+        self.assertEqual(self.agent.calls, 2)
+
+    def test_version_change_and_zero_ttl_skip_the_cache(self):
+        stub = self._tool()
+        stub.invoke({"input_text": "q"})
+        self.version = 2
+        stub.invoke({"input_text": "q"})
+        self.assertEqual(self.agent.calls, 2)
+
+        uncached = self._tool(ttl=0)
+        uncached.invoke({"input_text": "now"})
+        uncached.invoke({"input_text": "now"})
+        self.assertEqual(self.agent.calls, 4)
+
+    def test_concurrent_calls_run_once(self):
+        stub = self._tool()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: stub.invoke({"input_text": "sync"}), range(5)))
+        self.assertEqual(self.agent.calls, 1)
+        self.assertEqual(len(set(results)), 1)
+
+        async def run():
+            return await asyncio.gather(*(stub.ainvoke({"input_text": "async"}) for _ in range(5)))
+
+        self.assertEqual(len(set(asyncio.run(run()))), 1)
+        self.assertEqual(self.agent.calls, 2)
+
+    def test_failure_reaches_every_waiter_and_is_not_cached(self):
+        stub = self._tool()
+        self.agent.fail = True
+        barrier = threading.Barrier(3)
+
+        def call(_):
+            barrier.wait(timeout=5)
+            try:
+                stub.invoke({"input_text": "boom"})
+            except RuntimeError as e:
+                return str(e)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.assertEqual(list(executor.map(call, range(3))), ["LLM error"] * 3)
+        self.assertEqual(self.agent.calls, 1)
+        self.assertEqual(sub_agent._IN_FLIGHT, {})
+
+        self.agent.fail = False
+        self.assertTrue(stub.invoke({"input_text": "boom"}).startswith("answer 2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
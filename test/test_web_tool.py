@@ -0,0 +1,113 @@
+"""
+여러 쿼리 동시 검색(google_search_batch) 회귀 테스트. 가짜 검색 클라이언트와 임시 캐시 파일을 사용한다.
+
+사용법:
+    python -m unittest discover -s test -p "test_web_tool.py"
+"""
+
+from pathlib import Path
+from unittest import mock
+import tempfile
+import threading
+import unittest
+
+from tools import web_tool
+from tools.search_cache import SearchCache
+
+
+class StubSearchClient:
+    """쿼리별로 정해 둔 organic_results를 SerpAPI 형식으로 돌려주고, 검색한 쿼리를 기록한다."""
+
+    name = "stub"
+
+    def __init__(self, results: dict, barrier: threading.Barrier = None):
+        self.results = results
+        self.barrier = barrier
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def search(self, params: dict) -> dict:
+        with self._lock:
+            self.queries.append(params["q"])
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)  # 모든 쿼리가 동시에 검색 중이어야 통과한다
+        result = self.results[params["q"]]
+        if "error" in result:
+            return result
+        return {"organic_results": result["organic_results"], "search_metadata": {"id": params["q"]}}
+
+
+def _item(link: str, title: str) -> dict:
+    return {"title": title, "link": link, "snippet": f"{title} 요약", "position": 1}
+
+
+class GoogleSearchBatchTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache = SearchCache(Path(tmp.name) / "search.db")
+        self.addCleanup(cache._conn.close)
+        patcher = mock.patch.object(web_tool, "_search_cache", cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(web_tool.set_search_client, web_tool._search_client)
+
+    def _batch(self, client: StubSearchClient, queries: list) -> dict:
+        web_tool.set_search_client(client)
+        return web_tool.google_search_batch.invoke({"queries": queries})
+
+    def test_results_interleave_by_rank_and_dedupe_by_link(self):
+        client = StubSearchClient(
+            {
+                "메시 골 수": {"organic_results": [_item("a", "A"), _item("shared", "공통"), _item("c", "C")]},
+                "호날두 골 수": {"organic_results": [_item("b", "B"), _item("shared", "공통")]},
+            }
+        )
+        result = self._batch(client, ["메시 골 수", "호날두 골 수"])
+        links = [item["link"] for item in result["organic_results"]]
+        self.assertEqual(links, ["a", "b", "shared", "c"])
+        shared = result["organic_results"][2]
+        self.assertEqual(shared["queries"], ["메시 골 수", "호날두 골 수"])
+        self.assertNotIn("position", shared)
+        self.assertNotIn("errors", result)
+
+    def test_duplicate_and_blank_queries_are_searched_once(self):
+        client = StubSearchClient({"메시 골 수": {"organic_results": [_item("a", "메시 A")]}})
+        result = self._batch(client, ["메시 골 수", " 메시 골 수 ", "", "메시 골 수"])
+        self.assertEqual(client.queries, ["메시 골 수"])
+        self.assertEqual(result["organic_results"][0]["queries"], ["메시 골 수"])
+
+    def test_queries_run_concurrently(self):
+        queries = ["q1", "q2", "q3"]
+        client = StubSearchClient(
+            {query: {"organic_results": [_item(query, query)]} for query in queries},
+            barrier=threading.Barrier(len(queries)),
+        )
+        result = self._batch(client, queries)
+        self.assertEqual([item["link"] for item in result["organic_results"]], queries)
+
+    def test_errors_are_reported_per_query(self):
+        client = StubSearchClient(
+            {
+                "ok": {"organic_results": [_item("a", "A")]},
+                "quota": {"error": "Your account has run out of searches."},
+            }
+        )
+        result = self._batch(client, ["ok", "quota"])
+        self.assertEqual([item["link"] for item in result["organic_results"]], ["a"])
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertEqual(result["errors"][0]["query"], "quota")
+        self.assertIn("run out of searches", result["errors"][0]["error"])
+
+        # 에러는 캐시하지 않으므로 다시 호출하면 다시 검색한다.
+        self._batch(client, ["ok", "quota"])
+        self.assertEqual(sorted(client.queries), ["ok", "quota", "quota"])
+
+    def test_empty_query_list_is_an_error(self):
+        client = StubSearchClient({})
+        self.assertIn("error", self._batch(client, ["", "  "]))
+        self.assertEqual(client.queries, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from typing import Any, Dict, Hashable, Optional
+from collections import OrderedDict
+import threading
+
+
+class LRUCache:
+    """
+    항목 수와 바이트 크기 두 기준으로 오래된 항목부터 제거하는 스레드 안전 LRU 캐시.
+
+    값의 바이트 크기는 호출하는 쪽에서 계산해 set()에 넘긴다.
+    hit/miss/eviction/invalidation 횟수를 세어 stats()로 제공한다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """키에 해당하는 값을 반환하고 최근 사용으로 표시. 없으면 default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int = 0) -> None:
+        """값을 저장하고 한도를 넘으면 가장 오래된 항목부터 제거. 한도보다 큰 값은 저장하지 않는다."""
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """키를 제거하고 값을 반환. 없으면 None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        """모든 항목을 무효화."""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 크기를 정하는 데 쓸 수 있는 카운터와 현재 사용량."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
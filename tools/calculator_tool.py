@@ -1,7 +1,11 @@
 from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
 
 from langchain.tools import tool
 
+from tools.expression import ExpressionError, compile_expression, evaluate_over
+
 
 @tool
 def get_current_datetime() -> str:
@@ -15,27 +19,81 @@ def get_current_datetime() -> str:
     return now.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _format_result(value: Any) -> Any:
+    """Decimal 결과는 정확한 값이 유지되도록 문자열로 반환."""
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
 @tool
-def calculate_math_expression(expression: str) -> float:
+def calculate_math_expression(expression: str, variables: Optional[dict] = None, exact: bool = False) -> float:
     """
     주어진 수학 표현식을 계산하여 결과를 반환.
+    사칙연산(+, -, *, /), 몫(//), 나머지(%), 거듭제곱(**), 괄호, 함수 round/abs/min/max/sum, 상수 pi/e를 사용할 수 있다.
 
     Args:
-        expression (str): 계산할 수학 표현식.
+        expression (str): 계산할 수학 표현식. (예: "round(price * (1 + rate) ** years, 2)")
+        variables (dict): 표현식에서 사용하는 변수 값. (예: {"price": 1000, "rate": 0.05, "years": 3})
+        exact (bool): True면 십진수(Decimal)로 정확하게 계산하고 결과를 문자열로 반환. (예: 0.1 + 0.2 -> "0.3")
     Returns:
         float: 계산 결과.
     """
     try:
-        result = 0
-        for s in expression:
-            if s not in "0123456789+-*/(). ":
-                return "유효하지 않은 문자 포함"
-        result = eval(expression)
-        return result
-    except Exception as e:
+        return _format_result(compile_expression(expression).evaluate(variables, exact))
+    except ExpressionError as e:
         return f"계산 중 오류 발생: {e}"
 
 
+@tool
+def calculate_math_expressions(
+    expressions: list[str],
+    variables: Optional[dict] = None,
+    bindings: Optional[list[dict]] = None,
+    exact: bool = False,
+) -> list:
+    """
+    여러 수학 표현식을 한 번에 계산하거나, 표현식을 여러 변수 값 조합에 대해 한 번에 계산하여 결과 목록을 반환.
+    계산 단계가 여러 개일 때 도구를 여러 번 호출하지 말고 이 도구로 한 번에 계산하세요.
+    사용 가능한 문법은 calculate_math_expression과 같다.
+
+    Args:
+        expressions (list[str]): 계산할 수학 표현식 목록.
+        variables (dict): 모든 표현식에 공통으로 쓰는 변수 값. 값이 리스트인 변수는 원소마다 계산한다.
+            (예: {"price": [1000, 2000, 3000], "rate": 0.1})
+        bindings (list[dict]): 변수 값 조합 목록. 주어지면 각 표현식을 조합마다 계산한다.
+            (예: [{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+        exact (bool): True면 십진수(Decimal)로 정확하게 계산하고 결과를 문자열로 반환.
+    Returns:
+        list: 표현식별 계산 결과. 리스트 변수나 bindings가 있으면 각 결과도 원소/조합별 리스트.
+            계산에 실패한 항목은 오류 메시지 문자열.
+    """
+    variables = dict(variables or {})
+    columns = {name: value for name, value in variables.items() if isinstance(value, list)}
+    scalars = {name: value for name, value in variables.items() if not isinstance(value, list)}
+    if bindings:
+        names = {name for binding in bindings for name in binding}
+        missing = [name for name in names if any(name not in binding for binding in bindings)]
+        if missing:
+            return [f"계산 중 오류 발생: 일부 bindings에 변수가 없습니다: {', '.join(sorted(missing))}"]
+        columns.update({name: [binding[name] for binding in bindings] for name in names})
+
+    results = []
+    for expression in expressions:
+        try:
+            compiled = compile_expression(expression)
+            if columns:
+                values = evaluate_over(compiled, columns, scalars, exact)
+                results.append(
+                    [f"계산 중 오류 발생: {v}" if isinstance(v, ExpressionError) else _format_result(v) for v in values]
+                )
+            else:
+                results.append(_format_result(compiled.evaluate(scalars, exact)))
+        except ExpressionError as e:
+            results.append(f"계산 중 오류 발생: {e}")
+    return results
+
+
 @tool
 def sort_values_based_on_key(values: list, key: str) -> list:
     """
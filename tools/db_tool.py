@@ -1,30 +1,105 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
+import asyncio
+import base64
+import contextvars
+import copy
+import functools
+import inspect
+import json
+import os
+import re
+import sqlite3
+import threading
 
-from sqlalchemy import create_engine, inspect, Table, MetaData, select
+from sqlalchemy import Table, MetaData, Column, Date, DateTime, String, select, func, and_, or_, not_
+from sqlalchemy import table as table_clause, column as column_clause
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import sessionmaker, Session
 from langchain.tools import tool
 
+from db.engine import DB_PATH, SQLITE_POOL_SIZE, create_sqlite_engine, is_memory_db
+from db.fts import FTS_MIN_TERM_LENGTH, fts_table_name, get_fts_columns, is_fts_table
+from tools.cache import LRUCache
+from tools.index_advisor import record_column_usage
+from tools.schema_catalog import format_schema_catalog, load_schema_catalog
+
 
 _ENGINE = None  # lazy 생성
 SessionLocal = None  # lazy 세션팩토리
 
-# 프로젝트 루트 기준 DB 파일 경로 (현재 파일: tools/db_tool.py)
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-DB_PATH = PROJECT_ROOT / "db" / "data.db"
+# 행을 반환하는 툴의 페이지 크기 (limit 미지정 시 기본값 / 최대값)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# 행을 반환하는 툴의 결과 포맷: 행마다 dict("rows") 또는 컬럼 헤더 + 값 튜플("columnar")
+RESULT_FORMATS = ("rows", "columnar")
+
+# 프로세스 전역 스키마 레지스트리: 한 번 리플렉션한 Table 객체를 공유하고,
+# SQLite의 PRAGMA schema_version이 바뀌었을 때만 다시 리플렉션한다.
+_SCHEMA_METADATA: Optional[MetaData] = None
+_SCHEMA_VERSION: Optional[int] = None
+_SCHEMA_LOCK = threading.Lock()
+# 스키마와 함께 갱신되는 FTS 인덱스 목록: {원본 테이블: 인덱싱된 컬럼}
+_FTS_COLUMNS: Dict[str, Tuple[str, ...]] = {}
+# FTS 조회 전에 일치 건수를 세어 보는 상한. 이 이상 일치하는 흔한 검색어는 LIKE 스캔이 더 빠르다.
+FTS_PROBE_LIMIT = int(os.getenv("DB_TOOL_FTS_PROBE_LIMIT", "1000"))
+
+# 툴 결과 캐시: (툴 이름, 정규화된 인자) -> 결과. DB 데이터 버전이 바뀌면 통째로 무효화한다.
+_RESULT_CACHE = LRUCache(
+    max_entries=int(os.getenv("DB_TOOL_CACHE_MAX_ENTRIES", "256")),
+    max_bytes=int(os.getenv("DB_TOOL_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+)
+_RESULT_CACHE_VERSION: Optional[tuple] = None
+_RESULT_CACHE_MISSING = object()
+
+# 데이터 버전 확인 전용 커넥션. PRAGMA data_version은 커넥션마다 값이 다르므로 풀과 별도로 하나만 유지한다.
+_VERSION_CONN: Optional[sqlite3.Connection] = None
+_VERSION_FILE: Optional[tuple] = None
+_VERSION_LOCK = threading.Lock()
+
+# async 툴 호출을 처리하는 전용 스레드 풀. 워커 수를 커넥션 풀 크기 이하로 두어 워커마다 커넥션 하나를 쓰게 한다.
+DB_TOOL_ASYNC_WORKERS = int(os.getenv("DB_TOOL_ASYNC_WORKERS", str(SQLITE_POOL_SIZE)))
+_ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=DB_TOOL_ASYNC_WORKERS, thread_name_prefix="db-tool")
 
 
 def _get_engine():
-    """DB 엔진과 세션팩토리를 초기화하고 반환."""
+    """DB 엔진과 세션팩토리를 초기화하고 반환. 툴은 읽기만 하므로 읽기 전용 커넥션 풀을 사용한다."""
     global _ENGINE, SessionLocal
     if _ENGINE is None:
-        # 디렉터리가 없으면 생성 (SQLite는 상위 디렉터리가 없으면 OperationalError 발생)
-        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        _ENGINE = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
+        _ENGINE = create_sqlite_engine(DB_PATH, read_only=True)
         SessionLocal = sessionmaker(bind=_ENGINE, expire_on_commit=False, future=True)
     return _ENGINE
 
 
+def use_database(db_path: Path | str) -> None:
+    """
+    DB 툴이 사용할 DB를 바꾼다. 이후 호출부터 적용된다.
+
+    Args:
+        db_path (Path | str): DB 파일 경로 또는 db.engine.memory_db_uri()로 만든 공유 캐시 인메모리 DB URI.
+            (db.init_db.prepare_database(in_memory=...)의 반환값을 그대로 넘기면 된다)
+    """
+    global DB_PATH, _ENGINE, SessionLocal, _SCHEMA_METADATA, _SCHEMA_VERSION, _VERSION_CONN, _VERSION_FILE
+    with _SCHEMA_LOCK, _VERSION_LOCK:
+        if _ENGINE is not None:
+            _ENGINE.dispose()
+        if _VERSION_CONN is not None:
+            _VERSION_CONN.close()
+        DB_PATH = db_path if is_memory_db(db_path) else Path(db_path)
+        _ENGINE = None
+        SessionLocal = None
+        _SCHEMA_METADATA = None
+        _SCHEMA_VERSION = None
+        _VERSION_CONN = None
+        _VERSION_FILE = None
+    _RESULT_CACHE.clear()
+
+
 def get_session() -> Session:
     """새로운 DB 세션을 반환."""
     if SessionLocal is None:
@@ -32,6 +107,567 @@ def get_session() -> Session:
     return SessionLocal()
 
 
+def _get_data_version() -> tuple:
+    """
+    DB 파일의 데이터 버전을 반환.
+
+    다른 커넥션이 커밋할 때마다 바뀌는 PRAGMA data_version과, 파일 자체가 교체된 경우(reset_db 등)를
+    감지하기 위한 파일 식별자(st_dev, st_ino)를 함께 사용한다. 인메모리 DB는 파일이 없으므로 URI만 쓴다.
+    """
+    global _VERSION_CONN, _VERSION_FILE
+    if is_memory_db(DB_PATH):
+        file_id = (str(DB_PATH), 0, 0)
+        uri = str(DB_PATH)
+    else:
+        stat = os.stat(DB_PATH)
+        file_id = (str(DB_PATH), stat.st_dev, stat.st_ino)
+        uri = f"file:{DB_PATH}?mode=ro"
+    with _VERSION_LOCK:
+        if _VERSION_CONN is None or _VERSION_FILE != file_id:
+            if _VERSION_CONN is not None:
+                _VERSION_CONN.close()
+                # 파일이 교체되었으면 풀에 남은 커넥션이 이전 파일을 가리키므로 함께 정리
+                if _ENGINE is not None:
+                    _ENGINE.dispose()
+            _VERSION_CONN = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            _VERSION_FILE = file_id
+        data_version = _VERSION_CONN.execute("PRAGMA data_version").fetchone()[0]
+    return (*file_id, data_version)
+
+
+def get_data_version() -> tuple:
+    """DB 내용이 바뀔 때마다 달라지는 버전 값. DB 결과를 캐시하는 다른 계층이 무효화 기준으로 쓴다."""
+    return _get_data_version()
+
+
+def _cached_result(func):
+    """
+    툴 함수 결과를 (툴 이름, 정규화된 인자) 키로 캐시하는 데코레이터.
+
+    기본값을 채운 인자를 정렬된 JSON으로 만들어 키로 쓰므로 인자 순서나 기본값 생략 여부와 무관하게 같은 키가 된다.
+    에러 응답은 캐시하지 않는다. 호출부가 결과를 수정해도 캐시에 영향이 없도록 저장할 때와 꺼낼 때 깊은 복사를 한다.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _RESULT_CACHE_VERSION
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, json.dumps(bound.arguments, sort_keys=True, default=str))
+            version = _get_data_version()
+        except Exception:
+            return func(*args, **kwargs)
+
+        if version != _RESULT_CACHE_VERSION:
+            _RESULT_CACHE.clear()
+            _RESULT_CACHE_VERSION = version
+        cached = _RESULT_CACHE.get(key, _RESULT_CACHE_MISSING)
+        if cached is not _RESULT_CACHE_MISSING:
+            return copy.deepcopy(cached)
+
+        result = func(*args, **kwargs)
+        is_error = isinstance(result, str) or (isinstance(result, dict) and "error" in result)
+        if not is_error:
+            size = len(json.dumps(result, ensure_ascii=False, default=str).encode("utf-8"))
+            _RESULT_CACHE.set(key, copy.deepcopy(result), size)
+        return result
+
+    return wrapper
+
+
+def _with_async(db_tool):
+    """
+    동기 DB 툴에 async 구현(coroutine)을 붙이는 데코레이터.
+
+    ainvoke 호출은 이벤트 루프를 막지 않도록 전용 스레드 풀(_ASYNC_EXECUTOR)에서 실행되고,
+    풀 크기로 동시에 실행되는 DB 호출 수가 제한된다. 콜백 등 컨텍스트 변수는 워커 스레드로 전달된다.
+    """
+    func = db_tool.func
+
+    @functools.wraps(func)
+    async def coroutine(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(_ASYNC_EXECUTOR, functools.partial(context.run, func, *args, **kwargs))
+
+    db_tool.coroutine = coroutine
+    return db_tool
+
+
+def get_result_cache_stats() -> Dict[str, Any]:
+    """DB 툴 결과 캐시의 hit/miss/eviction/invalidation 카운터와 현재 사용량을 반환."""
+    return _RESULT_CACHE.stats()
+
+
+def clear_result_cache() -> None:
+    """DB 툴 결과 캐시를 비운다."""
+    _RESULT_CACHE.clear()
+
+
+def _get_schema_version(conn: Connection) -> int:
+    """현재 DB 파일의 스키마 버전(PRAGMA schema_version)을 반환."""
+    return conn.exec_driver_sql("PRAGMA schema_version").scalar()
+
+
+def _get_schema(conn: Connection) -> MetaData:
+    """
+    캐시된 스키마 MetaData를 반환.
+
+    스키마 버전이 마지막 리플렉션 시점과 다르면 전체 테이블을 한 번에 다시 리플렉션한다.
+    반환되는 Table 객체는 프로세스 내에서 공유되므로 SQLAlchemy의 compiled statement 캐시를 재사용할 수 있다.
+    """
+    global _SCHEMA_METADATA, _SCHEMA_VERSION, _FTS_COLUMNS
+    version = _get_schema_version(conn)
+    if _SCHEMA_METADATA is not None and _SCHEMA_VERSION == version:
+        return _SCHEMA_METADATA
+    with _SCHEMA_LOCK:
+        if _SCHEMA_METADATA is None or _SCHEMA_VERSION != version:
+            metadata = MetaData()
+            # FTS 가상 테이블과 shadow 테이블은 툴에 노출하지 않는다.
+            metadata.reflect(bind=conn, only=lambda name, _: not is_fts_table(name))
+            _FTS_COLUMNS = get_fts_columns(conn)
+            _SCHEMA_METADATA = metadata
+            _SCHEMA_VERSION = version
+        return _SCHEMA_METADATA
+
+
+def _get_table(conn: Connection, table_name: str) -> Table:
+    """스키마 레지스트리에서 공유 Table 객체를 반환."""
+    table = _get_schema(conn).tables.get(table_name)
+    if table is None:
+        raise ValueError(f"Table '{table_name}' does not exist.")
+    return table
+
+
+def _get_column(table: Table, column_name: str):
+    """Table에서 컬럼 객체를 반환. 컬럼이 없으면 ValueError."""
+    if column_name not in table.c:
+        raise ValueError(f"Column '{column_name}' does not exist in table '{table.name}'.")
+    return table.c[column_name]
+
+
+def _record_usage(column, kind: str) -> None:
+    """인덱스 어드바이저에 컬럼 사용(filter/join/order_by/group_by)을 기록."""
+    record_column_usage(column.table.name, column.name, kind)
+
+
+def _column_info(table: Table) -> List[Dict[str, Any]]:
+    """Table 객체로부터 inspector.get_columns()와 같은 형태의 컬럼 정보를 만든다."""
+    primary_keys = list(table.primary_key.columns)
+    infos: List[Dict[str, Any]] = []
+    for col in table.c:
+        default = col.server_default.arg.text if col.server_default is not None else None
+        infos.append(
+            {
+                "name": col.name,
+                "type": col.type,
+                "nullable": col.nullable,
+                "default": default,
+                "primary_key": primary_keys.index(col) + 1 if col in primary_keys else 0,
+            }
+        )
+    return infos
+
+
+def _resolve_limit(limit: Optional[int]) -> int:
+    """요청된 limit을 검증하고 [1, MAX_PAGE_SIZE] 범위로 맞춘다."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ValueError("limit must be greater than or equal to 1.")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _primary_key(table: Table) -> Column:
+    """키셋 페이지네이션에 사용할 단일 컬럼 기본키를 반환."""
+    primary_keys = list(table.primary_key.columns)
+    if len(primary_keys) != 1:
+        raise ValueError(f"Table '{table.name}' must have a single-column primary key for pagination.")
+    return primary_keys[0]
+
+
+def _sort_keys(table: Table, order_by: Optional[str]) -> List[Tuple[Column, bool]]:
+    """
+    order_by 문자열을 (컬럼, 내림차순 여부) 정렬 키 리스트로 변환.
+
+    기본키를 항상 마지막 정렬 키로 두어 정렬 순서가 유일하도록 만든다.
+    order_by 앞에 '-'를 붙이면 내림차순이다 (예: '-amount').
+    """
+    primary_key = _primary_key(table)
+    if not order_by:
+        return [(primary_key, False)]
+    descending = order_by.startswith("-")
+    column = _get_column(table, order_by.lstrip("-"))
+    _record_usage(column, "order_by")
+    if column is primary_key:
+        return [(primary_key, descending)]
+    return [(column, descending), (primary_key, descending)]
+
+
+def _join_sort_keys(tables: Dict[str, Table], order_by: Optional[str], resolve_column) -> List[Tuple[Column, bool]]:
+    """
+    조인 결과의 정렬 키. order_by 컬럼 뒤에 조인한 모든 테이블의 기본키를 같은 방향으로 붙여 정렬 순서가 유일하도록 만든다.
+    order_by가 없으면 테이블 순서대로 기본키 오름차순이다.
+    """
+    descending = bool(order_by) and order_by.startswith("-")
+    sort_keys: List[Tuple[Column, bool]] = []
+    if order_by:
+        column = resolve_column(order_by.lstrip("-"))
+        _record_usage(column, "order_by")
+        sort_keys.append((column, descending))
+    for table in tables.values():
+        primary_key = _primary_key(table)
+        if not any(column is primary_key for column, _ in sort_keys):
+            sort_keys.append((primary_key, descending))
+    return sort_keys
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$datetime" in value:
+            return datetime.fromisoformat(value["$datetime"])
+        if "$date" in value:
+            return date.fromisoformat(value["$date"])
+        if "$decimal" in value:
+            return Decimal(value["$decimal"])
+    return value
+
+
+def _encode_cursor(order_by: Optional[str], key_values: List[Any]) -> str:
+    """마지막 행의 정렬 키 값을 불투명한(opaque) 커서 문자열로 인코딩."""
+    payload = {"o": order_by or "", "k": [_encode_cursor_value(v) for v in key_values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str, order_by: Optional[str], key_count: int) -> List[Any]:
+    """커서 문자열을 정렬 키 값 리스트로 디코딩."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        key_values = payload["k"]
+        cursor_order_by = payload["o"]
+    except Exception:
+        raise ValueError("Invalid cursor.") from None
+    if cursor_order_by != (order_by or "") or len(key_values) != key_count:
+        raise ValueError("Cursor does not match the requested order_by.")
+    return [_decode_cursor_value(v) for v in key_values]
+
+
+def _keyset_after(sort_keys: List[Tuple[Column, bool]], key_values: List[Any]):
+    """정렬 순서상 key_values 다음에 오는 행들을 선택하는 조건식 (SQLite는 NULL을 가장 작은 값으로 정렬)."""
+    (column, descending), rest = sort_keys[0], sort_keys[1:]
+    value = key_values[0]
+    if value is None:
+        beyond = None if descending else column.is_not(None)
+        same = column.is_(None)
+    else:
+        beyond = or_(column < value, column.is_(None)) if descending else column > value
+        same = column == value
+
+    conditions = []
+    if beyond is not None:
+        conditions.append(beyond)
+    if rest:
+        conditions.append(and_(same, _keyset_after(rest, key_values[1:])))
+    return or_(*conditions)
+
+
+def _paginate(stmt, sort_keys: List[Tuple[Column, bool]], limit: int, order_by: Optional[str], cursor: Optional[str]):
+    """SELECT 문에 키셋 조건, 정렬, LIMIT(다음 페이지 확인용 +1)을 적용."""
+    if cursor:
+        stmt = stmt.where(_keyset_after(sort_keys, _decode_cursor(cursor, order_by, len(sort_keys))))
+    stmt = stmt.order_by(*[column.desc() if descending else column.asc() for column, descending in sort_keys])
+    return stmt.limit(limit + 1)
+
+
+def _fetch_page(
+    conn: Connection,
+    stmt,
+    sort_keys: List[Tuple[Column, bool]],
+    limit: int,
+    order_by: Optional[str],
+) -> Tuple[list, Optional[str]]:
+    """
+    페이지 하나를 스트리밍으로 가져오고 다음 페이지 커서를 계산.
+
+    Returns:
+        tuple: (행 리스트, 다음 페이지 커서 또는 None)
+    """
+    result = conn.execution_options(stream_results=True).execute(stmt)
+    try:
+        rows = result.fetchmany(limit + 1)
+    finally:
+        result.close()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]._mapping
+        next_cursor = _encode_cursor(order_by, [last_row[column] for column, _ in sort_keys])
+    return rows, next_cursor
+
+
+# 단순 필터 조건 연산자 -> SQLAlchemy 조건식 생성 함수 (like는 _compile_predicate에서 FTS 인덱스를 먼저 시도)
+_FILTER_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "in": lambda column, value: column.in_(value),
+    "like": lambda column, value: column.like(value),
+    "between": lambda column, value: column.between(value[0], value[1]),
+    "is_null": lambda column, value: column.is_(None) if value is None or value else column.is_not(None),
+}
+
+# 집계 함수 이름 -> SQLAlchemy 집계식 생성 함수 (column이 None이면 COUNT(*))
+_AGGREGATE_FUNCTIONS = {
+    "count": lambda column: func.count(column) if column is not None else func.count(),
+    "count_distinct": lambda column: func.count(column.distinct()),
+    "sum": func.sum,
+    "avg": func.avg,
+    "min": func.min,
+    "max": func.max,
+}
+
+
+def _longest_literal(pattern: str) -> int:
+    """LIKE 패턴에서 와일드카드(%, _)를 제외한 가장 긴 연속 문자열 길이."""
+    return max((len(part) for part in re.split(r"[%_]", pattern)), default=0)
+
+
+def _escape_like(term: str) -> str:
+    """검색어를 LIKE 리터럴로 쓰도록 와일드카드를 이스케이프 (escape 문자는 백슬래시)."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _fts_rowids(table_name: str):
+    """FTS 가상 테이블을 가리키는 경량 table 절 (rowid와 인덱싱된 컬럼만 포함)."""
+    fts = fts_table_name(table_name)
+    return table_clause(
+        fts, column_clause("rowid"), column_clause(fts), *[column_clause(name) for name in _FTS_COLUMNS[table_name]]
+    )
+
+
+def _fts_condition(conn, table: Table, fts_filter):
+    """
+    FTS 인덱스 조건을 원본 테이블의 `기본키 IN (일치하는 rowid)` 조건으로 변환.
+
+    FTS는 일치하는 rowid를 모두 모은 뒤에야 페이지를 자를 수 있으므로, 흔한 검색어라면
+    LIMIT에서 일찍 멈추는 LIKE 스캔이 더 빠르다. rowid를 FTS_PROBE_LIMIT개까지만 읽어 보고
+    그 이상 일치하면 None을 반환해 호출하는 쪽이 LIKE를 쓰게 한다.
+    rowid 조회에는 호출하는 쪽이 이미 연 연결(conn)을 사용한다.
+    """
+    fts = _fts_rowids(table.name)
+    rowids = conn.execute(select(fts.c.rowid).where(fts_filter(fts)).limit(FTS_PROBE_LIMIT)).scalars().all()
+    if len(rowids) >= FTS_PROBE_LIMIT:
+        return None
+    return _primary_key(table).in_(rowids)
+
+
+def _like_condition(conn, column, pattern):
+    """
+    LIKE 조건식. 컬럼에 FTS5 trigram 인덱스가 있고 패턴에 3글자 이상 리터럴이 있으면
+    테이블 전체를 스캔하는 대신 FTS 인덱스에서 후보 rowid를 찾는다. 대소문자 처리는 LIKE와 같다.
+    """
+    table_name = column.table.name
+    if (
+        isinstance(pattern, str)
+        and column.name in _FTS_COLUMNS.get(table_name, ())
+        and _longest_literal(pattern) >= FTS_MIN_TERM_LENGTH
+    ):
+        condition = _fts_condition(conn, column.table, lambda fts: fts.c[column.name].like(pattern))
+        if condition is not None:
+            return condition
+    return column.like(pattern)
+
+
+def _compile_predicate(conn, node: Dict[str, Any], resolve_column):
+    """
+    조건 트리를 하나의 SQLAlchemy 조건식으로 컴파일.
+
+    노드는 {"and": [노드, ...]}, {"or": [노드, ...]}, {"not": 노드} 또는
+    {"column": 컬럼 이름, "op": 연산자, "value": 값} 형태의 단일 조건이다.
+    컬럼 이름은 resolve_column으로 컬럼 객체로 변환한다. like 조건은 conn으로 FTS 인덱스를 조회할 수 있다.
+    """
+    if not isinstance(node, dict):
+        raise ValueError(f"Invalid predicate {node!r}: expected an object.")
+    for logical, combine in (("and", and_), ("or", or_)):
+        if logical in node:
+            children = node[logical]
+            if not isinstance(children, list) or not children:
+                raise ValueError(f"'{logical}' requires a non-empty list of predicates.")
+            return combine(*[_compile_predicate(conn, child, resolve_column) for child in children])
+    if "not" in node:
+        return not_(_compile_predicate(conn, node["not"], resolve_column))
+
+    op = node.get("op", "eq")
+    if op not in _FILTER_OPERATORS:
+        raise ValueError(f"Unsupported filter operator '{op}'. Use one of {sorted(_FILTER_OPERATORS)}.")
+    if "column" not in node:
+        raise ValueError(f"Predicate {node!r} is missing 'column'.")
+    column = resolve_column(node["column"])
+    _record_usage(column, "filter")
+    if op == "like":
+        return _like_condition(conn, column, node.get("value"))
+    return _FILTER_OPERATORS[op](column, node.get("value"))
+
+
+def _predicate_columns(node: Any) -> List[str]:
+    """조건 트리에 등장하는 컬럼 이름을 모두 모은다."""
+    if not isinstance(node, dict):
+        return []
+    if "and" in node or "or" in node:
+        return [name for child in node.get("and", node.get("or")) or [] for name in _predicate_columns(child)]
+    if "not" in node:
+        return _predicate_columns(node["not"])
+    return [node["column"]] if "column" in node else []
+
+
+def _build_filter(conn, table: Table, condition: Dict[str, Any]):
+    """단일 테이블 기준의 조건(또는 조건 트리)을 조건식으로 변환."""
+    return _compile_predicate(conn, condition, lambda name: _get_column(table, name))
+
+
+def _get_qualified_column(tables: Dict[str, Table], qualified_name: str):
+    """'table.column' 형태의 이름으로 컬럼 객체를 찾는다."""
+    table_name, _, column_name = qualified_name.partition(".")
+    if not column_name:
+        raise ValueError(f"Column '{qualified_name}' must be qualified as 'table.column'.")
+    if table_name not in tables:
+        raise ValueError(f"Table '{table_name}' is not part of the join.")
+    return _get_column(tables[table_name], column_name)
+
+
+def _foreign_key_graph(metadata: MetaData) -> Dict[str, List[Tuple[str, Any]]]:
+    """외래키를 양방향 간선으로 하는 테이블 그래프를 만든다. {테이블: [(이웃 테이블, ForeignKey), ...]}"""
+    graph: Dict[str, List[Tuple[str, Any]]] = {name: [] for name in metadata.tables}
+    for table in metadata.sorted_tables:
+        # 같은 스키마면 항상 같은 경로가 나오도록 FK를 컬럼 이름 순으로 순회
+        for fk in sorted(table.foreign_keys, key=lambda fk: fk.parent.name):
+            referred = fk.column.table.name
+            if referred == table.name:
+                continue
+            graph[table.name].append((referred, fk))
+            graph[referred].append((table.name, fk))
+    return graph
+
+
+def _infer_join_path(metadata: MetaData, table_names: List[str]) -> List[Tuple[str, Any]]:
+    """
+    요청한 테이블들을 모두 잇는 외래키 조인 경로를 추론.
+
+    첫 테이블에서 시작해 나머지 테이블마다 이미 연결된 테이블 집합에서 BFS로 최단 경로를 찾아 붙인다.
+    경로 중간의 테이블도 조인에 포함된다.
+
+    Returns:
+        list: 조인 순서대로 (새로 붙는 테이블 이름, 사용한 ForeignKey) 리스트.
+    """
+    graph = _foreign_key_graph(metadata)
+    joined = [table_names[0]]
+    path: List[Tuple[str, Any]] = []
+    for target in table_names[1:]:
+        if target in joined:
+            continue
+        previous: Dict[str, Tuple[str, Any]] = {}
+        queue = deque(joined)
+        visited = set(joined)
+        while queue and target not in visited:
+            current = queue.popleft()
+            for neighbor, fk in graph[current]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    previous[neighbor] = (current, fk)
+                    queue.append(neighbor)
+        if target not in visited:
+            raise ValueError(f"No foreign key path connects table '{target}' to {joined}.")
+
+        steps: List[Tuple[str, Any]] = []
+        node = target
+        while node not in joined:
+            parent, fk = previous[node]
+            steps.append((node, fk))
+            node = parent
+        for table_name, fk in reversed(steps):
+            joined.append(table_name)
+            path.append((table_name, fk))
+    return path
+
+
+def _build_join(metadata: MetaData, base_table: str, path: List[Tuple[str, Any]]):
+    """
+    _infer_join_path 결과로 FROM 절을 만든다.
+
+    Returns:
+        tuple: ({테이블 이름: Table}, FROM 절, 조인 경로 설명 리스트)
+    """
+    joined_tables = {base_table: metadata.tables[base_table]}
+    from_clause = joined_tables[base_table]
+    join_path: List[Dict[str, Any]] = []
+    for table_name, fk in path:
+        new_table = metadata.tables[table_name]
+        # 부모 테이블을 붙일 때 FK 컬럼이 NULL 허용이면 LEFT JOIN으로 자식 행을 보존
+        is_outer = fk.parent.table.name != table_name and fk.parent.nullable
+        from_clause = from_clause.join(new_table, fk.parent == fk.column, isouter=is_outer)
+        _record_usage(fk.parent, "join")
+        _record_usage(fk.column, "join")
+        joined_tables[table_name] = new_table
+        join_path.append(
+            {
+                "table": table_name,
+                "on": f"{fk.parent.table.name}.{fk.parent.name} = {fk.column.table.name}.{fk.column.name}",
+                "type": "left" if is_outer else "inner",
+            }
+        )
+    return joined_tables, from_clause, join_path
+
+
+def _fetch_projected_page(
+    conn: Connection,
+    stmt,
+    projection: list,
+    column_names: List[str],
+    sort_keys: List[Tuple[Column, bool]],
+    limit: int,
+    order_by: Optional[str],
+    cursor: Optional[str],
+    format: str,
+):
+    """
+    projection 컬럼만 반환하는 SELECT에 페이지네이션을 적용해 한 페이지를 가져온다.
+
+    정렬 키 중 projection에 없는 컬럼은 SELECT 끝에 덧붙여 커서 계산에만 쓰고 결과에서는 제외한다.
+    stmt는 FROM/WHERE만 지정된 select()여야 한다.
+
+    Returns:
+        tuple: (포맷된 행 리스트, 다음 페이지 커서 또는 None)
+    """
+    extra_keys = [col for col, _ in sort_keys if not any(col is p for p in projection)]
+    stmt = stmt.with_only_columns(*projection, *extra_keys)
+    stmt = _paginate(stmt, sort_keys, limit, order_by, cursor)
+
+    rows, next_cursor = _fetch_page(conn, stmt, sort_keys, limit, order_by)
+    if extra_keys:
+        rows = [row[: len(projection)] for row in rows]
+    values = _rows_to_columnar(rows, projection)
+    if format == "columnar":
+        return values, next_cursor
+    return _rows_to_table_dicts(values, column_names), next_cursor
+
+
 def _error_response(message: str) -> dict[str, str]:
     """표준화된 에러 응답 포맷."""
     return {"error": message}
@@ -39,11 +675,7 @@ def _error_response(message: str) -> dict[str, str]:
 
 def _rows_to_table_dicts(rows, column_names: List[str]) -> List[Dict[str, Any]]:
     """Row 객체 리스트를 컬럼 이름 기반 dict 리스트로 변환."""
-    formatted_rows: List[Dict[str, Any]] = []
-    for row in rows:
-        row_values = tuple(row)
-        formatted_rows.append({column_names[idx]: row_values[idx] for idx in range(len(column_names))})
-    return formatted_rows
+    return [dict(zip(column_names, row)) for row in rows]
 
 
 def _rows_to_join_dicts(
@@ -54,38 +686,125 @@ def _rows_to_join_dicts(
     right_columns: List[str],
 ) -> List[Dict[str, Any]]:
     """조인 결과를 테이블별 중첩 dict 형태로 변환."""
-    formatted_rows: List[Dict[str, Any]] = []
     left_len = len(left_columns)
-    right_len = len(right_columns)
+    return [
+        {
+            left_table_name: dict(zip(left_columns, row[:left_len])),
+            right_table_name: dict(zip(right_columns, row[left_len:])),
+        }
+        for row in rows
+    ]
 
-    for row in rows:
-        row_values = tuple(row)
-        left_values = row_values[:left_len]
-        right_values = row_values[left_len : left_len + right_len]
 
-        formatted_rows.append(
-            {
-                left_table_name: dict(zip(left_columns, left_values)),
-                right_table_name: dict(zip(right_columns, right_values)),
-            }
-        )
+def _serialize_temporal(value: Any) -> Optional[str]:
+    """날짜/시간 값을 str()과 같은 "YYYY-MM-DD HH:MM:SS" 형식 문자열로. rows/columnar 포맷이 함께 쓴다."""
+    return str(value) if value is not None else None
+
+
+def _rows_to_columnar(rows, columns) -> List[tuple]:
+    """
+    Row 객체 리스트를 컬럼 헤더 없이 값 튜플 리스트로 변환.
+
+    날짜/시간 컬럼은 JSON으로 직렬화할 수 있도록 _serialize_temporal로 문자열로 바꾼다.
+    행 단위 대신 컬럼 단위로 변환해 셀마다 dict나 분기를 만들지 않는다.
+    """
+    temporal_indexes = [idx for idx, col in enumerate(columns) if isinstance(col.type, (DateTime, Date))]
+    if not temporal_indexes:
+        return [tuple(row) for row in rows]
+    if not rows:
+        return []
+
+    column_values = list(zip(*rows))
+    for idx in temporal_indexes:
+        column_values[idx] = [_serialize_temporal(value) for value in column_values[idx]]
+    return list(zip(*column_values))
+
+
+def _resolve_format(format: str) -> str:
+    """결과 포맷 인자를 검증."""
+    if format not in RESULT_FORMATS:
+        raise ValueError(f"Unsupported format '{format}'. Use one of {list(RESULT_FORMATS)}.")
+    return format
+
+
+def _format_rows(rows, columns, format: str):
+    """결과 포맷에 따라 행을 dict 리스트(rows) 또는 값 튜플 리스트(columnar)로 변환. 날짜/시간 값 형식은 같다."""
+    values = _rows_to_columnar(rows, columns)
+    if format == "columnar":
+        return values
+    return _rows_to_table_dicts(values, [col.name for col in columns])
+
+
+def _catalog_path() -> Optional[Path]:
+    """스키마 카탈로그 캐시 파일 경로. 기본값은 DB 파일 옆의 <DB 이름>.catalog.json, 인메모리 DB는 None(파일 캐시 안 함)."""
+    configured = os.getenv("DB_TOOL_CATALOG_PATH")
+    if configured:
+        return Path(configured)
+    if is_memory_db(DB_PATH):
+        return None
+    return Path(DB_PATH).with_suffix(".catalog.json")
+
+
+def get_schema_catalog() -> Dict[str, Any]:
+    """
+    모든 테이블의 컬럼/타입/외래키/행 수/저카디널리티 값 목록을 담은 스키마 카탈로그를 반환.
+
+    카탈로그는 디스크에 캐시되며 스키마 버전이나 DB 파일(재시드 등)이 바뀌었을 때만 다시 만든다.
+    """
+    engine = _get_engine()
+    with engine.connect() as conn:
+        metadata = _get_schema(conn)
+        # 행 수와 값 목록도 담기므로 DB 파일이 수정되면(-wal 포함) 다시 만든다.
+        if is_memory_db(DB_PATH):
+            modified = _get_data_version()[-1]
+        else:
+            modified = max(
+                (os.stat(path).st_mtime_ns for path in (Path(DB_PATH), Path(f"{DB_PATH}-wal")) if path.exists()),
+                default=0,
+            )
+        cache_key = [str(DB_PATH), _get_schema_version(conn), modified]
+        return load_schema_catalog(conn, metadata, _catalog_path(), cache_key)
+
+
+def get_schema_catalog_prompt() -> str:
+    """시스템 프롬프트에 넣을 간결한 텍스트 형태의 스키마 카탈로그."""
+    return format_schema_catalog(get_schema_catalog())
+
+
+@_with_async
+@tool
+@_cached_result
+def describe_database() -> dict[str, Any]:
+    """
+    DB 전체 구조를 한 번에 반환. 모든 테이블의 컬럼, 타입, 외래키, 행 수와
+    상태/단계처럼 값 종류가 적은 컬럼의 가능한 값 목록을 포함한다.
+    get_tables_from_db와 get_column_info_from_table을 테이블마다 호출하는 대신 사용하세요.
 
-    return formatted_rows
+    Returns:
+        dict: {"tables": [{"name", "row_count", "columns", "foreign_keys"}]} 형태의 스키마 카탈로그.
+    """
+    try:
+        return get_schema_catalog()
+    except Exception as e:
+        return _error_response(f"Error occurred while describing database: {str(e)}")
 
 
+@_with_async
 @tool
+@_cached_result
 def get_tables_from_db() -> list[str]:
     """현재 DB에 존재하는 테이블 이름들을 반환."""
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-            return inspector.get_table_names()
+            return sorted(_get_schema(conn).tables)
     except Exception as e:
         return f"Error occurred while getting tables: {str(e)}"
 
 
+@_with_async
 @tool
+@_cached_result
 def get_column_info_from_table(table_name: str) -> list[dict]:
     """
     특정 테이블의 컬럼 이름들을 반환.
@@ -98,40 +817,53 @@ def get_column_info_from_table(table_name: str) -> list[dict]:
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-            return inspector.get_columns(table_name)
+            return _column_info(_get_table(conn, table_name))
     except Exception as e:
         return f"Error occurred while getting column info from table '{table_name}': {str(e)}"
 
 
+@_with_async
 @tool
-def get_all_data_from_table(table_name: str) -> dict[str, Any]:
+@_cached_result
+def get_all_data_from_table(
+    table_name: str,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
+) -> dict[str, Any]:
     """
-    특정 테이블의 모든 데이터를 반환.
+    특정 테이블의 데이터를 페이지 단위로 반환.
 
     Args:
         table_name (str): 데이터를 가져올 테이블 이름.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 앞에 '-'를 붙이면 내림차순 (기본값: 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
     Returns:
-        dict: 테이블, 컬럼, 행 정보를 담은 딕셔너리.
+        dict: 테이블, 컬럼, 행 정보를 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
     """
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=engine)
+            table = _get_table(conn, table_name)
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            sort_keys = _sort_keys(table, order_by)
 
-            stmt = select(table)
-            result = conn.execute(stmt)
-            rows = result.fetchall()
+            stmt = _paginate(select(table), sort_keys, page_size, order_by, cursor)
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, order_by)
             column_names = [col.name for col in table.c]
 
-            formatted_rows = _rows_to_table_dicts(rows, column_names)
+            formatted_rows = _format_rows(rows, table.c, format)
 
             return {
                 "table": table_name,
                 "columns": column_names,
                 "row_count": len(formatted_rows),
                 "rows": formatted_rows,
+                "next_cursor": next_cursor,
             }
     except Exception as e:
         return _error_response(
@@ -139,12 +871,18 @@ def get_all_data_from_table(table_name: str) -> dict[str, Any]:
         )
 
 
+@_with_async
 @tool
+@_cached_result
 def filter_data_by_gte_or_lte(
     table_name: str,
     column_name: str,
     gte: Optional[float] = None,
     lte: Optional[float] = None,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
 ) -> dict[str, Any]:
     """
     특정 테이블의 특정 컬럼에 대해 숫자 조건 필터링을 수행하여 결과 반환.
@@ -154,32 +892,36 @@ def filter_data_by_gte_or_lte(
         column_name (str): 필터링할 컬럼 이름.
         gte (Optional[float]): 해당 컬럼의 최소값 조건.
         lte (Optional[float]): 해당 컬럼의 최대값 조건.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 앞에 '-'를 붙이면 내림차순 (기본값: 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
     Returns:
-        dict: 필터링 조건과 결과를 담은 딕셔너리.
+        dict: 필터링 조건과 결과를 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
     Raises:
         ValueError: 지정된 컬럼이 테이블에 존재하지 않을 경우.
     """
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-            columns = inspector.get_columns(table_name)
-            column_names = [col["name"] for col in columns]
-            if column_name not in column_names:
-                raise ValueError(f"Column '{column_name}' does not exist in table '{table_name}'.")
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=engine)
+            table = _get_table(conn, table_name)
+            column = _get_column(table, column_name)
+            _record_usage(column, "filter")
+
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            sort_keys = _sort_keys(table, order_by)
 
             stmt = select(table)
             if gte is not None:
-                stmt = stmt.where(table.c[column_name] >= gte)
+                stmt = stmt.where(column >= gte)
             if lte is not None:
-                stmt = stmt.where(table.c[column_name] <= lte)
+                stmt = stmt.where(column <= lte)
+            stmt = _paginate(stmt, sort_keys, page_size, order_by, cursor)
 
-            result = conn.execute(stmt)
-            rows = result.fetchall()
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, order_by)
             column_names = [col.name for col in table.c]
-            formatted_rows = _rows_to_table_dicts(rows, column_names)
+            formatted_rows = _format_rows(rows, table.c, format)
 
             filters: Dict[str, Any] = {
                 "column": column_name,
@@ -195,6 +937,7 @@ def filter_data_by_gte_or_lte(
                 "filters": filters,
                 "row_count": len(formatted_rows),
                 "rows": formatted_rows,
+                "next_cursor": next_cursor,
             }
     except Exception as e:
         return _error_response(
@@ -202,11 +945,17 @@ def filter_data_by_gte_or_lte(
         )
 
 
+@_with_async
 @tool
+@_cached_result
 def filter_data_by_inclusion(
     table_name: str,
     column_name: str,
     include_values: list,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
 ) -> dict[str, Any]:
     """
     특정 테이블의 특정 컬럼에 대해 포함 조건 필터링을 수행하여 결과 반환.
@@ -215,28 +964,32 @@ def filter_data_by_inclusion(
         table_name (str): 필터링할 테이블 이름.
         column_name (str): 필터링할 컬럼 이름.
         include_values (list): 포함할 값들의 리스트.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 앞에 '-'를 붙이면 내림차순 (기본값: 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
     Returns:
-        dict: 필터링 조건과 결과를 담은 딕셔너리.
+        dict: 필터링 조건과 결과를 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
     Raises:
         ValueError: 지정된 컬럼이 테이블에 존재하지 않을 경우.
     """
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-            columns = inspector.get_columns(table_name)
-            column_names = [col["name"] for col in columns]
-            if column_name not in column_names:
-                raise ValueError(f"Column '{column_name}' does not exist in table '{table_name}'.")
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=engine)
+            table = _get_table(conn, table_name)
+            column = _get_column(table, column_name)
+            _record_usage(column, "filter")
 
-            stmt = select(table).where(table.c[column_name].in_(include_values))
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            sort_keys = _sort_keys(table, order_by)
 
-            result = conn.execute(stmt)
-            rows = result.fetchall()
+            stmt = select(table).where(column.in_(include_values))
+            stmt = _paginate(stmt, sort_keys, page_size, order_by, cursor)
+
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, order_by)
             column_names = [col.name for col in table.c]
-            formatted_rows = _rows_to_table_dicts(rows, column_names)
+            formatted_rows = _format_rows(rows, table.c, format)
 
             return {
                 "table": table_name,
@@ -247,6 +1000,7 @@ def filter_data_by_inclusion(
                 },
                 "row_count": len(formatted_rows),
                 "rows": formatted_rows,
+                "next_cursor": next_cursor,
             }
     except Exception as e:
         return _error_response(
@@ -254,41 +1008,52 @@ def filter_data_by_inclusion(
         )
 
 
+@_with_async
 @tool
+@_cached_result
 def filter_data_by_like(
     table_name: str,
     column_name: str,
     like_pattern: str,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
 ) -> dict[str, Any]:
     """
     특정 테이블의 특정 컬럼에 대해 LIKE(부분 문자열) 조건 필터링을 수행하여 결과 반환.
+    컬럼에 FTS 인덱스가 있고 패턴에 3글자 이상 리터럴이 있으면 전체 스캔 대신 인덱스를 사용한다. (예: '%분기%'는 전체 스캔)
 
     Args:
         table_name (str): 필터링할 테이블 이름.
         column_name (str): 필터링할 컬럼 이름.
         like_pattern (str): SQL LIKE 패턴(예: '%Research%').
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 앞에 '-'를 붙이면 내림차순 (기본값: 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
     Returns:
-        dict: 필터링 조건과 결과를 담은 딕셔너리.
+        dict: 필터링 조건과 결과를 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
     Raises:
         ValueError: 지정된 컬럼이 테이블에 존재하지 않을 경우.
     """
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-            columns = inspector.get_columns(table_name)
-            column_names = [col["name"] for col in columns]
-            if column_name not in column_names:
-                raise ValueError(f"Column '{column_name}' does not exist in table '{table_name}'.")
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=engine)
+            table = _get_table(conn, table_name)
+            column = _get_column(table, column_name)
+            _record_usage(column, "filter")
 
-            stmt = select(table).where(table.c[column_name].like(like_pattern))
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            sort_keys = _sort_keys(table, order_by)
 
-            result = conn.execute(stmt)
-            rows = result.fetchall()
+            stmt = select(table).where(_like_condition(conn, column, like_pattern))
+            stmt = _paginate(stmt, sort_keys, page_size, order_by, cursor)
+
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, order_by)
             column_names = [col.name for col in table.c]
-            formatted_rows = _rows_to_table_dicts(rows, column_names)
+            formatted_rows = _format_rows(rows, table.c, format)
 
             return {
                 "table": table_name,
@@ -299,6 +1064,7 @@ def filter_data_by_like(
                 },
                 "row_count": len(formatted_rows),
                 "rows": formatted_rows,
+                "next_cursor": next_cursor,
             }
     except Exception as e:
         return _error_response(
@@ -306,12 +1072,18 @@ def filter_data_by_like(
         )
 
 
+@_with_async
 @tool
+@_cached_result
 def join_tables_on_column(
     left_table: str,
     right_table: str,
     join_column_left: str,
     join_column_right: str,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
 ) -> dict[str, Any]:
     """
     두 테이블을 특정 컬럼을 기준으로 조인하여 결과 반환.
@@ -320,64 +1092,444 @@ def join_tables_on_column(
         left_table (str): 왼쪽 테이블 이름.
         right_table (str): 오른쪽 테이블 이름.
         join_column (str): 조인할 컬럼 이름.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 'table.column' 또는 왼쪽 테이블의 컬럼 이름.
+            앞에 '-'를 붙이면 내림차순 (기본값: 왼쪽, 오른쪽 테이블의 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
     Returns:
-        dict: 조인 정보와 결과를 담은 딕셔너리.
+        dict: 조인 정보와 결과를 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
     Raises:
         ValueError: 지정된 컬럼이 양쪽 테이블에 존재하지 않을 경우.
     """
     try:
         engine = _get_engine()
         with engine.connect() as conn:
-            inspector = inspect(conn)
-
-            left_columns = inspector.get_columns(left_table)
-            right_columns = inspector.get_columns(right_table)
-
-            left_column_names = [col["name"] for col in left_columns]
-            right_column_names = [col["name"] for col in right_columns]
+            left_tbl = _get_table(conn, left_table)
+            right_tbl = _get_table(conn, right_table)
+            left_column = _get_column(left_tbl, join_column_left)
+            right_column = _get_column(right_tbl, join_column_right)
+            _record_usage(left_column, "join")
+            _record_usage(right_column, "join")
 
-            if join_column_left not in left_column_names:
-                raise ValueError(f"Column '{join_column_left}' does not exist in table '{left_table}'.")
-            if join_column_right not in right_column_names:
-                raise ValueError(f"Column '{join_column_right}' does not exist in table '{right_table}'.")
-
-            metadata = MetaData()
-            left_tbl = Table(left_table, metadata, autoload_with=engine)
-            right_tbl = Table(right_table, metadata, autoload_with=engine)
-
-            stmt = select(left_tbl, right_tbl).join(
-                right_tbl,
-                left_tbl.c[join_column_left] == right_tbl.c[join_column_right],
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            joined_tables = {left_table: left_tbl, right_table: right_tbl}
+            sort_keys = _join_sort_keys(
+                joined_tables,
+                order_by,
+                lambda name: _get_qualified_column(joined_tables, name) if "." in name else _get_column(left_tbl, name),
             )
 
-            result = conn.execute(stmt)
-            rows = result.fetchall()
+            stmt = select(left_tbl, right_tbl).join(right_tbl, left_column == right_column)
+            stmt = _paginate(stmt, sort_keys, page_size, order_by, cursor)
+
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, order_by)
+            rows = _rows_to_columnar(rows, [*left_tbl.c, *right_tbl.c])
             left_column_names = [col.name for col in left_tbl.c]
             right_column_names = [col.name for col in right_tbl.c]
 
-            formatted_rows = _rows_to_join_dicts(
-                rows,
-                left_table,
-                left_column_names,
-                right_table,
-                right_column_names,
-            )
+            if format == "columnar":
+                columns = [f"{left_table}.{name}" for name in left_column_names]
+                columns += [f"{right_table}.{name}" for name in right_column_names]
+                formatted_rows = rows
+            else:
+                columns = {
+                    left_table: left_column_names,
+                    right_table: right_column_names,
+                }
+                formatted_rows = _rows_to_join_dicts(
+                    rows,
+                    left_table,
+                    left_column_names,
+                    right_table,
+                    right_column_names,
+                )
 
             return {
                 "left_table": left_table,
                 "right_table": right_table,
-                "columns": {
-                    left_table: left_column_names,
-                    right_table: right_column_names,
-                },
+                "columns": columns,
                 "join_on": {
                     "left_column": join_column_left,
                     "right_column": join_column_right,
                 },
                 "row_count": len(formatted_rows),
                 "rows": formatted_rows,
+                "next_cursor": next_cursor,
             }
     except Exception as e:
         return _error_response(
             f"Error occurred while joining tables '{left_table}' and '{right_table}': {str(e)}"
         )
+
+
+@_with_async
+@tool
+@_cached_result
+def aggregate_table(
+    table_name: str,
+    aggregates: list[dict],
+    group_by: Optional[list[str]] = None,
+    filters: Optional[list[dict]] = None,
+    order_by: Optional[str] = None,
+    limit: Optional[int] = None,
+    format: str = "rows",
+) -> dict[str, Any]:
+    """
+    특정 테이블에 대해 GROUP BY 집계(COUNT/SUM/AVG/MIN/MAX)를 DB 안에서 수행하여 집계된 행만 반환.
+    합계, 개수, 평균, 최솟값, 최댓값을 구할 때는 전체 데이터를 가져오지 말고 이 도구를 사용하세요.
+
+    Args:
+        table_name (str): 집계할 테이블 이름.
+        aggregates (list[dict]): 집계 목록. 각 항목은 {"function": "count"|"count_distinct"|"sum"|"avg"|"min"|"max",
+            "column": 컬럼 이름(count는 생략 시 COUNT(*)), "alias": 결과 컬럼 이름(선택)}.
+        group_by (Optional[list[str]]): 그룹화할 컬럼 이름 리스트. 생략하면 전체를 하나의 그룹으로 집계.
+        filters (Optional[list[dict]]): 집계 전에 적용할 AND 조건 리스트. 각 항목은 {"column": 컬럼 이름,
+            "op": "eq"|"ne"|"gt"|"gte"|"lt"|"lte"|"in"|"like"|"is_null", "value": 값}.
+        order_by (Optional[str]): 정렬 기준(그룹 컬럼 또는 집계 alias). 앞에 '-'를 붙이면 내림차순.
+        limit (Optional[int]): 반환할 최대 그룹 수 (기본값 100, 최대 1000).
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
+    Returns:
+        dict: 집계 조건과 결과 행을 담은 딕셔너리.
+    Raises:
+        ValueError: 지정된 컬럼이나 집계 함수가 유효하지 않을 경우.
+    """
+    try:
+        engine = _get_engine()
+        with engine.connect() as conn:
+            table = _get_table(conn, table_name)
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            group_columns = [_get_column(table, name) for name in group_by or []]
+            for column in group_columns:
+                _record_usage(column, "group_by")
+
+            if not aggregates:
+                raise ValueError("At least one aggregate is required.")
+            aggregate_exprs = []
+            for spec in aggregates:
+                function_name = spec.get("function", "").lower()
+                if function_name not in _AGGREGATE_FUNCTIONS:
+                    raise ValueError(
+                        f"Unsupported aggregate function '{function_name}'. Use one of {sorted(_AGGREGATE_FUNCTIONS)}."
+                    )
+                column_name = spec.get("column")
+                if column_name is None and function_name != "count":
+                    raise ValueError(f"Aggregate function '{function_name}' requires a column.")
+                column = _get_column(table, column_name) if column_name is not None else None
+                alias = spec.get("alias") or (f"{function_name}_{column_name}" if column_name else function_name)
+                aggregate_exprs.append(_AGGREGATE_FUNCTIONS[function_name](column).label(alias))
+
+            # COUNT(*)만 있고 group_by/filter가 없으면 FROM 절이 빠지므로 테이블을 명시한다.
+            stmt = select(*group_columns, *aggregate_exprs).select_from(table)
+            for condition in filters or []:
+                stmt = stmt.where(_build_filter(conn, table, condition))
+            if group_columns:
+                stmt = stmt.group_by(*group_columns)
+
+            output_names = [col.name for col in group_columns] + [expr.name for expr in aggregate_exprs]
+            duplicates = sorted({name for name in output_names if output_names.count(name) > 1})
+            if duplicates:
+                raise ValueError(f"Duplicate output column names {duplicates}; give each aggregate a unique alias.")
+            output_columns = {col.name: col for col in group_columns}
+            output_columns.update({expr.name: expr for expr in aggregate_exprs})
+            if order_by:
+                order_name = order_by.lstrip("-")
+                if order_name not in output_columns:
+                    raise ValueError(f"order_by '{order_name}' must be one of {list(output_columns)}.")
+                order_column = output_columns[order_name]
+                stmt = stmt.order_by(order_column.desc() if order_by.startswith("-") else order_column.asc())
+            elif group_columns:
+                stmt = stmt.order_by(*group_columns)
+            stmt = stmt.limit(page_size + 1)
+
+            result = conn.execute(stmt)
+            rows = result.fetchmany(page_size + 1)
+            result.close()
+            truncated = len(rows) > page_size
+            column_names = list(output_columns)
+            formatted_rows = _format_rows(rows[:page_size], list(output_columns.values()), format)
+
+            return {
+                "table": table_name,
+                "columns": column_names,
+                "group_by": group_by or [],
+                "filters": filters or [],
+                "row_count": len(formatted_rows),
+                "rows": formatted_rows,
+                "truncated": truncated,
+            }
+    except Exception as e:
+        return _error_response(
+            f"Error occurred while aggregating data from table '{table_name}': {str(e)}"
+        )
+
+
+@_with_async
+@tool
+@_cached_result
+def join_tables(
+    tables: list[str],
+    columns: Optional[list[str]] = None,
+    filters: Optional[list[dict]] = None,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
+) -> dict[str, Any]:
+    """
+    여러 테이블을 외래키 관계를 따라 자동으로 조인하여 하나의 SQL로 결과 반환.
+    조인 컬럼을 지정할 필요가 없으며, 요청한 테이블을 잇는 데 필요한 중간 테이블도 자동으로 조인된다.
+    (예: ["invoices", "clients", "employees"] -> invoices-contracts-clients, contracts-employees)
+
+    Args:
+        tables (list[str]): 조인할 테이블 이름 리스트. 첫 테이블이 기준 테이블.
+        columns (Optional[list[str]]): 반환할 컬럼 리스트 ('table.column' 형식). 생략하면 요청한 테이블의 모든 컬럼.
+        filters (Optional[list[dict]]): 적용할 AND 조건 리스트. 각 항목은 {"column": 'table.column',
+            "op": "eq"|"ne"|"gt"|"gte"|"lt"|"lte"|"in"|"like"|"is_null", "value": 값}.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼 ('table.column' 형식). 앞에 '-'를 붙이면 내림차순
+            (기본값: 조인한 테이블들의 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
+    Returns:
+        dict: 조인 경로, 컬럼, 결과 행을 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
+    Raises:
+        ValueError: 테이블/컬럼이 없거나 외래키로 연결할 수 없는 경우.
+    """
+    try:
+        engine = _get_engine()
+        with engine.connect() as conn:
+            if not tables:
+                raise ValueError("At least one table is required.")
+            metadata = _get_schema(conn)
+            for table_name in tables:
+                _get_table(conn, table_name)
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+
+            path = _infer_join_path(metadata, tables)
+            joined_tables, from_clause, join_path = _build_join(metadata, tables[0], path)
+
+            if columns:
+                projection = [_get_qualified_column(joined_tables, name) for name in columns]
+            else:
+                projection = [col for name in dict.fromkeys(tables) for col in joined_tables[name].c]
+            column_names = [f"{col.table.name}.{col.name}" for col in projection]
+
+            sort_keys = _join_sort_keys(
+                joined_tables, order_by, lambda name: _get_qualified_column(joined_tables, name)
+            )
+            stmt = select(*projection).select_from(from_clause)
+            for condition in filters or []:
+                stmt = stmt.where(
+                    _compile_predicate(conn, condition, lambda name: _get_qualified_column(joined_tables, name))
+                )
+            formatted_rows, next_cursor = _fetch_projected_page(
+                conn, stmt, projection, column_names, sort_keys, page_size, order_by, cursor, format
+            )
+
+            return {
+                "tables": list(joined_tables),
+                "join_path": join_path,
+                "columns": column_names,
+                "filters": filters or [],
+                "row_count": len(formatted_rows),
+                "rows": formatted_rows,
+                "next_cursor": next_cursor,
+            }
+    except Exception as e:
+        return _error_response(f"Error occurred while joining tables {tables}: {str(e)}")
+
+
+@_with_async
+@tool
+@_cached_result
+def filter_data(
+    table_name: str,
+    where: Optional[dict] = None,
+    columns: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    order_by: Optional[str] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
+) -> dict[str, Any]:
+    """
+    AND/OR/NOT 조건 트리와 반환 컬럼 목록을 받아 하나의 SELECT로 필터링한 결과 반환.
+    여러 조건이 필요한 질문은 filter_data_by_* 도구를 여러 번 부르지 말고 이 도구를 한 번 사용하세요.
+    'table.column' 형식으로 다른 테이블의 컬럼을 쓰면 외래키를 따라 자동으로 조인한다.
+
+    예) 상태가 active이고 금액이 50000 이상이며 고객사 업종이 Finance인 계약:
+        table_name="contracts",
+        where={"and": [{"column": "status", "op": "eq", "value": "active"},
+                       {"column": "amount", "op": "gte", "value": 50000},
+                       {"column": "clients.industry", "op": "eq", "value": "Finance"}]},
+        columns=["id", "amount", "clients.name"]
+
+    Args:
+        table_name (str): 기준 테이블 이름.
+        where (Optional[dict]): 조건 트리. {"and": [...]}, {"or": [...]}, {"not": {...}} 또는
+            {"column": 컬럼 이름, "op": "eq"|"ne"|"gt"|"gte"|"lt"|"lte"|"between"|"in"|"like"|"is_null", "value": 값}.
+            between의 value는 [최소, 최대], is_null의 value는 true(NULL) 또는 false(NOT NULL).
+        columns (Optional[list[str]]): 반환할 컬럼 리스트. 생략하면 기준 테이블의 모든 컬럼.
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        order_by (Optional[str]): 정렬 기준 컬럼. 앞에 '-'를 붙이면 내림차순 (기본값: 기본키 오름차순).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
+    Returns:
+        dict: 조건과 결과 행을 담은 딕셔너리. next_cursor가 None이 아니면 다음 페이지가 있음.
+    Raises:
+        ValueError: 테이블/컬럼/연산자가 유효하지 않거나 외래키로 연결할 수 없는 경우.
+    """
+    try:
+        engine = _get_engine()
+        with engine.connect() as conn:
+            metadata = _get_schema(conn)
+            base_table = _get_table(conn, table_name)
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+
+            # 다른 테이블 컬럼이 참조되면 외래키 경로로 조인
+            referenced = [*(columns or []), *_predicate_columns(where)]
+            if order_by:
+                referenced.append(order_by.lstrip("-"))
+            related_tables = []
+            for name in referenced:
+                related, _, column_name = name.partition(".")
+                if column_name and related != table_name and related not in related_tables:
+                    _get_table(conn, related)
+                    related_tables.append(related)
+            path = _infer_join_path(metadata, [table_name, *related_tables]) if related_tables else []
+            joined_tables, from_clause, join_path = _build_join(metadata, table_name, path)
+
+            def resolve_column(name: str):
+                if "." in name:
+                    return _get_qualified_column(joined_tables, name)
+                return _get_column(base_table, name)
+
+            projection = [resolve_column(name) for name in columns] if columns else list(base_table.c)
+            column_names = list(columns) if columns else [col.name for col in base_table.c]
+
+            descending = bool(order_by) and order_by.startswith("-")
+            sort_keys: List[Tuple[Column, bool]] = []
+            if order_by:
+                order_column = resolve_column(order_by.lstrip("-"))
+                _record_usage(order_column, "order_by")
+                sort_keys.append((order_column, descending))
+            for table in joined_tables.values():
+                primary_key = _primary_key(table)
+                if not any(primary_key is col for col, _ in sort_keys):
+                    sort_keys.append((primary_key, descending))
+
+            stmt = select(*projection).select_from(from_clause)
+            if where:
+                stmt = stmt.where(_compile_predicate(conn, where, resolve_column))
+            formatted_rows, next_cursor = _fetch_projected_page(
+                conn, stmt, projection, column_names, sort_keys, page_size, order_by, cursor, format
+            )
+
+            response: Dict[str, Any] = {
+                "table": table_name,
+                "columns": column_names,
+                "where": where,
+                "row_count": len(formatted_rows),
+                "rows": formatted_rows,
+                "next_cursor": next_cursor,
+            }
+            if join_path:
+                response["join_path"] = join_path
+            return response
+    except Exception as e:
+        return _error_response(f"Error occurred while filtering data from table '{table_name}': {str(e)}")
+
+
+@_with_async
+@tool
+@_cached_result
+def search_text(
+    table_name: str,
+    query: str,
+    column_names: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    format: str = "rows",
+) -> dict[str, Any]:
+    """
+    테이블의 텍스트 컬럼에서 검색어를 포함하는 행을 찾아 반환. 고객사/프로젝트/직원 이름이나 미팅 주제를 찾을 때 사용하세요.
+    검색어를 공백으로 나눈 모든 단어를 (대소문자 구분 없이) 포함하는 행을 반환하며, 한글/영문이 섞인 검색어도 지원한다.
+    FTS 인덱스가 있으면 인덱스를, 없거나 단어가 3글자 미만이면 LIKE 검색을 사용한다.
+    모든 단어가 3글자 미만이면(예: '분기 리뷰') 테이블 전체를 스캔하므로 큰 테이블에서는 느리다.
+    가능하면 3글자 이상인 단어를 하나 이상 넣어 검색하세요.
+
+    Args:
+        table_name (str): 검색할 테이블 이름.
+        query (str): 검색어. 예) 'Acme', '분기 리뷰'
+        column_names (Optional[list[str]]): 검색할 컬럼 리스트. 생략하면 FTS 인덱싱된 컬럼(없으면 모든 문자열 컬럼).
+        limit (Optional[int]): 한 페이지에 반환할 최대 행 수 (기본값 100, 최대 1000).
+        cursor (Optional[str]): 이전 응답의 next_cursor. 지정하면 다음 페이지를 반환.
+        format (str): 결과 포맷. "rows"는 행마다 dict, "columnar"는 columns 헤더 + 값 리스트로 더 작게 반환 (기본값: "rows").
+    Returns:
+        dict: 검색 조건, 사용한 검색 방식(index: "fts5" 또는 "like")과 결과 행을 담은 딕셔너리.
+    Raises:
+        ValueError: 테이블/컬럼이 존재하지 않거나 검색어가 비어 있는 경우.
+    """
+    try:
+        engine = _get_engine()
+        with engine.connect() as conn:
+            table = _get_table(conn, table_name)
+            _resolve_format(format)
+            page_size = _resolve_limit(limit)
+            terms = query.split()
+            if not terms:
+                raise ValueError("query must contain at least one search term.")
+
+            indexed = _FTS_COLUMNS.get(table_name, ())
+            if column_names:
+                columns = [_get_column(table, name) for name in column_names]
+            elif indexed:
+                columns = [table.c[name] for name in indexed if name in table.c]
+            else:
+                columns = [col for col in table.c if isinstance(col.type, String)]
+            if not columns:
+                raise ValueError(f"Table '{table_name}' has no text columns to search.")
+            for column in columns:
+                _record_usage(column, "filter")
+
+            fts_columns = [col.name for col in columns if col.name in indexed]
+            use_fts = len(fts_columns) == len(columns)
+            conditions = []
+            used_index = False
+            for term in terms:
+                condition = None
+                if use_fts and len(term) >= FTS_MIN_TERM_LENGTH:
+                    # 컬럼을 제한한 FTS5 구문 검색: {col1 col2} : "term"
+                    phrase = '"' + term.replace('"', '""') + '"'
+                    match = "{" + " ".join(fts_columns) + "} : " + phrase
+                    condition = _fts_condition(conn, table, lambda fts: fts.c[fts_table_name(table_name)].match(match))
+                if condition is None:
+                    pattern = f"%{_escape_like(term)}%"
+                    condition = or_(*[col.like(pattern, escape="\\") for col in columns])
+                else:
+                    used_index = True
+                conditions.append(condition)
+
+            sort_keys = _sort_keys(table, None)
+            stmt = select(table).where(and_(*conditions))
+            stmt = _paginate(stmt, sort_keys, page_size, None, cursor)
+
+            rows, next_cursor = _fetch_page(conn, stmt, sort_keys, page_size, None)
+            formatted_rows = _format_rows(rows, table.c, format)
+
+            return {
+                "table": table_name,
+                "columns": [col.name for col in table.c],
+                "query": query,
+                "searched_columns": [col.name for col in columns],
+                "index": "fts5" if used_index else "like",
+                "row_count": len(formatted_rows),
+                "rows": formatted_rows,
+                "next_cursor": next_cursor,
+            }
+    except Exception as e:
+        return _error_response(f"Error occurred while searching table '{table_name}': {str(e)}")
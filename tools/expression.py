@@ -0,0 +1,316 @@
+"""
+eval 없이 수학 표현식을 계산하는 AST 기반 평가기.
+
+표현식은 한 번 파싱/검증해 클로저 트리로 컴파일하고 LRU 캐시에 보관한다. 같은 컴파일 결과를
+세 가지 모드로 평가할 수 있다.
+    - float: 파이썬 int/float 연산 (기본)
+    - exact: decimal.Decimal 연산. 0.1 + 0.2 == 0.3처럼 십진수 그대로 계산하고, round는 사사오입(ROUND_HALF_UP)한다.
+    - vector: 변수 값이 NumPy 배열이면 배열 전체를 한 번에 계산한다. (NumPy가 설치된 경우)
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation, Overflow, localcontext
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+import ast
+import math
+import operator
+
+from tools.cache import LRUCache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 배열 입력은 값마다 반복 계산한다
+    np = None
+
+MAX_EXPRESSION_LENGTH = 1000
+MAX_NODES = 200
+# 정수 거듭제곱 결과의 최대 비트 수. 9**9**9처럼 계산이 끝나지 않는 식을 막는다.
+MAX_POWER_BITS = 10_000
+DECIMAL_PRECISION = 50
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+_BINARY_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+_UNARY_OPERATORS: Dict[type, Callable[[Any], Any]] = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+FUNCTIONS = ("round", "abs", "min", "max", "sum")
+# 리스트([1, 2]나 리스트 값의 변수)는 이 함수들의 인자로만 쓸 수 있다. [1] * 10**9처럼 리스트에 연산을 하면
+# 파이썬 리스트 반복/연결이 되어 메모리를 다 쓰거나 엉뚱한 결과가 나온다.
+SEQUENCE_FUNCTIONS = ("min", "max", "sum")
+
+
+class ExpressionError(ValueError):
+    """허용되지 않는 문법이나 계산할 수 없는 표현식."""
+
+
+def _power(base: Any, exponent: Any) -> Any:
+    if isinstance(base, int) and isinstance(exponent, int) and abs(base) > 1 and exponent > 0:
+        if exponent * math.log2(abs(base)) > MAX_POWER_BITS:
+            raise ExpressionError("거듭제곱 결과가 너무 큽니다")
+    result = base**exponent
+    if isinstance(result, complex):  # (-8) ** 0.5
+        raise ExpressionError("계산 결과가 실수가 아닙니다")
+    return result
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float, Decimal)):
+        return True
+    return np is not None and isinstance(value, (np.ndarray, np.number))
+
+
+def _check_variable(name: str, value: Any, allow_sequence: bool) -> None:
+    """변수 값은 숫자(또는 NumPy 배열)여야 하고, 리스트는 min/max/sum의 인자로만 쓸 수 있다."""
+    if isinstance(value, (list, tuple)):
+        if not allow_sequence:
+            raise ExpressionError(f"리스트 변수 {name}은(는) {'/'.join(SEQUENCE_FUNCTIONS)}의 인자로만 사용할 수 있습니다")
+        if all(_is_number(item) for item in value):
+            return
+    elif _is_number(value):
+        return
+    raise ExpressionError(f"변수 {name}의 값이 숫자가 아닙니다: {value!r}")
+
+
+def _items(args: tuple) -> Sequence[Any]:
+    """min/max/sum(1, 2, 3)과 min/max/sum([1, 2, 3]) 모두 지원."""
+    if len(args) == 1 and isinstance(args[0], (list, tuple)):
+        return args[0]
+    if any(isinstance(arg, (list, tuple)) for arg in args):
+        raise ExpressionError("리스트 인자는 하나만 줄 수 있습니다 (예: sum([1, 2, 3]))")
+    return args
+
+
+class _Mode:
+    """평가 모드별 상수 변환과 함수 구현."""
+
+    def __init__(self, name: str, const: Callable[[Any], Any], functions: Dict[str, Callable[..., Any]]):
+        self.name = name
+        self.const = const
+        self.functions = functions
+
+
+_FLOAT_MODE = _Mode(
+    "float",
+    lambda value: value,
+    {
+        "round": lambda x, digits=0: round(x, int(digits)),
+        "abs": abs,
+        "min": lambda *args: min(_items(args)),
+        "max": lambda *args: max(_items(args)),
+        "sum": lambda *args: sum(_items(args)),
+    },
+)
+_EXACT_MODE = _Mode(
+    "exact",
+    lambda value: Decimal(repr(value)) if isinstance(value, float) else Decimal(value),
+    {
+        "round": lambda x, digits=0: round(x, int(digits)),
+        "abs": abs,
+        "min": lambda *args: min(_items(args)),
+        "max": lambda *args: max(_items(args)),
+        "sum": lambda *args: sum(_items(args), Decimal(0)),
+    },
+)
+
+
+def _round_elements(x: Any, digits: int) -> Any:
+    """원소마다 파이썬 round. np.round는 소수 자릿수를 줄 때 10**digits를 곱해 반올림하므로 결과가 다를 수 있다."""
+    rounded = [round(value, digits) for value in np.ravel(x).tolist()]
+    return np.reshape(np.array(rounded, dtype=float), np.shape(x))
+
+
+if np is not None:
+    # 배열끼리는 원소별로 계산한다: max(a, b)는 np.maximum, sum(a, b)는 원소별 합.
+    _VECTOR_MODE: Optional[_Mode] = _Mode(
+        "vector",
+        lambda value: value,
+        {
+            "round": lambda x, digits=0: np.round(x) if int(digits) == 0 else _round_elements(x, int(digits)),
+            "abs": np.abs,
+            "min": lambda *args: np.minimum.reduce(np.broadcast_arrays(*_items(args))),
+            "max": lambda *args: np.maximum.reduce(np.broadcast_arrays(*_items(args))),
+            "sum": lambda *args: np.sum(np.broadcast_arrays(*_items(args)), axis=0),
+        },
+    )
+else:
+    _VECTOR_MODE = None
+
+Evaluator = Callable[[Mapping[str, Any], _Mode], Any]
+
+
+def _compile_node(node: ast.AST, allow_sequence: bool = False) -> Evaluator:
+    """node를 평가 함수로 컴파일. allow_sequence는 node가 min/max/sum의 인자 자리일 때만 True다."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ExpressionError(f"숫자가 아닌 값은 사용할 수 없습니다: {value!r}")
+        return lambda variables, mode: mode.const(value)
+    if isinstance(node, ast.Name):
+        name = node.id
+
+        def lookup(variables: Mapping[str, Any], mode: _Mode) -> Any:
+            if name in variables:
+                value = variables[name]
+                _check_variable(name, value, allow_sequence)
+                return value
+            if name in CONSTANTS:
+                return mode.const(CONSTANTS[name])
+            raise ExpressionError(f"정의되지 않은 변수: {name}")
+
+        return lookup
+    if isinstance(node, ast.BinOp):
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        if isinstance(node.op, ast.Pow):
+            return lambda variables, mode: _power(left(variables, mode), right(variables, mode))
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"허용되지 않는 연산자: {type(node.op).__name__}")
+        return lambda variables, mode: op(left(variables, mode), right(variables, mode))
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand)
+        op = _UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ExpressionError(f"허용되지 않는 연산자: {type(node.op).__name__}")
+        return lambda variables, mode: op(operand(variables, mode))
+    if isinstance(node, (ast.List, ast.Tuple)):
+        if not allow_sequence:
+            raise ExpressionError(f"리스트는 {'/'.join(SEQUENCE_FUNCTIONS)}의 인자로만 사용할 수 있습니다")
+        elements = [_compile_node(element) for element in node.elts]
+        return lambda variables, mode: [element(variables, mode) for element in elements]
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+            raise ExpressionError(f"허용되지 않는 함수 호출입니다. 사용 가능한 함수: {', '.join(FUNCTIONS)}")
+        name = node.func.id
+        args = [_compile_node(arg, name in SEQUENCE_FUNCTIONS) for arg in node.args]
+        return lambda variables, mode: mode.functions[name](*(arg(variables, mode) for arg in args))
+    raise ExpressionError(f"허용되지 않는 문법: {type(node).__name__}")
+
+
+class CompiledExpression:
+    """검증과 컴파일을 마친 표현식. evaluate()는 여러 번, 여러 스레드에서 호출해도 된다."""
+
+    def __init__(self, source: str):
+        if len(source) > MAX_EXPRESSION_LENGTH:
+            raise ExpressionError(f"표현식이 너무 깁니다 (최대 {MAX_EXPRESSION_LENGTH}자)")
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"문법 오류: {e.msg}") from None
+        except (RecursionError, MemoryError, ValueError):
+            raise ExpressionError("표현식을 해석할 수 없습니다") from None
+        nodes = list(ast.walk(tree.body))
+        if len(nodes) > MAX_NODES:
+            raise ExpressionError(f"표현식이 너무 복잡합니다 (최대 {MAX_NODES}개 노드)")
+        self.source = source
+        self.variables = sorted({node.id for node in nodes if isinstance(node, ast.Name)} - set(CONSTANTS))
+        self.functions = {node.func.id for node in nodes if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)}
+        self._evaluate = _compile_node(tree.body)
+
+    def evaluate(self, variables: Optional[Mapping[str, Any]] = None, exact: bool = False) -> Any:
+        """
+        변수 값을 넣어 계산. exact=True면 Decimal로 계산한다.
+        변수 값 중 NumPy 배열이 있으면 배열 전체를 원소별로 한 번에 계산한다.
+        """
+        variables = dict(variables or {})
+        try:
+            if exact:
+                with localcontext() as context:
+                    context.prec = DECIMAL_PRECISION
+                    context.rounding = ROUND_HALF_UP
+                    converted = {
+                        name: [_EXACT_MODE.const(item) for item in value]
+                        if isinstance(value, (list, tuple))
+                        else _EXACT_MODE.const(value)
+                        for name, value in variables.items()
+                    }
+                    return self._evaluate(converted, _EXACT_MODE)
+            if _VECTOR_MODE is not None and any(isinstance(value, np.ndarray) for value in variables.values()):
+                with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                    return self._evaluate(variables, _VECTOR_MODE)
+            return self._evaluate(variables, _FLOAT_MODE)
+        except ExpressionError:
+            raise
+        except ZeroDivisionError:
+            raise ExpressionError("0으로 나눌 수 없습니다") from None
+        except (OverflowError, Overflow):
+            raise ExpressionError("계산 결과가 너무 큽니다") from None
+        except (ArithmeticError, InvalidOperation, TypeError, ValueError) as e:
+            raise ExpressionError(str(e) or type(e).__name__) from None
+
+
+# 표현식 문자열 -> CompiledExpression (컴파일 실패 시 ExpressionError)
+_COMPILED = LRUCache(max_entries=1024)
+
+
+def compile_expression(source: str) -> CompiledExpression:
+    """표현식을 컴파일하고 결과를 캐시. 문법이 허용되지 않으면 ExpressionError."""
+    compiled = _COMPILED.get(source)
+    if compiled is None:
+        try:
+            compiled = CompiledExpression(source)
+        except ExpressionError as e:
+            compiled = e
+        _COMPILED.set(source, compiled, len(source))
+    if isinstance(compiled, ExpressionError):
+        raise compiled
+    return compiled
+
+
+def get_compile_cache_stats() -> Dict[str, Any]:
+    """컴파일 캐시의 hit/miss/eviction 횟수와 현재 항목 수."""
+    return _COMPILED.stats()
+
+
+def evaluate_over(
+    compiled: CompiledExpression,
+    columns: Mapping[str, Sequence[Any]],
+    scalars: Optional[Mapping[str, Any]] = None,
+    exact: bool = False,
+) -> List[Any]:
+    """
+    같은 길이의 값 목록(columns)의 각 위치마다 표현식을 계산해 결과 목록을 반환.
+
+    NumPy가 있고 exact가 아니며 값이 모두 float이면 배열로 바꿔 한 번에 계산하고, 아니면 위치마다 계산한다.
+    int 값은 2**53을 넘으면 float로 바꿀 때 정밀도를 잃고 / 결과의 타입도 달라지므로 배열로 계산하지 않는다.
+    결과가 유한한 수가 아닌 위치(0으로 나누기, 오버플로 등)는 위치별 계산으로 다시 구해 결과와 에러가 같게 한다.
+    위치별로 실패한 계산은 그 위치에 ExpressionError를 담는다.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ExpressionError("배열 변수의 길이가 모두 같아야 합니다")
+    length = lengths.pop() if lengths else 0
+    scalars = dict(scalars or {})
+
+    def evaluate_at(i: int) -> Any:
+        try:
+            return compiled.evaluate({**scalars, **{name: values[i] for name, values in columns.items()}}, exact)
+        except ExpressionError as e:
+            return e
+
+    # min/max는 인자를 그대로 반환하므로(min(2.5, 1) == 1) 배열로 계산하면 int 인자가 float로 바뀐다.
+    if (
+        np is not None
+        and not exact
+        and length
+        and not compiled.functions & {"min", "max"}
+        and all(isinstance(value, float) for values in columns.values() for value in values)
+    ):
+        arrays = {name: np.asarray(values, dtype=float) for name, values in columns.items()}
+        try:
+            result = np.broadcast_to(compiled.evaluate({**scalars, **arrays}), (length,))
+        except ExpressionError:
+            result = None  # 배열과 무관하게 실패하는 식(1/0 등)은 위치별 계산이 같은 에러를 담는다
+        if result is not None:
+            results = result.tolist()
+            if result.dtype.kind == "f":
+                for i in np.flatnonzero(~np.isfinite(result)).tolist():
+                    results[i] = evaluate_at(i)
+            return results
+
+    return [evaluate_at(i) for i in range(length)]
@@ -0,0 +1,116 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+import threading
+
+from sqlalchemy.engine import Connection, Engine
+
+
+# DB 툴이 실행 중에 필터/조인/정렬/그룹화에 사용한 (테이블, 컬럼, 용도)별 횟수
+_COLUMN_USAGE: Counter = Counter()
+_USAGE_LOCK = threading.Lock()
+
+USAGE_KINDS = ("filter", "join", "order_by", "group_by")
+
+
+def record_column_usage(table_name: str, column_name: str, kind: str) -> None:
+    """DB 툴이 특정 컬럼을 필터/조인/정렬/그룹화에 사용했음을 기록."""
+    with _USAGE_LOCK:
+        _COLUMN_USAGE[(table_name, column_name, kind)] += 1
+
+
+def get_column_usage() -> Dict[Tuple[str, str], Dict[str, int]]:
+    """기록된 사용 횟수를 {(테이블, 컬럼): {용도: 횟수}} 형태로 반환."""
+    usage: Dict[Tuple[str, str], Dict[str, int]] = {}
+    with _USAGE_LOCK:
+        items = list(_COLUMN_USAGE.items())
+    for (table_name, column_name, kind), count in items:
+        usage.setdefault((table_name, column_name), {})[kind] = count
+    return usage
+
+
+def reset_column_usage() -> None:
+    """기록된 사용 횟수를 모두 지운다."""
+    with _USAGE_LOCK:
+        _COLUMN_USAGE.clear()
+
+
+def _indexed_leading_columns(conn: Connection, table_name: str) -> set[str]:
+    """인덱스의 선두 컬럼으로 쓰이는 컬럼 집합 (INTEGER PRIMARY KEY인 rowid 별칭 포함)."""
+    leading: set[str] = set()
+    for _, index_name, *_ in conn.exec_driver_sql(f'PRAGMA index_list("{table_name}")'):
+        info = conn.exec_driver_sql(f'PRAGMA index_info("{index_name}")').fetchall()
+        first = next((row for row in info if row[0] == 0), None)
+        if first is not None and first[2] is not None:
+            leading.add(first[2])
+
+    # INTEGER PRIMARY KEY 컬럼은 rowid 자체이므로 별도 인덱스가 필요 없다.
+    table_info = conn.exec_driver_sql(f'PRAGMA table_info("{table_name}")').fetchall()
+    primary_keys = [row for row in table_info if row[5] > 0]
+    if len(primary_keys) == 1 and primary_keys[0][2].upper() == "INTEGER":
+        leading.add(primary_keys[0][1])
+    return leading
+
+
+def _index_name(table_name: str, column_name: str) -> str:
+    return f"ix_{table_name}_{column_name}"
+
+
+def get_index_report(engine: Engine, min_uses: int = 1) -> List[Dict[str, Any]]:
+    """
+    기록된 컬럼 사용량을 기준으로 인덱스가 없는 컬럼을 찾아 보고.
+
+    Args:
+        engine (Engine): 검사할 DB 엔진.
+        min_uses (int): 보고 대상이 되는 최소 사용 횟수.
+    Returns:
+        list[dict]: 사용 횟수 내림차순으로 정렬된 누락 인덱스 목록 (테이블, 컬럼, 용도별 횟수, 생성 DDL).
+    """
+    report: List[Dict[str, Any]] = []
+    usage = get_column_usage()
+    with engine.connect() as conn:
+        existing_tables = {
+            row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        leading_cache: Dict[str, set[str]] = {}
+        for (table_name, column_name), kinds in usage.items():
+            total = sum(kinds.values())
+            if total < min_uses or table_name not in existing_tables:
+                continue
+            if table_name not in leading_cache:
+                leading_cache[table_name] = _indexed_leading_columns(conn, table_name)
+            if column_name in leading_cache[table_name]:
+                continue
+            report.append(
+                {
+                    "table": table_name,
+                    "column": column_name,
+                    "uses": total,
+                    "kinds": kinds,
+                    "ddl": (
+                        f'CREATE INDEX IF NOT EXISTS "{_index_name(table_name, column_name)}" '
+                        f'ON "{table_name}" ("{column_name}")'
+                    ),
+                }
+            )
+    report.sort(key=lambda item: item["uses"], reverse=True)
+    return report
+
+
+def create_missing_indexes(engine: Engine, min_uses: int = 1, report: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+    """
+    누락된 인덱스를 실제로 생성. 쓰기 가능한 엔진을 넘겨야 한다.
+
+    Args:
+        engine (Engine): 인덱스를 생성할 DB 엔진.
+        min_uses (int): 생성 대상이 되는 최소 사용 횟수.
+        report (Optional[list[dict]]): get_index_report 결과. 생략하면 새로 계산.
+    Returns:
+        list[str]: 실행한 DDL 목록.
+    """
+    if report is None:
+        report = get_index_report(engine, min_uses=min_uses)
+    statements = [item["ddl"] for item in report if item["uses"] >= min_uses]
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.exec_driver_sql(statement)
+    return statements
@@ -0,0 +1,205 @@
+"""
+로컬 문서에 대한 BM25 검색. SerpAPI 대신 web_tool의 검색 클라이언트로 사용할 수 있다.
+
+인덱스는 index_dir에 다음 파일로 저장되며, 문서 파일이 바뀌지 않았으면 다시 만들지 않고 불러온다.
+    - meta.json: 문서 목록(제목, 링크, 본문), 문서 길이, 용어 사전(용어 -> postings 위치, 문서 빈도)
+    - postings.bin: 용어별 (문서 번호, 빈도) uint32 쌍. mmap으로 열어 필요한 용어 구간만 읽는다.
+"""
+
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import threading
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+INDEX_VERSION = 1
+
+_WORD = re.compile(r"\w+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰화. 한글이 들어간 단어는 글자 바이그램으로 나눠 조사/어미가 붙어도 매칭되게 하고
+    (예: "호날두의" -> 호날, 날두, 두의), 그 외 단어는 소문자로 바꿔 그대로 쓴다.
+    """
+    tokens = []
+    for word in _WORD.findall(text.casefold()):
+        if _HANGUL.search(word) and len(word) > 1:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _iter_documents(paths: Iterable[Path]) -> Iterator[Dict[str, str]]:
+    """
+    문서 파일에서 (title, link, text) 문서를 읽는다.
+    - *.json: KorQuAD 형식({"data": [{"title", "paragraphs": [{"context"}]}]})이면 문단 하나가 문서 하나.
+    - *.txt, *.md: 파일 하나가 문서 하나이고 파일 이름이 제목.
+    """
+    for path in paths:
+        if path.suffix == ".json":
+            try:
+                data = json.loads(path.read_text(encoding="utf-8")).get("data")
+            except (ValueError, AttributeError):
+                continue
+            if not isinstance(data, list):
+                continue
+            for i, article in enumerate(data):
+                for j, paragraph in enumerate(article.get("paragraphs", [])):
+                    yield {
+                        "title": article.get("title", path.stem),
+                        "link": f"local://{path.name}#{i}.{j}",
+                        "text": paragraph["context"],
+                    }
+        elif path.suffix in (".txt", ".md"):
+            yield {"title": path.stem, "link": f"local://{path.name}", "text": path.read_text(encoding="utf-8")}
+
+
+def _corpus_files(corpus: Iterable[Path]) -> List[Path]:
+    files = []
+    for path in map(Path, corpus):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.suffix in (".json", ".txt", ".md")))
+        elif path.exists():
+            files.append(path)
+    return files
+
+
+def _fingerprint(files: List[Path]) -> str:
+    """문서 파일 경로/크기/수정 시각과 인덱스 형식 버전의 해시. 바뀌면 인덱스를 다시 만든다."""
+    digest = hashlib.sha256(str(INDEX_VERSION).encode("ascii"))
+    for path in files:
+        stat = path.stat()
+        digest.update(f"{path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_index(corpus: Iterable[Path], index_dir: Path) -> None:
+    """corpus(파일 또는 디렉터리 목록)의 문서로 index_dir에 BM25 인덱스를 만든다."""
+    files = _corpus_files(corpus)
+    documents = list(_iter_documents(files))
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    lengths = []
+    for doc_id, document in enumerate(documents):
+        tokens = tokenize(f"{document['title']} {document['text']}")
+        lengths.append(len(tokens))
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            postings.setdefault(token, []).append((doc_id, tf))
+
+    buffer = array("I")
+    vocabulary = {}
+    for term in sorted(postings):
+        vocabulary[term] = [len(buffer) // 2, len(postings[term])]
+        for doc_id, tf in postings[term]:
+            buffer.append(doc_id)
+            buffer.append(tf)
+
+    index_dir = Path(index_dir)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    # 다른 프로세스가 만드는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다. meta.json을 마지막에 바꾼다.
+    tmp = index_dir / f"postings.bin.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        buffer.tofile(f)
+    os.replace(tmp, index_dir / "postings.bin")
+    meta = {
+        "fingerprint": _fingerprint(files),
+        "documents": documents,
+        "lengths": lengths,
+        "vocabulary": vocabulary,
+    }
+    tmp = index_dir / f"meta.json.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, index_dir / "meta.json")
+
+
+class LocalSearchClient:
+    """
+    로컬 문서에 대한 BM25 검색 클라이언트. web_tool.SearchClient와 같은 search(params) 인터페이스로
+    SerpAPI 응답과 같은 모양({"organic_results": [{"position", "title", "link", "snippet"}]})을 반환한다.
+    """
+
+    name = "local"
+
+    def __init__(self, corpus: Iterable[Path], index_dir: Path, top_k: int = 10, snippet_chars: int = 200):
+        self.corpus = [Path(path) for path in corpus]
+        self.index_dir = Path(index_dir)
+        self.top_k = top_k
+        self.snippet_chars = snippet_chars
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            meta_path = self.index_dir / "meta.json"
+            fingerprint = _fingerprint(_corpus_files(self.corpus))
+            meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else None
+            if meta is None or meta["fingerprint"] != fingerprint:
+                build_index(self.corpus, self.index_dir)
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            self._documents = meta["documents"]
+            self._lengths = meta["lengths"]
+            self._vocabulary = meta["vocabulary"]
+            self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+            with open(self.index_dir / "postings.bin", "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._postings = memoryview(self._mmap).cast("I")
+                else:
+                    self._postings = memoryview(array("I"))
+            self._loaded = True
+
+    def _snippet(self, text: str, terms: List[str]) -> str:
+        """쿼리 용어가 처음 나오는 위치 주변을 snippet_chars자만큼 잘라낸다."""
+        folded = text.casefold()
+        positions = [pos for pos in (folded.find(term) for term in terms) if pos >= 0]
+        start = max(min(positions) - self.snippet_chars // 4, 0) if positions else 0
+        snippet = text[start : start + self.snippet_chars]
+        return ("..." if start else "") + snippet + ("..." if start + self.snippet_chars < len(text) else "")
+
+    def query(self, text: str, top_k: int) -> List[Tuple[float, int]]:
+        """BM25 점수 상위 top_k개의 (점수, 문서 번호)."""
+        self._load()
+        num_docs = len(self._lengths)
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(text)):
+            entry = self._vocabulary.get(term)
+            if entry is None:
+                continue
+            offset, df = entry
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            for i in range(offset * 2, (offset + df) * 2, 2):
+                doc_id, tf = self._postings[i], self._postings[i + 1]
+                norm = K1 * (1 - B + B * self._lengths[doc_id] / self._avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        return heapq.nlargest(top_k, ((score, doc_id) for doc_id, score in scores.items()))
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        terms = params["q"].casefold().split() + tokenize(params["q"])
+        organic_results = []
+        for position, (score, doc_id) in enumerate(self.query(params["q"], self.top_k), start=1):
+            document = self._documents[doc_id]
+            organic_results.append(
+                {
+                    "position": position,
+                    "title": document["title"],
+                    "link": document["link"],
+                    "snippet": self._snippet(document["text"], terms),
+                }
+            )
+        return {"organic_results": organic_results}
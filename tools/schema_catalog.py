@@ -0,0 +1,153 @@
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+import json
+import os
+import threading
+
+from sqlalchemy import MetaData, String, Table, UniqueConstraint, select, func
+from sqlalchemy.engine import Connection
+
+
+# 문자열 컬럼의 서로 다른 값이 이 개수 이하이면 저카디널리티 컬럼으로 보고 값 목록을 카탈로그에 포함
+LOW_CARDINALITY_MAX_DISTINCT = int(os.getenv("DB_TOOL_CATALOG_MAX_DISTINCT", "12"))
+
+CATALOG_FORMAT_VERSION = 1
+
+# 프로세스 내 캐시: 카탈로그 파일 경로 -> (캐시 키, 카탈로그)
+_CATALOG_MEMO: Dict[str, tuple] = {}
+_CATALOG_LOCK = threading.Lock()
+
+
+def _distinct_values(conn: Connection, table: Table, column) -> Optional[List[Any]]:
+    """서로 다른 값이 LOW_CARDINALITY_MAX_DISTINCT개 이하이면 정렬된 값 목록, 아니면 None."""
+    # 한도 + 1개까지만 읽으므로 고카디널리티 컬럼도 전체 DISTINCT를 계산하지 않는다.
+    stmt = select(column).where(column.is_not(None)).distinct().limit(LOW_CARDINALITY_MAX_DISTINCT + 1)
+    values = [row[0] for row in conn.execute(stmt)]
+    if len(values) > LOW_CARDINALITY_MAX_DISTINCT:
+        return None
+    return sorted(values)
+
+
+def _unique_columns(table: Table) -> set[str]:
+    """단일 컬럼 UNIQUE 제약/인덱스가 걸린 컬럼 이름 (이름처럼 행마다 다른 값이므로 값 목록에서 제외)."""
+    unique = {col.name for col in table.c if col.unique}
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and len(constraint.columns) == 1:
+            unique.update(col.name for col in constraint.columns)
+    for index in table.indexes:
+        if index.unique and len(index.columns) == 1:
+            unique.update(col.name for col in index.columns)
+    return unique
+
+
+def build_schema_catalog(conn: Connection, metadata: MetaData) -> Dict[str, Any]:
+    """
+    한 번의 순회로 모든 테이블의 컬럼, 타입, 외래키, 행 수, 저카디널리티 컬럼의 값 목록을 모은다.
+
+    Returns:
+        dict: {"tables": [{"name", "row_count", "columns": [...], "foreign_keys": [...]}]}
+    """
+    tables: List[Dict[str, Any]] = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        primary_keys = {col.name for col in table.primary_key.columns}
+        unique_columns = _unique_columns(table)
+        columns: List[Dict[str, Any]] = []
+        for col in table.c:
+            info: Dict[str, Any] = {
+                "name": col.name,
+                "type": str(col.type),
+                "nullable": col.nullable,
+                "primary_key": col.name in primary_keys,
+            }
+            if isinstance(col.type, String) and col.name not in primary_keys | unique_columns:
+                values = _distinct_values(conn, table, col)
+                if values is not None:
+                    info["values"] = values
+            columns.append(info)
+
+        foreign_keys = [
+            {"column": fk.parent.name, "references": f"{fk.column.table.name}.{fk.column.name}"}
+            for fk in sorted(table.foreign_keys, key=lambda fk: fk.parent.name)
+        ]
+        tables.append(
+            {
+                "name": table.name,
+                "row_count": conn.execute(select(func.count()).select_from(table)).scalar(),
+                "columns": columns,
+                "foreign_keys": foreign_keys,
+            }
+        )
+    return {"tables": tables}
+
+
+def load_schema_catalog(
+    conn: Connection, metadata: MetaData, cache_path: Optional[Path], cache_key: List[Any]
+) -> Dict[str, Any]:
+    """
+    디스크에 캐시된 카탈로그를 반환. cache_key가 다르거나 파일이 없으면 새로 만들어 저장한다.
+
+    Args:
+        conn (Connection): 카탈로그를 만들 때 사용할 커넥션.
+        metadata (MetaData): 리플렉션된 스키마.
+        cache_path (Path | None): 카탈로그 JSON 파일 경로. None이면 프로세스 내에서만 캐시한다.
+        cache_key (list): 스키마 버전 등 카탈로그가 유효한 조건. JSON으로 직렬화 가능해야 한다.
+    Returns:
+        dict: build_schema_catalog 결과.
+    """
+    cache_key = [CATALOG_FORMAT_VERSION, *cache_key]
+    memo_key = str(cache_path)
+    memo = _CATALOG_MEMO.get(memo_key)
+    if memo is not None and memo[0] == cache_key:
+        return memo[1]
+
+    with _CATALOG_LOCK:
+        catalog = None
+        if cache_path is not None:
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    cached = json.load(f)
+                if cached.get("key") == cache_key:
+                    catalog = cached["catalog"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        if catalog is None:
+            catalog = build_schema_catalog(conn, metadata)
+            if cache_path is not None:
+                try:
+                    # 다른 프로세스가 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+                    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump({"key": cache_key, "catalog": catalog}, f, ensure_ascii=False, default=str)
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    pass  # 캐시 디렉터리에 쓸 수 없어도 카탈로그는 반환
+
+        _CATALOG_MEMO[memo_key] = (cache_key, catalog)
+        return catalog
+
+
+def format_schema_catalog(catalog: Dict[str, Any]) -> str:
+    """
+    카탈로그를 시스템 프롬프트에 넣을 수 있는 간결한 텍스트로 변환.
+
+    예)
+        contracts (25 rows)
+          id INTEGER PK, client_id INTEGER -> clients.id, status VARCHAR {active|closed|pending}
+    """
+    lines: List[str] = []
+    for table in catalog["tables"]:
+        references = {fk["column"]: fk["references"] for fk in table["foreign_keys"]}
+        columns = []
+        for col in table["columns"]:
+            text = f"{col['name']} {col['type']}"
+            if col["primary_key"]:
+                text += " PK"
+            if col["name"] in references:
+                text += f" -> {references[col['name']]}"
+            if "values" in col:
+                text += " {" + "|".join(str(value) for value in col["values"]) + "}"
+            columns.append(text)
+        lines.append(f"{table['name']} ({table['row_count']} rows)")
+        lines.append("  " + ", ".join(columns))
+    return "\n".join(lines)
@@ -0,0 +1,188 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+
+
+def normalize_search_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """캐시 키용 정규화: 유니코드 NFKC, 연속 공백 하나로, 대소문자 무시."""
+    return {
+        name: " ".join(unicodedata.normalize("NFKC", str(value)).split()).casefold()
+        for name, value in sorted(params.items())
+    }
+
+
+class SearchCache:
+    """
+    검색 결과를 SQLite 파일에 저장하는 TTL 캐시. 프로세스를 다시 시작해도 유지된다.
+
+    - ttl초가 지나지 않은 결과는 그대로 반환한다.
+    - stale_ttl > 0이면 만료 후 stale_ttl초 동안은 오래된 결과를 바로 반환하고 백그라운드에서 갱신한다
+      (stale-while-revalidate). 검색이 실패해도 남아 있는 결과가 있으면 그것을 반환한다.
+    - offline이면 검색하지 않고 나이와 무관하게 캐시된 결과만 반환한다.
+    - 항목 수/바이트 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+      히트마다 쓰기/커밋을 하지 않도록 사용 시각(last_used)은 touch_interval초보다 오래된 경우에만 갱신한다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = 24 * 3600,
+        stale_ttl: float = 0,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        offline: bool = False,
+        touch_interval: float = 60,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, size INTEGER NOT NULL, "
+            "fetched_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_search_cache_last_used ON search_cache (last_used)")
+        self._conn.commit()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _read(self, key: str) -> Optional[tuple[Dict[str, Any], float]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at, last_used FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[2] >= self.touch_interval:
+                self._conn.execute("UPDATE search_cache SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+        return json.loads(row[0]), row[1]
+
+    def _write(self, key: str, result: Dict[str, Any]) -> None:
+        text = json.dumps(result, ensure_ascii=False)
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, result, size, fetched_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """한도를 넘은 만큼 last_used가 오래된 항목부터 삭제. _lock을 잡은 상태에서 호출한다."""
+        entries, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache").fetchone()
+        if entries <= self.max_entries and total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM search_cache ORDER BY last_used"):
+            if entries <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            entries -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM search_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def _refresh(self, key: str, fetch: Callable[[], Dict[str, Any]]) -> None:
+        try:
+            self._write(key, fetch())
+            self._count("refreshes")
+        except Exception:
+            self._count("errors")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(self, params: Dict[str, Any], fetch: Callable[[], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        params에 해당하는 캐시된 결과를 반환하고, 없거나 만료되었으면 fetch()로 가져와 저장.
+
+        fetch가 예외를 던지면 남아 있는 오래된 결과를 반환하고, 없으면 예외를 그대로 전달한다.
+        offline인데 캐시에 없으면 None.
+        """
+        key = json.dumps(normalize_search_params(params), ensure_ascii=False, sort_keys=True)
+        cached = self._read(key)
+        if cached is not None:
+            result, fetched_at = cached
+            age = time.time() - fetched_at
+            if age < self.ttl or self.offline:
+                self._count("hits")
+                return result
+            if age < self.ttl + self.stale_ttl:
+                with self._lock:
+                    self.stale_hits += 1
+                    start_refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+                if start_refresh:
+                    self._refresh_executor.submit(self._refresh, key, fetch)
+                return result
+
+        self._count("misses")
+        if self.offline:
+            return None
+        try:
+            result = fetch()
+        except Exception:
+            self._count("errors")
+            if cached is not None:
+                return cached[0]  # 검색이 실패하면 오래된 결과라도 반환
+            raise
+        self._write(key, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """hit/stale hit/miss/refresh/error/eviction 횟수와 현재 저장된 항목 수/바이트."""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_cache"
+            ).fetchone()
+            hits, stale_hits, misses = self.hits, self.stale_hits, self.misses
+            refreshes, errors, evictions = self.refreshes, self.errors, self.evictions
+        lookups = hits + stale_hits + misses
+        return {
+            "hits": hits,
+            "stale_hits": stale_hits,
+            "misses": misses,
+            "hit_rate": (hits + stale_hits) / lookups if lookups else 0.0,
+            "refreshes": refreshes,
+            "errors": errors,
+            "evictions": evictions,
+            "entries": entries,
+            "bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "offline": self.offline,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional
+import json
+import threading
+
+# 검색 결과에서 모델에 넘기는 필드. 나머지(sitelinks, thumbnail, 각종 메타데이터)는 버린다.
+RESULT_FIELDS = ("title", "link", "snippet", "date")
+# answer_box에서 답으로 쓸 필드. 앞에 있는 것부터 찾는다.
+ANSWER_FIELDS = ("answer", "result", "snippet", "title")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 쓰는 대략적인 토큰 수 추정.
+    영문/숫자 등 ASCII는 4자당 1토큰, 한글 등 나머지 문자는 1자당 1토큰으로 센다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _answer_text(answer_box: Any) -> Optional[str]:
+    if not isinstance(answer_box, dict):
+        return None
+    for field in ANSWER_FIELDS:
+        value = answer_box.get(field)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    highlighted = answer_box.get("snippet_highlighted_words")
+    if isinstance(highlighted, list) and highlighted:
+        return ", ".join(map(str, highlighted))
+    return None
+
+
+def compact_result(search_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    SerpAPI 응답(또는 이미 압축된 결과)을 answer와 organic_results의 필요한 필드만 남긴 형태로 변환.
+    원래 툴이 반환하던 부분(answer_box + organic_results)의 크기를 source_bytes/source_tokens로 함께 기록한다.
+    """
+    if "source_bytes" in search_result:
+        return search_result
+    source = _dumps(
+        {key: search_result[key] for key in ("answer_box", "organic_results") if key in search_result}
+    )
+    result: Dict[str, Any] = {}
+    answer = _answer_text(search_result.get("answer_box"))
+    if answer is not None:
+        result["answer"] = answer
+    result["organic_results"] = [
+        {field: item[field] for field in RESULT_FIELDS if item.get(field)}
+        for item in search_result.get("organic_results", [])
+    ]
+    result["source_bytes"] = len(source.encode("utf-8"))
+    result["source_tokens"] = estimate_tokens(source)
+    return result
+
+
+def _rank(query: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """쿼리 단어가 제목/스니펫에 많이 나오는 결과를 앞으로. 같으면 원래 검색 순위를 유지한다."""
+    terms = {term for term in query.casefold().split() if term}
+
+    def matches(item: Dict[str, Any]) -> int:
+        text = f"{item.get('title', '')} {item.get('snippet', '')}".casefold()
+        return sum(term in text for term in terms)
+
+    return sorted(items, key=lambda item: -matches(item))
+
+
+def fit_to_budget(query: str, result: Dict[str, Any], max_tokens: int, snippet_chars: int) -> Dict[str, Any]:
+    """
+    압축된 결과를 순위대로 정렬하고, 직렬화한 크기가 max_tokens(추정치)를 넘지 않을 때까지 결과를 담는다.
+    스니펫은 snippet_chars자로 자르고, 첫 결과조차 예산을 넘으면 그 스니펫을 예산에 맞게 더 자른다.
+    """
+    fitted: Dict[str, Any] = {}
+    if "answer" in result:
+        fitted["answer"] = result["answer"][:snippet_chars]
+    fitted["organic_results"] = []
+    used = estimate_tokens(_dumps(fitted))
+    for item in _rank(query, result.get("organic_results", [])):
+        item = dict(item)
+        if "snippet" in item:
+            item["snippet"] = item["snippet"][:snippet_chars]
+        cost = estimate_tokens(_dumps(item)) + 1
+        if used + cost > max_tokens:
+            if fitted["organic_results"] or "snippet" not in item:
+                break
+            # 한 글자는 최대 1토큰이므로 넘친 토큰 수만큼 자르고, ASCII가 섞여 덜 줄었으면 다시 자른다.
+            while item["snippet"] and used + cost > max_tokens:
+                overflow = used + cost - max_tokens
+                item["snippet"] = item["snippet"][: max(len(item["snippet"]) - overflow, 0)]
+                cost = estimate_tokens(_dumps(item)) + 1
+            if not item["snippet"] or used + cost > max_tokens:
+                break
+        fitted["organic_results"].append(item)
+        used += cost
+    return fitted
+
+
+class CompactionStats:
+    """검색 결과 압축으로 줄인 바이트/토큰(추정) 누적 카운터와 마지막 호출의 기록."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.bytes_before = 0
+            self.bytes_after = 0
+            self.tokens_before = 0
+            self.tokens_after = 0
+            self.last: Optional[Dict[str, Any]] = None
+
+    def record(self, query: str, result: Dict[str, Any], fitted: Dict[str, Any]) -> Dict[str, Any]:
+        """압축 전(원래 툴 출력) 대비 fitted의 크기를 기록하고 이번 호출의 절감량을 반환."""
+        text = _dumps(fitted)
+        entry = {
+            "query": query,
+            "bytes_before": result.get("source_bytes", 0),
+            "bytes_after": len(text.encode("utf-8")),
+            "tokens_before": result.get("source_tokens", 0),
+            "tokens_after": estimate_tokens(text),
+        }
+        entry["bytes_saved"] = entry["bytes_before"] - entry["bytes_after"]
+        entry["tokens_saved"] = entry["tokens_before"] - entry["tokens_after"]
+        with self._lock:
+            self.calls += 1
+            self.bytes_before += entry["bytes_before"]
+            self.bytes_after += entry["bytes_after"]
+            self.tokens_before += entry["tokens_before"]
+            self.tokens_after += entry["tokens_after"]
+            self.last = entry
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "bytes_before": self.bytes_before,
+                "bytes_after": self.bytes_after,
+                "bytes_saved": self.bytes_before - self.bytes_after,
+                "tokens_before": self.tokens_before,
+                "tokens_after": self.tokens_after,
+                "tokens_saved": self.tokens_before - self.tokens_after,
+                "last": self.last,
+            }
@@ -1,11 +1,148 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
 
 from serpapi import GoogleSearch
 from langchain.tools import tool
 
+from tools.local_search import LocalSearchClient
+from tools.search_cache import SearchCache
+from tools.search_compaction import CompactionStats, compact_result, fit_to_budget
+
 
 SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
 
+# 검색 결과 캐시 설정. WEB_SEARCH_OFFLINE=1이면 SerpAPI를 호출하지 않고 캐시된 결과만 사용한다.
+WEB_SEARCH_CACHE_PATH = Path(
+    os.getenv("WEB_SEARCH_CACHE_PATH", str(Path(__file__).parent.parent / ".cache" / "google_search.db"))
+)
+WEB_SEARCH_CACHE_TTL = float(os.getenv("WEB_SEARCH_CACHE_TTL", str(24 * 3600)))
+WEB_SEARCH_CACHE_STALE_TTL = float(os.getenv("WEB_SEARCH_CACHE_STALE_TTL", "0"))
+WEB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("WEB_SEARCH_CACHE_MAX_ENTRIES", "10000"))
+WEB_SEARCH_CACHE_MAX_BYTES = int(os.getenv("WEB_SEARCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+WEB_SEARCH_OFFLINE = os.getenv("WEB_SEARCH_OFFLINE", "0") == "1"
+# 검색 백엔드: serpapi(기본) 또는 local(로컬 문서에 대한 BM25 검색).
+WEB_SEARCH_BACKEND = os.getenv("WEB_SEARCH_BACKEND", "serpapi")
+# local 백엔드가 색인하는 파일/디렉터리 목록(os.pathsep으로 구분)과 인덱스 저장 위치.
+WEB_SEARCH_LOCAL_CORPUS = [
+    Path(path)
+    for path in os.getenv(
+        "WEB_SEARCH_LOCAL_CORPUS", str(Path(__file__).parent.parent / "test" / "web_test_10.json")
+    ).split(os.pathsep)
+]
+WEB_SEARCH_LOCAL_INDEX = Path(
+    os.getenv("WEB_SEARCH_LOCAL_INDEX", str(Path(__file__).parent.parent / ".cache" / "local_search"))
+)
+# google_search_batch에서 동시에 실행하는 검색 수의 상한.
+WEB_SEARCH_MAX_WORKERS = int(os.getenv("WEB_SEARCH_MAX_WORKERS", "4"))
+# 검색 한 번의 결과로 모델에 넘기는 토큰 수(추정) 상한과 스니펫 최대 길이(자).
+WEB_SEARCH_TOKEN_BUDGET = int(os.getenv("WEB_SEARCH_TOKEN_BUDGET", "800"))
+WEB_SEARCH_SNIPPET_CHARS = int(os.getenv("WEB_SEARCH_SNIPPET_CHARS", "300"))
+
+
+class SearchClient(Protocol):
+    """
+    검색 백엔드 인터페이스. params(q/location/hl/gl)로 검색하고 SerpAPI 형식의 dict를 반환한다.
+    name은 캐시 키에 들어가 백엔드마다 결과를 따로 저장한다.
+    """
+
+    name: str
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]: ...
+
+
+class SerpApiClient:
+    """SerpAPI google_light 엔진으로 검색하는 기본 클라이언트."""
+
+    name = "serpapi"
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or SERPAPI_API_KEY
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return GoogleSearch(
+            {**params, "engine": "google_light", "google_domain": "google.com", "api_key": self.api_key}
+        ).get_dict()
+
+
+def _default_search_client() -> SearchClient:
+    if WEB_SEARCH_BACKEND == "local":
+        return LocalSearchClient(WEB_SEARCH_LOCAL_CORPUS, WEB_SEARCH_LOCAL_INDEX)
+    if WEB_SEARCH_BACKEND != "serpapi":
+        raise ValueError(f"Unknown WEB_SEARCH_BACKEND: {WEB_SEARCH_BACKEND!r} (expected 'serpapi' or 'local')")
+    return SerpApiClient()
+
+
+_search_client: SearchClient = _default_search_client()
+_search_cache: Optional[SearchCache] = None
+_compaction_stats = CompactionStats()
+
+
+def set_search_client(client: SearchClient) -> None:
+    """검색 클라이언트를 교체 (테스트용 가짜 클라이언트 등)."""
+    global _search_client
+    _search_client = client
+
+
+def _get_search_cache() -> SearchCache:
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchCache(
+            WEB_SEARCH_CACHE_PATH,
+            ttl=WEB_SEARCH_CACHE_TTL,
+            stale_ttl=WEB_SEARCH_CACHE_STALE_TTL,
+            max_entries=WEB_SEARCH_CACHE_MAX_ENTRIES,
+            max_bytes=WEB_SEARCH_CACHE_MAX_BYTES,
+            offline=WEB_SEARCH_OFFLINE,
+        )
+    return _search_cache
+
+
+def get_search_cache_stats() -> Dict[str, Any]:
+    """검색 결과 캐시의 hit/miss 횟수, hit rate, 저장된 항목 수/바이트를 반환."""
+    return _get_search_cache().stats()
+
+
+def get_compaction_stats() -> Dict[str, Any]:
+    """검색 결과 압축 전/후의 누적 바이트/토큰(추정)과 절감량, 마지막 호출의 절감량을 반환."""
+    return _compaction_stats.stats()
+
+
+class SearchError(Exception):
+    """검색 백엔드가 에러 응답(쿼터 초과 등)을 반환한 경우. 에러 응답은 캐시하지 않는다."""
+
+
+def _search(params: Dict[str, str]) -> Dict[str, Any]:
+    search_result = _search_client.search(params)
+    if "error" in search_result:
+        raise SearchError(search_result["error"])
+    return compact_result(search_result)
+
+
+def _cached_search(query: str, location: str, hl: str, gl: str) -> Dict[str, Any]:
+    params = {
+        "q": query,
+        "location": location,
+        "hl": hl,
+        "gl": gl,
+    }
+
+    try:
+        result = _get_search_cache().get_or_fetch(
+            {**params, "backend": getattr(_search_client, "name", type(_search_client).__name__)},
+            lambda: _search(params),
+        )
+    except SearchError as e:
+        return {"error": f"Search failed: {e}"}
+    if result is None:
+        return {"error": f"No cached search result for '{query}' (offline mode)"}
+    # 이전 형식(answer_box + 원본 organic_results)으로 캐시된 결과도 여기서 압축된다.
+    result = compact_result(result)
+    fitted = fit_to_budget(query, result, WEB_SEARCH_TOKEN_BUDGET, WEB_SEARCH_SNIPPET_CHARS)
+    _compaction_stats.record(query, result, fitted)
+    return fitted
+
 
 @tool
 def google_search(
@@ -24,21 +161,72 @@ def google_search(
         gl (str): 국가 설정 (기본값: "kr").
     Returns:
         dict: 검색 결과.
+            - answer: 구글의 답변 박스 내용 (있는 경우).
+            - organic_results: 관련도 순 검색 결과(title, link, snippet, date). 토큰 예산에 맞춰 잘린다.
     """
-    params = {
-        "q": query,
-        "location": location,
-        "hl": hl,
-        "gl": gl,
-        "engine": "google_light",
-        "google_domain": "google.com",
-        "api_key": SERPAPI_API_KEY,
-    }
+    return _cached_search(query, location, hl, gl)
+
+
+def _merge_results(queries: List[str], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    쿼리별 결과를 하나로 합친다. organic_results는 각 쿼리의 1위, 2위, ... 순으로 번갈아 담아
+    모든 쿼리의 상위 결과가 앞쪽에 오게 하고, 같은 link는 한 번만 담으면서 해당하는 쿼리를 모두 기록한다.
+    """
+    answers = []
+    errors = []
+    for query, result in zip(queries, results):
+        if "error" in result:
+            errors.append({"query": query, "error": result["error"]})
+        if "answer" in result:
+            answers.append({"query": query, "answer": result["answer"]})
 
-    search_result = GoogleSearch(params).get_dict()
-    result = {}
-    if "answer_box" in search_result:
-        result["answer_box"] = search_result["answer_box"]
-    if "organic_results" in search_result:
-        result["organic_results"] = search_result["organic_results"]
+    merged: Dict[str, Dict[str, Any]] = {}
+    ranked = [result.get("organic_results", []) for result in results]
+    for rank in range(max((len(items) for items in ranked), default=0)):
+        for query, items in zip(queries, ranked):
+            if rank >= len(items):
+                continue
+            item = items[rank]
+            key = item.get("link") or item.get("title")
+            if key in merged:
+                merged[key]["queries"].append(query)
+            else:
+                merged[key] = {**item, "queries": [query]}
+
+    result: Dict[str, Any] = {"organic_results": list(merged.values())}
+    if answers:
+        result["answers"] = answers
+    if errors:
+        result["errors"] = errors
     return result
+
+
+@tool
+def google_search_batch(
+    queries: List[str],
+    location="South Korea",
+    hl="ko",
+    gl="kr",
+) -> dict:
+    """
+    여러 쿼리로 구글 검색을 동시에 수행하고, 결과를 하나로 합쳐 반환.
+    비교 질문처럼 여러 정보가 필요할 때 한 번의 호출로 모두 검색할 수 있다.
+    각 쿼리의 결과는 google_search와 같은 토큰 예산으로 잘린 뒤 합쳐진다.
+
+    Args:
+        queries (list[str]): 검색 쿼리 목록. 중복된 쿼리는 한 번만 검색한다.
+        location (str): 검색 위치 (기본값: "South Korea").
+        hl (str): 언어 설정 (기본값: "ko").
+        gl (str): 국가 설정 (기본값: "kr").
+    Returns:
+        dict: 합쳐진 검색 결과.
+            - organic_results: link 기준으로 중복을 제거한 결과. 각 결과의 queries는 그 결과가 나온 쿼리 목록.
+            - answers: 쿼리별 답변 박스 내용 (있는 경우).
+            - errors: 실패한 쿼리와 에러 메시지 (있는 경우).
+    """
+    queries = list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+    if not queries:
+        return {"error": "queries must contain at least one non-empty query"}
+    with ThreadPoolExecutor(max_workers=min(WEB_SEARCH_MAX_WORKERS, len(queries))) as executor:
+        results = list(executor.map(lambda query: _cached_search(query, location, hl, gl), queries))
+    return _merge_results(queries, results)